@@ -1,5 +1,7 @@
 import pygame
 from Entities.entities import Entity
+from Entities.rules import DINO_STATS
+from Entities.sprites import load_sprite
 
 class Dinosaur(Entity):
     def __init__(self, x, y, player, dino_type):
@@ -8,39 +10,21 @@ class Dinosaur(Entity):
         self.has_moved = False
         self.immobilized_turns = 0  # Tours d'immobilisation restants
         self.setup_stats()
-        self.load_image()
     
     def setup_stats(self):
         """Configure les statistiques selon le type de dinosaure"""
-        if self.dino_type == 1:
-            # Petit et rapide
-            self.max_health = 60
-            self.attack_power = 30  # Augmenté pour plus d'équilibre
-            self.movement_range = 3
-        elif self.dino_type == 2:
-            # Moyen
-            self.max_health = 80
-            self.attack_power = 45  # Attaque proportionnelle au prix
-            self.movement_range = 2
-        else:  # dino_type == 3
-            # Gros et lent mais fort
-            self.max_health = 120
-            self.attack_power = 60  # Plus fort car plus cher
-            self.movement_range = 1
+        # Type 1 : petit et rapide, type 2 : moyen, type 3 : gros et lent mais fort
+        self.max_health, self.attack_power, self.movement_range = DINO_STATS[self.dino_type]
         
         self.health = self.max_health
     
     def load_image(self):
         """Charge l'image du dinosaure"""
-        try:
-            color = "Blue" if self.player == 1 else "Red"
-            filename = f"assets/images/Dinos/Dino{self.dino_type}_{color}.png"
-            self.image = pygame.image.load(filename)
-        except:
-            size = 40 + (self.dino_type - 1) * 10
-            self.image = pygame.Surface((size, size))
-            color = (0, 0, 255) if self.player == 1 else (255, 0, 0)
-            self.image.fill(color)
+        color = "Blue" if self.player == 1 else "Red"
+        size = 40 + (self.dino_type - 1) * 10
+        return load_sprite(f"assets/images/Dinos/Dino{self.dino_type}_{color}.png",
+                           fallback_size=(size, size),
+                           fallback_color=(0, 0, 255) if self.player == 1 else (255, 0, 0))
     
     def take_damage(self, damage):
         """Le dinosaure prend des dégâts"""
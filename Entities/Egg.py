@@ -1,51 +1,34 @@
 import pygame
 from Entities.entities import Entity
+from Entities.rules import EGG_MAX_HEALTH
+from Entities.sprites import load_sprite
 
 class Egg(Entity):
     def __init__(self, x, y, player):
         super().__init__(x, y, player)
-        self.max_health = 100
+        self.max_health = EGG_MAX_HEALTH
         self.health = self.max_health
-        self.load_image()
     
     def load_image(self):
-        """Charge l'image de l'œuf selon le joueur - utilise les œufs de base"""
-        try:
-            # Utiliser les œufs de base pour les œufs principaux
-            if self.player == 1:
-                filename = "assets/images/Eggs/base_water_egg.png"  # Bleu = eau
-            else:
-                filename = "assets/images/Eggs/base_fire_egg.png"   # Rouge = feu
-            
-            self.image = pygame.image.load(filename)
-            self.image = pygame.transform.scale(self.image, (60, 75))  # Plus gros pour les œufs principaux
-        except:
-            # Image de secours
-            self.image = pygame.Surface((60, 75))
-            color = (100, 150, 255) if self.player == 1 else (255, 100, 100)
-            self.image.fill(color)
+        """Charge l'image de l'œuf selon le joueur - utilise les œufs de base (cassés si mort)"""
+        if self.health == 0:
+            return self.load_dead_image()
+        # Bleu = eau, rouge = feu ; plus gros pour les œufs principaux
+        element = "water" if self.player == 1 else "fire"
+        return load_sprite(f"assets/images/Eggs/base_{element}_egg.png", (60, 75),
+                           fallback_color=(100, 150, 255) if self.player == 1 else (255, 100, 100))
     
     def take_damage(self, damage):
         """L'œuf prend des dégâts"""
         self.health = max(0, self.health - damage)
         if self.health == 0:
-            self.load_dead_image()
+            self.image = None  # L'image cassée sera chargée au prochain affichage
     
     def load_dead_image(self):
         """Charge l'image de l'œuf mort - utilise les œufs de base cassés"""
-        try:
-            # Utiliser les œufs de base cassés
-            if self.player == 1:
-                filename = "assets/images/Eggs/base_broken_water_egg.png"  # Bleu = eau cassée
-            else:
-                filename = "assets/images/Eggs/base_broken_fire_egg.png"   # Rouge = feu cassé
-            
-            self.image = pygame.image.load(filename)
-            self.image = pygame.transform.scale(self.image, (60, 75))
-        except:
-            # Image de secours
-            self.image = pygame.Surface((60, 75))
-            self.image.fill((100, 100, 100))
+        element = "water" if self.player == 1 else "fire"
+        return load_sprite(f"assets/images/Eggs/base_broken_{element}_egg.png", (60, 75),
+                           fallback_color=(100, 100, 100))
     
     def draw(self, screen, cell_width, cell_height, board_offset_x=0, board_offset_y=0):
         """Dessine l'œuf avec sa barre de vie pixel art (supporte offsets de plateau)"""
@@ -65,15 +48,13 @@ class Egg(Entity):
         health_ratio = self.health / self.max_health
         health_percentage = int(health_ratio * 10) * 10  # Arrondir à la dizaine
         
-        try:
-            # Charger l'image de barre de vie correspondante
-            health_bar_image = pygame.image.load(f"assets/images/LifeBars/{health_percentage}%.png")
-            
-            # Très grande taille pour les œufs
-            bar_width = 150
-            bar_height = 35
-            health_bar_image = pygame.transform.scale(health_bar_image, (bar_width, bar_height))
-            
+        # Image de barre de vie correspondante, très grande taille pour les œufs
+        bar_width = 150
+        bar_height = 35
+        health_bar_image = load_sprite(f"assets/images/LifeBars/{health_percentage}%.png",
+                                       (bar_width, bar_height), fallback_color=None)
+        
+        if health_bar_image is not None:
             # Position selon le joueur - décalé de 65px depuis la position d'origine
             if self.player == 1:  # Bleu - à gauche
                 bar_x = self.x * cell_width - bar_width - 15 + board_offset_x - 65
@@ -96,7 +77,7 @@ class Egg(Entity):
             screen.blit(shadow, shadow_rect)
             screen.blit(hp_text, text_rect)
             
-        except Exception as e:
+        else:
             # Fallback vers l'ancienne méthode si les images ne sont pas trouvées
             bar_width = cell_width - 10
             bar_height = 8
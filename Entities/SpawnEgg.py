@@ -1,6 +1,8 @@
 import pygame
 import math
 from Entities.entities import Entity
+from Entities.rules import SPAWN_EGG_TURNS, SPAWN_EGG_HEALTH
+from Entities.sprites import load_sprite
 
 class SpawnEgg(Entity):
     def __init__(self, x, y, player, dino_type):
@@ -8,8 +10,7 @@ class SpawnEgg(Entity):
         self.dino_type = dino_type
         # Turn-based spawn: nombre de tours requis selon le type
         # Mapping choisi proportionnellement aux anciennes durées (20s->2 tours, 40s->4, 80s->8)
-        spawn_turns_map = {1: 2, 2: 4, 3: 8}
-        self.spawn_turns_required = spawn_turns_map.get(self.dino_type, 2)
+        self.spawn_turns_required = SPAWN_EGG_TURNS.get(self.dino_type, 2)
         self.spawn_turns_elapsed = 0
         self.spawn_progress = 0.0  # Pour affichage (ratio)
         self.is_spawning = True  # L'œuf est en cours d'éclosion (attente en tours)
@@ -17,24 +18,14 @@ class SpawnEgg(Entity):
         self.hatch_animation_time = 0.0  # Temps d'animation en secondes
         
         # Points de vie = moitié de la vie du dinosaure correspondant
-        health_map = {1: 30, 2: 40, 3: 60}  # Moitié de 60, 80, 120
-        self.max_health = health_map.get(self.dino_type, 30)
+        self.max_health = SPAWN_EGG_HEALTH.get(self.dino_type, 30)
         self.health = self.max_health
-        
-        self.load_image()
     
     def load_image(self):
         """Charge l'image de l'œuf selon le joueur - utilise les petits œufs pour le spawn"""
-        try:
-            color = "blue" if self.player == 1 else "red"
-            filename = f"assets/images/Eggs/{color}_egg.png"
-            self.image = pygame.image.load(filename)
-            self.image = pygame.transform.scale(self.image, (40, 50))
-        except:
-            # Image de secours
-            self.image = pygame.Surface((40, 50))
-            color = (100, 150, 255) if self.player == 1 else (255, 100, 100)
-            self.image.fill(color)
+        color = "blue" if self.player == 1 else "red"
+        return load_sprite(f"assets/images/Eggs/{color}_egg.png", (40, 50),
+                           fallback_color=(100, 150, 255) if self.player == 1 else (255, 100, 100))
     
     def update_spawn(self, delta_time):
         """Met à jour l'animation de spawn"""
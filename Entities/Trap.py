@@ -1,5 +1,6 @@
 import pygame
 from Entities.entities import Entity
+from Entities.sprites import load_sprite
 
 class Trap(Entity):
     def __init__(self, x, y, player):
@@ -7,16 +8,12 @@ class Trap(Entity):
         self.activated = False  # Pour savoir si le piège a déjà été activé
         self.cell_width = None
         self.cell_height = None
-        self.load_image()
+        self.scaled_image = None
     
     def load_image(self):
         """Charge l'image du piège - sera redimensionnée lors du dessin"""
-        try:
-            self.base_image = pygame.image.load("assets/images/Traps/trap.png")
-        except:
-            # Image de secours
-            self.base_image = pygame.Surface((60, 60))
-            self.base_image.fill((139, 69, 19))  # Marron
+        return load_sprite("assets/images/Traps/trap.png", fallback_size=(60, 60),
+                           fallback_color=(139, 69, 19))  # Marron
     
     def draw(self, screen, cell_width, cell_height, current_player, board_offset_x=0, board_offset_y=0):
         """Dessine le piège seulement pour le joueur qui l'a placé (supporte offsets)"""
@@ -26,9 +23,9 @@ class Trap(Entity):
             if self.cell_width != cell_width or self.cell_height != cell_height:
                 self.cell_width = cell_width
                 self.cell_height = cell_height
-                self.image = pygame.transform.scale(self.base_image, (cell_width, cell_height))
+                self.scaled_image = pygame.transform.scale(self.image, (cell_width, cell_height))
             
             # Dessiner le piège en tenant compte des offsets
             x_pos = self.x * cell_width + board_offset_x
             y_pos = self.y * cell_height + board_offset_y
-            screen.blit(self.image, (x_pos, y_pos))
\ No newline at end of file
+            screen.blit(self.scaled_image, (x_pos, y_pos))
\ No newline at end of file
@@ -6,8 +6,23 @@ class Entity:
         self.x = x
         self.y = y
         self.player = player  # 1 pour bleu, 2 pour rouge
-        self.image = None
+        self._image = None
+    
+    @property
+    def image(self):
+        """Image de l'entité, chargée au premier affichage seulement"""
+        if self._image is None:
+            self._image = self.load_image()
+        return self._image
+    
+    @image.setter
+    def image(self, value):
+        self._image = value
+    
+    def load_image(self):
+        """Retourne l'image de l'entité (None = rien à dessiner)"""
+        return None
     
     def draw(self, screen, cell_width, cell_height):
         if self.image:
-            screen.blit(self.image, (self.x * cell_width, self.y * cell_height))
\ No newline at end of file
+            screen.blit(self.image, (self.x * cell_width, self.y * cell_height))
@@ -0,0 +1,91 @@
+"""
+Index spatial des entités du plateau
+Associe chaque case occupée à son entité pour des recherches en temps constant
+"""
+
+
+class OccupancyIndex:
+    """
+    Index case -> entité, une table par couche
+
+    Le jeu garde ses listes d'entités (ordre de dessin, sérialisation...) ;
+    l'index doit être tenu à jour à chaque ajout, retrait ou déplacement
+    (voir place(), remove() et move()). Une case ne contient qu'une entité
+    par couche : les règles ne permettent pas d'en empiler deux.
+    """
+
+    LAYERS = ('dinosaurs', 'eggs', 'traps', 'spawn_eggs')
+
+    def __init__(self):
+        self.dinosaurs = {}
+        self.eggs = {}
+        self.traps = {}
+        self.spawn_eggs = {}
+
+    @classmethod
+    def from_game(cls, game):
+        """Construit l'index à partir des listes d'entités d'une partie"""
+        index = cls()
+        for egg in game.eggs.values():
+            index.place('eggs', egg)
+        for dino in game.dinosaurs:
+            index.place('dinosaurs', dino)
+        for trap in game.traps:
+            index.place('traps', trap)
+        for spawn_egg in game.spawn_eggs:
+            index.place('spawn_eggs', spawn_egg)
+        return index
+
+    def place(self, layer, entity):
+        """Ajoute une entité à sa case"""
+        getattr(self, layer)[(entity.x, entity.y)] = entity
+
+    def remove(self, layer, entity):
+        """Retire une entité de sa case (sans effet si elle n'y est pas indexée)"""
+        cells = getattr(self, layer)
+        key = (entity.x, entity.y)
+        if cells.get(key) is entity:
+            del cells[key]
+
+    def move(self, layer, entity, x, y):
+        """Déplace une entité (met à jour ses coordonnées et l'index)"""
+        self.remove(layer, entity)
+        entity.x = x
+        entity.y = y
+        self.place(layer, entity)
+
+    def dinosaur_at(self, x, y):
+        return self.dinosaurs.get((x, y))
+
+    def egg_at(self, x, y):
+        return self.eggs.get((x, y))
+
+    def trap_at(self, x, y):
+        return self.traps.get((x, y))
+
+    def spawn_egg_at(self, x, y):
+        return self.spawn_eggs.get((x, y))
+
+    def in_rect(self, layer, x0, y0, x1, y1):
+        """
+        Entités d'une couche dans le rectangle x0 <= x < x1, y0 <= y < y1
+
+        Parcourt les cases du rectangle, ou la table si elle a moins d'entrées
+        que le rectangle n'a de cases : le coût ne dépend jamais de la taille
+        du plateau.
+
+        Returns:
+            list: Entités, ligne par ligne (y puis x)
+        """
+        cells = getattr(self, layer)
+        if (x1 - x0) * (y1 - y0) <= len(cells):
+            return [cells[(x, y)] for y in range(y0, y1) for x in range(x0, x1) if (x, y) in cells]
+        found = [(y, x) for x, y in cells if x0 <= x < x1 and y0 <= y < y1]
+        found.sort()
+        return [cells[(x, y)] for y, x in found]
+
+    def is_occupied(self, x, y):
+        """True si une entité, quelle qu'elle soit, occupe la case"""
+        key = (x, y)
+        return (key in self.dinosaurs or key in self.eggs
+                or key in self.traps or key in self.spawn_eggs)
@@ -0,0 +1,37 @@
+"""
+Règles du jeu partagées par le moteur et la simulation de l'IA
+Constantes pures, sans pygame : importables depuis n'importe quel thread ou processus
+"""
+
+# Statistiques des dinosaures : type -> (vie max, attaque, portée de déplacement)
+DINO_STATS = {
+    1: (60, 30, 3),    # Petit et rapide
+    2: (80, 45, 2),    # Moyen
+    3: (120, 60, 1),   # Gros et lent mais fort
+}
+
+# Spawn : coût en steaks et cooldown des boutons (en secondes)
+SPAWN_COSTS = {1: 40, 2: 80, 3: 100}
+SPAWN_COOLDOWNS = {1: 5, 2: 8, 3: 12}
+SPAWN_MAX_DISTANCE = 3  # Distance max (Manhattan) à son œuf pour spawner
+
+# Œufs de spawn : tours avant éclosion et vie (moitié de celle du dinosaure)
+SPAWN_EGG_TURNS = {1: 2, 2: 4, 3: 8}
+SPAWN_EGG_HEALTH = {1: 30, 2: 40, 3: 60}
+
+# Œuf principal
+EGG_MAX_HEALTH = 100
+
+# Pièges
+TRAP_COST = 30
+TRAP_DAMAGE = 50
+TRAP_IMMOBILIZED_TURNS = 2
+
+# Steaks de départ de chaque joueur
+STARTING_STEAKS = 100
+
+# Steaks gagnés
+TURN_INCOME = 20          # À chaque fin de tour
+KILL_REWARD = 20          # Dinosaure tué en combat
+TRAP_KILL_REWARD = 15     # Dinosaure tué par un piège
+SPAWN_EGG_KILL_REWARD = 15  # Œuf de spawn détruit
@@ -0,0 +1,44 @@
+"""
+Chargement des images des entités
+Chaque fichier n'est lu qu'une fois ; les entités partagent les surfaces chargées
+"""
+
+import pygame
+
+_cache = {}
+
+
+def load_sprite(filename, size=None, fallback_size=(40, 40), fallback_color=(128, 128, 128)):
+    """
+    Charge une image (redimensionnée si demandé) en passant par le cache
+
+    Args:
+        filename (str): Chemin de l'image
+        size (tuple): Taille finale (largeur, hauteur), ou None pour la taille d'origine
+        fallback_size (tuple): Taille de l'image de secours si size est None
+        fallback_color (tuple): Couleur de l'image de secours, ou None pour retourner None
+
+    Returns:
+        pygame.Surface: Surface partagée, à ne pas modifier en place
+    """
+    key = (filename, size)
+    if key in _cache:
+        return _cache[key]
+    try:
+        surface = pygame.image.load(filename)
+        if size is not None:
+            surface = pygame.transform.scale(surface, size)
+    except Exception:
+        if fallback_color is None:
+            surface = None
+        else:
+            # Image de secours
+            surface = pygame.Surface(size or fallback_size)
+            surface.fill(fallback_color)
+    _cache[key] = surface
+    return surface
+
+
+def clear_cache():
+    """Oublie les images chargées (changement de thème, tests...)"""
+    _cache.clear()
@@ -0,0 +1,77 @@
+"""
+Terrain compilé d'une carte
+Tables plates des cases bloquées (arbres) et boueuses, calculées une fois par
+carte et partagées par le moteur et la simulation de l'IA (sans pygame)
+"""
+
+
+class TerrainMap:
+    """
+    Terrain logique d'une carte, immuable pendant une partie
+
+    blocked et mud sont des bytearray de logic_width * logic_height cases,
+    rangées ligne par ligne (indice y * logic_width + x).
+    """
+
+    def __init__(self, logic_width, logic_height, blocked, mud):
+        self.logic_width = logic_width
+        self.logic_height = logic_height
+        self.blocked = blocked
+        self.mud = mud
+
+    @classmethod
+    def compile(cls, visual_base, visual_elements, logic_width, logic_height,
+                visual_width=None, visual_height=None):
+        """
+        Compile les couches visuelles d'une carte en tables logiques
+
+        Une case logique est bloquée si l'une des cases visuelles qu'elle
+        recouvre contient un arbre, et boueuse si sa case visuelle de base est
+        de la terre (mêmes règles que Game.has_tree_at / is_on_mud).
+
+        Args:
+            visual_base (list): Couche de base ('grass' / 'dirt')
+            visual_elements (list): Couche des éléments ('tree', 'bush'... ou None)
+            logic_width, logic_height (int): Taille du plateau
+            visual_width, visual_height (int): Taille visuelle correspondante
+                (par défaut la taille logique : une case visuelle par case)
+
+        Returns:
+            TerrainMap: Terrain compilé
+        """
+        visual_width = visual_width or logic_width
+        visual_height = visual_height or logic_height
+        visual_per_logic_x = visual_width / logic_width
+        visual_per_logic_y = visual_height / logic_height
+
+        blocked = bytearray(logic_width * logic_height)
+        mud = bytearray(logic_width * logic_height)
+        for y in range(logic_height):
+            for x in range(logic_width):
+                index = y * logic_width + x
+                for vy in range(int(y * visual_per_logic_y), int((y + 1) * visual_per_logic_y)):
+                    row = visual_elements[vy] if vy < len(visual_elements) else ()
+                    for vx in range(int(x * visual_per_logic_x), int((x + 1) * visual_per_logic_x)):
+                        if vx < len(row) and row[vx] == 'tree':
+                            blocked[index] = 1
+                if y < len(visual_base) and x < len(visual_base[0]) and visual_base[y][x] == 'dirt':
+                    mud[index] = 1
+        return cls(logic_width, logic_height, blocked, mud)
+
+    @classmethod
+    def empty(cls, logic_width, logic_height):
+        """Terrain sans obstacle ni boue"""
+        return cls(logic_width, logic_height, bytearray(logic_width * logic_height),
+                   bytearray(logic_width * logic_height))
+
+    def is_blocked(self, x, y):
+        """True si la case contient un arbre (ou est hors du plateau)"""
+        if 0 <= x < self.logic_width and 0 <= y < self.logic_height:
+            return self.blocked[y * self.logic_width + x] == 1
+        return True
+
+    def is_mud(self, x, y):
+        """True si la case est de la boue"""
+        if 0 <= x < self.logic_width and 0 <= y < self.logic_height:
+            return self.mud[y * self.logic_width + x] == 1
+        return False
@@ -0,0 +1,277 @@
+"""
+Journal des actions d'une partie et rejeu déterministe
+Chaque action qui modifie l'état est enregistrée sous forme compacte ; le rejeu
+reconstruit la partie à l'identique, sans affichage, à plusieurs milliers
+d'actions par seconde (reproduction hors ligne des lenteurs de l'IA...)
+
+Utilisation :
+    python action_log.py logs/replays/partie.json
+    python action_log.py logs/replays/partie.json --until 120 --think
+"""
+
+import argparse
+import base64
+import json
+import os
+import time
+from datetime import datetime
+
+from snapshot import Snapshot
+
+LOG_VERSION = 1
+
+# Dossier des journaux enregistrés automatiquement en fin de partie
+REPLAY_DIR = os.path.join("logs", "replays")
+
+
+class ReplayError(Exception):
+    """Levée quand une action du journal ne peut pas être rejouée (divergence)"""
+    pass
+
+
+class ActionLog:
+    """
+    Journal des actions d'une partie
+
+    Chaque entrée est (action, cooldowns) : action est un tuple compact, par
+    exemple ('spawn', x, y, type) ou ('move', x, y, x_cible, y_cible), et
+    cooldowns les cooldowns de spawn non nuls au moment de l'action
+    ([[joueur, type, secondes], ...]). Les cooldowns s'écoulent en temps réel
+    (Game.update) : c'est la seule donnée de l'état qui ne se déduit pas des
+    actions. Les règles n'utilisent pas de hasard ; la graine de la partie
+    (Game.rng : animations, sons d'ambiance) est tout de même conservée. Les
+    départages de l'IA n'en dépendent pas : ils varient d'une partie à
+    l'autre, mais ses décisions sont dans le journal comme les autres actions.
+
+    Une partie reprise d'un instantané (snapshot.py) embarque celui-ci dans
+    start : le rejeu part de cette position au lieu du début de partie.
+    """
+
+    def __init__(self, map_name, game_mode, seed, start=None):
+        self.map_name = map_name
+        self.game_mode = game_mode
+        self.seed = seed
+        self.start = start
+        self.entries = []
+
+    def record(self, action, spawn_cooldowns):
+        """Ajoute une action (tuple) avec les cooldowns en vigueur juste avant"""
+        cooldowns = [[player, dino_type, value]
+                     for player, per_type in spawn_cooldowns.items()
+                     for dino_type, value in per_type.items() if value > 0]
+        self.entries.append((action, cooldowns))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def to_dict(self):
+        data = {
+            'version': LOG_VERSION,
+            'map': self.map_name,
+            'mode': self.game_mode,
+            'seed': self.seed,
+            'entries': [[list(action), cooldowns] for action, cooldowns in self.entries],
+        }
+        if self.start is not None:
+            data['start'] = base64.b64encode(self.start).decode('ascii')
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('version') != LOG_VERSION:
+            raise ValueError(f"Version de journal non supportée: {data.get('version')}")
+        start = data.get('start')
+        log = cls(data['map'], data['mode'], data['seed'],
+                  base64.b64decode(start) if start is not None else None)
+        log.entries = [(tuple(action), cooldowns) for action, cooldowns in data['entries']]
+        return log
+
+    def save(self, path=None):
+        """
+        Écrit le journal en JSON
+
+        Args:
+            path (str): Fichier de sortie (par défaut un nouveau fichier daté dans REPLAY_DIR)
+
+        Returns:
+            str: Chemin du fichier écrit
+        """
+        if path is None:
+            os.makedirs(REPLAY_DIR, exist_ok=True)
+            path = os.path.join(REPLAY_DIR, f"partie_{datetime.now():%Y%m%d_%H%M%S}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+class Replayer:
+    """
+    Rejoue un journal sur une partie neuve de la même carte
+
+    Les actions passent par les mêmes méthodes de Game que pendant la partie
+    (spawn_dinosaur, move_dinosaur, attack...), sans animation, son ni dessin.
+    """
+
+    def __init__(self, log, game):
+        """
+        Args:
+            log (ActionLog): Journal à rejouer
+            game (Game): Partie neuve, créée sur log.map_name
+        """
+        self.log = log
+        self.game = game
+        self.position = 0
+
+        # Rejeu silencieux, sans réenregistrer de journal ni de sauvegarde
+        game.sounds = {}
+        game.autosave_replay = False
+        game.autosave_snapshot = False
+        if log.start is not None:
+            game.restore_snapshot(Snapshot.from_bytes(log.start))
+
+    def step(self):
+        """Rejoue l'action suivante ; retourne False à la fin du journal"""
+        if self.position >= len(self.log.entries):
+            return False
+        action, cooldowns = self.log.entries[self.position]
+        game = self.game
+
+        # Cooldowns tels qu'ils étaient au moment de l'action
+        for per_type in game.spawn_cooldowns.values():
+            for dino_type in per_type:
+                per_type[dino_type] = 0
+        for player, dino_type, value in cooldowns:
+            game.spawn_cooldowns[player][dino_type] = value
+
+        if not self._apply(action):
+            raise ReplayError(f"Action {self.position} impossible à rejouer: {action}")
+        self.position += 1
+        return True
+
+    def run(self, until=None):
+        """
+        Rejoue jusqu'à l'action until (exclue) ou jusqu'à la fin
+
+        Returns:
+            int: Nombre d'actions rejouées
+        """
+        count = 0
+        end = len(self.log.entries) if until is None else min(until, len(self.log.entries))
+        while self.position < end:
+            self.step()
+            count += 1
+        return count
+
+    def _apply(self, action):
+        game = self.game
+        kind = action[0]
+        if kind == 'spawn':
+            return game.spawn_dinosaur(action[1], action[2], action[3])
+        if kind == 'trap':
+            return game.place_trap(action[1], action[2])
+        if kind == 'end_turn':
+            game.end_turn()
+            return True
+
+        dino = game.get_dinosaur_at(action[1], action[2])
+        if kind == 'hatch':
+            spawn_egg = game.occupancy.spawn_egg_at(action[1], action[2])
+            return spawn_egg is not None and game.hatch_spawn_egg(spawn_egg) is not None
+        if dino is None:
+            return False
+        if kind == 'move':
+            return game.move_dinosaur(dino, action[3], action[4])
+        if kind == 'walk':
+            if not game.start_move_animation(dino, action[3], action[4]):
+                return False
+            game.finish_move_animation()
+            return True
+        if kind == 'attack':
+            defender = game.get_dinosaur_at(action[3], action[4])
+            if defender is None:
+                return False
+            game.attack(dino, defender)
+            return True
+        if kind == 'attack_egg':
+            game.attack_egg(dino, game.eggs[action[3]])
+            return True
+        if kind == 'attack_spawn_egg':
+            spawn_egg = game.occupancy.spawn_egg_at(action[3], action[4])
+            if spawn_egg is None:
+                return False
+            game.attack_spawn_egg(dino, spawn_egg)
+            return True
+        return False
+
+
+def game_fingerprint(game):
+    """
+    Résumé complet de l'état de règles d'une partie (pour comparer partie et rejeu)
+
+    Le rejeu ne restaure les cooldowns de spawn qu'au moment de chaque action :
+    le temps écoulé après la dernière action du journal (Game.update) n'est pas
+    rejoué. Pour comparer, prendre l'empreinte de la partie juste après une
+    action, avant Game.update (voir tests/test_replay.py).
+
+    Returns:
+        tuple: Valeur comparable, indépendante des animations et de l'affichage
+    """
+    return (
+        game.current_player, game.turn_number, game.player1_steaks, game.player2_steaks,
+        game.spawn_action_done, game.game_over, game.winner,
+        tuple(sorted((p, t, c) for p, per in game.spawn_cooldowns.items() for t, c in per.items())),
+        tuple(sorted((e.player, e.x, e.y, e.health) for e in game.eggs.values())),
+        tuple((d.player, d.dino_type, d.x, d.y, d.health, d.has_moved, d.immobilized_turns)
+              for d in game.dinosaurs),
+        tuple((t.player, t.x, t.y, t.activated) for t in game.traps),
+        tuple((s.player, s.dino_type, s.x, s.y, s.health, s.spawn_turns_elapsed, s.is_hatching)
+              for s in game.spawn_eggs),
+    )
+
+
+def new_replay_game(log):
+    """Crée une partie neuve sans affichage (mode deux joueurs, sans IA) pour rejouer un journal"""
+    from game import Game
+
+    return Game(None, map_name=log.map_name, game_mode="2players", seed=log.seed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rejoue un journal de partie")
+    parser.add_argument('log', help="Journal JSON (voir logs/replays/)")
+    parser.add_argument('--until', type=int, help="Nombre d'actions à rejouer (défaut: toutes)")
+    parser.add_argument('--think', action='store_true',
+                        help="Mesurer la décision de l'IA sur la position atteinte")
+    parser.add_argument('--time-budget-ms', type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    log = ActionLog.load(args.log)
+    game = new_replay_game(log)
+    replayer = Replayer(log, game)
+
+    start = time.perf_counter()
+    count = replayer.run(args.until)
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed > 0 else float('inf')
+    print(f"{count} actions rejouées en {elapsed * 1000:.1f} ms ({rate:.0f} actions/s)")
+    print(f"Tour {game.turn_number}, joueur {game.current_player} au trait"
+          + (f", victoire du joueur {game.winner}" if game.game_over else ""))
+
+    if args.think:
+        from ai.search_ai import SearchAI
+
+        ai = SearchAI(player=game.current_player, time_budget_ms=args.time_budget_ms, verbose=False)
+        start = time.perf_counter()
+        action = ai.choose_action(game)
+        print(f"Décision IA en {(time.perf_counter() - start) * 1000:.1f} ms: "
+              f"{action['type'] if action else 'fin du tour'} {ai.stats}")
+        ai.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -3,5 +3,6 @@ Module d'intelligence artificielle pour Egg Fortress
 """
 
 from .search_ai import SearchAI
+from .mcts_ai import MCTSAI
 
-__all__ = ['SearchAI']
+__all__ = ['SearchAI', 'MCTSAI']
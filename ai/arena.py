@@ -0,0 +1,374 @@
+"""
+Arène IA contre IA sans affichage
+Joue des tournois en parallèle (un processus par partie) et calcule l'Elo
+
+Utilisation :
+    python -m ai.arena --engine-a search:time_budget_ms=200 --engine-b mcts --games 40
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ai.game_simulator import GameSimulator
+from ai.heuristics import evaluate_state
+from ai.mcts_ai import MCTSAI
+from ai.search_ai import SearchAI
+from headless import new_headless_game
+from map_generator import egg_positions
+
+# Moteurs disponibles dans l'arène (nom -> classe BaseAI)
+ENGINES = {
+    'search': SearchAI,
+    'mcts': MCTSAI,
+}
+
+MAPS = ("default", "empty", "custom")
+
+# Plateau des cartes classiques (positions de référence de ai/benchmark.py) ;
+# les parties de l'arène se jouent à la taille de leur carte
+BOARD_WIDTH = 16
+BOARD_HEIGHT = 12
+EGG_POSITIONS = egg_positions(BOARD_WIDTH, BOARD_HEIGHT)
+
+
+def parse_engine(spec):
+    """
+    Découpe une description de moteur "nom:param=valeur,param=valeur"
+
+    Les valeurs sont converties en int, float ou bool si possible.
+
+    Returns:
+        tuple: (nom, dict de paramètres)
+    """
+    name, _, params = spec.partition(':')
+    if name not in ENGINES:
+        raise ValueError(f"Moteur inconnu: {name} (disponibles: {', '.join(ENGINES)})")
+    kwargs = {}
+    for item in filter(None, params.split(',')):
+        key, _, value = item.partition('=')
+        kwargs[key.strip()] = _parse_value(value.strip())
+    return name, kwargs
+
+
+def _parse_value(value):
+    if value in ('True', 'true'):
+        return True
+    if value in ('False', 'false'):
+        return False
+    if value in ('None', 'none'):
+        return None
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+
+def create_engine(spec, player):
+    """
+    Instancie un moteur pour le joueur donné
+
+    Args:
+        spec: Description "nom:param=valeur,..." ou tuple (nom, dict de paramètres)
+        player (int): Numéro du joueur (1 ou 2)
+    """
+    name, kwargs = parse_engine(spec) if isinstance(spec, str) else spec
+    return ENGINES[name](player, **kwargs)
+
+
+def new_match_game(map_name, seed):
+    """Partie sans affichage sur la carte donnée (vraies règles de Game), sans journal ni sauvegarde"""
+    game = new_headless_game(map_name, seed=seed)
+    game.autosave_replay = False
+    game.autosave_snapshot = False
+    return game
+
+
+def play_turn(game, action):
+    """
+    Joue une décision comme headless.play_game : l'action puis la fin du tour
+    (Game.execute_ai_action), puis update() fait avancer cooldowns et éclosions
+    """
+    player = game.current_player
+    game.execute_ai_action(action)
+    # Une action refusée ou passée a déjà terminé le tour
+    if game.current_player == player and not game.game_over:
+        game.end_turn()
+    game.update()
+
+
+def play_opening(game, engines, rng, plies):
+    """Joue plies actions aléatoires (hors passe) pour varier les débuts de partie"""
+    for _ in range(plies):
+        if game.game_over:
+            break
+        player = game.current_player
+        actions = [a for a in engines[player].generate_actions(game, player) if a['type'] != 'pass']
+        play_turn(game, rng.choice(actions) if actions else None)
+
+
+def play_game(task):
+    """
+    Joue une partie complète sans affichage (exécuté dans un processus de l'arène)
+
+    La partie tourne sur un Game sans affichage (headless.py) : les décisions
+    des moteurs sont appliquées par Game.execute_ai_action, avec les vraies
+    règles (pièges, œufs de spawn, cooldowns), et non par la simulation de l'IA.
+
+    Args:
+        task (dict): game, map, seed, engine_a, engine_b, a_player,
+            opening_plies, max_turns, adjudicate
+
+    Returns:
+        dict: Résultat de la partie (vainqueur 'a', 'b' ou None, nombre de
+        tours, latences de décision de chaque moteur en ms)
+    """
+    seed = task['seed']
+    random.seed(seed)  # Les moteurs tirent leurs égalités dans random
+    rng = random.Random(seed)
+
+    a_player = task['a_player']
+    engines = {a_player: create_engine(task['engine_a'], a_player),
+               3 - a_player: create_engine(task['engine_b'], 3 - a_player)}
+
+    game = new_match_game(task['map'], seed)
+    latencies = {a_player: [], 3 - a_player: []}
+
+    try:
+        play_opening(game, engines, rng, task['opening_plies'])
+        while not game.game_over and game.turn_number <= task['max_turns']:
+            player = game.current_player
+            start = time.perf_counter()
+            action = engines[player].choose_action(game)
+            latencies[player].append((time.perf_counter() - start) * 1000.0)
+            play_turn(game, action)
+    finally:
+        for engine in engines.values():
+            engine.shutdown()
+
+    winner = game.winner
+    if winner is None and task['adjudicate'] is not None:
+        # Limite de tours atteinte : départager sur l'évaluation si l'écart est net
+        score = evaluate_state(GameSimulator.copy_game_state(game), 1)
+        if score >= task['adjudicate']:
+            winner = 1
+        elif score <= -task['adjudicate']:
+            winner = 2
+
+    return {
+        'game': task['game'],
+        'map': task['map'],
+        'seed': seed,
+        'a_player': a_player,
+        'winner': None if winner is None else ('a' if winner == a_player else 'b'),
+        'adjudicated': winner is not None and not game.game_over,
+        'turns': game.turn_number,
+        'latencies_a': latencies[a_player],
+        'latencies_b': latencies[3 - a_player],
+    }
+
+
+def make_tasks(engine_a, engine_b, games, maps=MAPS, seed=0, opening_plies=4, max_turns=150,
+               adjudicate=None):
+    """
+    Prépare les parties d'un tournoi
+
+    Chaque ouverture tirée est jouée deux fois, couleurs inversées, et les
+    cartes sont parcourues à tour de rôle.
+
+    Returns:
+        list: Descriptions des parties (voir play_game)
+    """
+    tasks = []
+    for game in range(games):
+        pair = game // 2
+        tasks.append({
+            'game': game,
+            'map': maps[pair % len(maps)],
+            'seed': seed * 1_000_003 + pair,
+            'engine_a': engine_a,
+            'engine_b': engine_b,
+            'a_player': 1 if game % 2 == 0 else 2,
+            'opening_plies': opening_plies,
+            'max_turns': max_turns,
+            'adjudicate': adjudicate,
+        })
+    return tasks
+
+
+def percentile(values, pct):
+    """Percentile (interpolation linéaire) d'une liste de valeurs"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def elo_difference(score):
+    """Écart Elo correspondant à un score moyen (entre 0 et 1)"""
+    score = min(max(score, 1e-6), 1 - 1e-6)
+    return -400.0 * math.log10(1.0 / score - 1.0) + 0.0  # + 0.0 : pas de "-0"
+
+
+def summarize(results):
+    """
+    Agrège les résultats d'un tournoi du point de vue du moteur A
+
+    L'intervalle de confiance à 95 % de l'Elo vient de l'écart type du score
+    par partie (victoire 1, nulle 0.5, défaite 0).
+
+    Returns:
+        dict: Statistiques du tournoi
+    """
+    n = len(results)
+    wins = sum(1 for r in results if r['winner'] == 'a')
+    losses = sum(1 for r in results if r['winner'] == 'b')
+    draws = n - wins - losses
+    scores = [1.0 if r['winner'] == 'a' else 0.0 if r['winner'] == 'b' else 0.5 for r in results]
+    mean = sum(scores) / n if n else 0.5
+    variance = sum((s - mean) ** 2 for s in scores) / (n - 1) if n > 1 else 0.0
+    margin = 1.96 * math.sqrt(variance / n) if n else 0.0
+
+    latencies_a = [ms for r in results for ms in r['latencies_a']]
+    latencies_b = [ms for r in results for ms in r['latencies_b']]
+
+    per_map = {}
+    for r in results:
+        stats = per_map.setdefault(r['map'], {'games': 0, 'wins': 0, 'losses': 0, 'draws': 0})
+        stats['games'] += 1
+        key = {'a': 'wins', 'b': 'losses', None: 'draws'}[r['winner']]
+        stats[key] += 1
+
+    return {
+        'games': n,
+        'wins': wins,
+        'losses': losses,
+        'draws': draws,
+        'adjudicated': sum(1 for r in results if r['adjudicated']),
+        'score': mean,
+        'win_rate': wins / n if n else 0.0,
+        'elo': elo_difference(mean),
+        'elo_low': elo_difference(mean - margin),
+        'elo_high': elo_difference(mean + margin),
+        'avg_turns': sum(r['turns'] for r in results) / n if n else 0.0,
+        'latency_a_ms': {f'p{p}': percentile(latencies_a, p) for p in (50, 95, 99)},
+        'latency_b_ms': {f'p{p}': percentile(latencies_b, p) for p in (50, 95, 99)},
+        'maps': per_map,
+    }
+
+
+def run_tournament(engine_a, engine_b, games, maps=MAPS, workers=0, seed=0,
+                   opening_plies=4, max_turns=150, adjudicate=None, progress=None, executor=None):
+    """
+    Joue un tournoi en parallèle
+
+    Args:
+        engine_a: Description du moteur A (voir create_engine)
+        engine_b: Description du moteur B
+        games (int): Nombre de parties
+        maps (tuple): Cartes utilisées (voir MapGenerator)
+        workers (int): Nombre de processus (0 = un par cœur)
+        seed (int): Graine des ouvertures
+        opening_plies (int): Nombre d'actions aléatoires d'ouverture
+        max_turns (int): Limite de tours d'une partie
+        adjudicate (float): À la limite de tours, écart d'évaluation (evaluate_state)
+            qui donne la victoire ; None = partie nulle
+        progress (callable): Appelé avec chaque résultat dès qu'il arrive
+        executor (ProcessPoolExecutor): Pool à réutiliser (sinon un pool est créé
+            pour le tournoi)
+
+    Returns:
+        tuple: (résultats des parties, résumé)
+    """
+    # Vérifier les descriptions avant de lancer les processus
+    for spec in (engine_a, engine_b):
+        if isinstance(spec, str):
+            parse_engine(spec)
+
+    tasks = make_tasks(engine_a, engine_b, games, maps, seed, opening_plies, max_turns, adjudicate)
+    results = []
+    own_executor = executor is None
+    if own_executor:
+        workers = workers if workers > 0 else (os.cpu_count() or 1)
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(tasks) or 1))
+    try:
+        for result in executor.map(play_game, tasks):
+            results.append(result)
+            if progress:
+                progress(result)
+    finally:
+        if own_executor:
+            executor.shutdown()
+    results.sort(key=lambda r: r['game'])
+    return results, summarize(results)
+
+
+def format_summary(engine_a, engine_b, summary):
+    """Résumé lisible du tournoi"""
+    lines = [
+        f"{engine_a}  vs  {engine_b}",
+        f"Parties: {summary['games']}  (+{summary['wins']} ={summary['draws']} -{summary['losses']}, "
+        f"{summary['adjudicated']} départagées à l'évaluation)",
+        f"Victoires A: {summary['win_rate']:.1%}  score {summary['score']:.3f}",
+        f"Elo A - B: {summary['elo']:+.0f}  [IC 95%: {summary['elo_low']:+.0f} ; {summary['elo_high']:+.0f}]",
+        f"Durée moyenne: {summary['avg_turns']:.1f} tours",
+    ]
+    for label, key in (('A', 'latency_a_ms'), ('B', 'latency_b_ms')):
+        lat = summary[key]
+        lines.append(f"Latence {label}: p50 {lat['p50']:.0f} ms, p95 {lat['p95']:.0f} ms, "
+                     f"p99 {lat['p99']:.0f} ms")
+    for map_name, stats in summary['maps'].items():
+        lines.append(f"  {map_name}: {stats['games']} parties "
+                     f"(+{stats['wins']} ={stats['draws']} -{stats['losses']})")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tournoi IA contre IA sans affichage")
+    parser.add_argument('--engine-a', default='search:time_budget_ms=100',
+                        help="Moteur A, ex. 'search:time_budget_ms=200,max_depth=4'")
+    parser.add_argument('--engine-b', default='mcts:time_budget_ms=100',
+                        help="Moteur B (même format)")
+    parser.add_argument('--games', type=int, default=30, help="Nombre de parties")
+    parser.add_argument('--maps', default=','.join(MAPS), help="Cartes, séparées par des virgules")
+    parser.add_argument('--workers', type=int, default=0, help="Processus (0 = un par cœur)")
+    parser.add_argument('--seed', type=int, default=0, help="Graine des ouvertures")
+    parser.add_argument('--opening-plies', type=int, default=4,
+                        help="Actions aléatoires jouées avant de laisser la main aux IA")
+    parser.add_argument('--max-turns', type=int, default=150, help="Limite de tours d'une partie")
+    parser.add_argument('--adjudicate', type=float, default=None,
+                        help="À la limite de tours, écart d'évaluation donnant la victoire "
+                             "(par défaut : partie nulle)")
+    parser.add_argument('--json', help="Écrire résultats et résumé dans ce fichier JSON")
+    args = parser.parse_args(argv)
+
+    maps = tuple(m.strip() for m in args.maps.split(',') if m.strip())
+
+    def progress(result):
+        winner = {'a': 'A', 'b': 'B', None: 'nulle'}[result['winner']]
+        print(f"Partie {result['game'] + 1}/{args.games} ({result['map']}): "
+              f"{winner} en {result['turns']} tours", flush=True)
+
+    results, summary = run_tournament(args.engine_a, args.engine_b, args.games, maps,
+                                      args.workers, args.seed, args.opening_plies,
+                                      args.max_turns, args.adjudicate, progress)
+    print()
+    print(format_summary(args.engine_a, args.engine_b, summary))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'engine_a': args.engine_a, 'engine_b': args.engine_b,
+                       'summary': summary, 'games': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Réflexion de l'IA en arrière-plan
+Lance choose_action() dans un thread sur un instantané de l'état, sans bloquer le rendu
+"""
+
+import threading
+from logger import get_logger
+
+logger = get_logger("ai")
+
+
+class AIWorker:
+    """
+    Exécute la décision d'une IA dans un thread de travail
+
+    La boucle de jeu démarre la réflexion avec start(), interroge poll() à
+    chaque frame et peut l'interrompre avec cancel(). L'IA ne reçoit qu'un
+    instantané de l'état (GameState), jamais l'objet Game vivant.
+    """
+
+    def __init__(self, ai):
+        """
+        Args:
+            ai (BaseAI): IA dont on exécute la décision
+        """
+        self.ai = ai
+        self._thread = None
+        self._job = None
+
+    @property
+    def busy(self):
+        """True si une réflexion est en cours"""
+        return self._job is not None and not self._job['done']
+
+    def start(self, snapshot):
+        """
+        Démarre la réflexion sur un instantané de l'état
+
+        Args:
+            snapshot: État figé à passer à choose_action()
+        """
+        # Attendre la fin d'une réflexion annulée (elle s'arrête au prochain nœud) :
+        # deux réflexions ne doivent jamais partager l'IA en même temps
+        if self._thread is not None and self._thread.is_alive():
+            self.ai.request_stop()
+            self._thread.join()
+
+        self.ai.stop_event.clear()
+        # Chaque réflexion a son propre résultat : un thread annulé ne peut pas
+        # écraser celui de la réflexion suivante
+        self._job = {'done': False, 'action': None, 'error': None}
+        self._thread = threading.Thread(target=self._run, args=(snapshot, self._job), daemon=True)
+        self._thread.start()
+
+    def _run(self, snapshot, job):
+        try:
+            job['action'] = self.ai.choose_action(snapshot)
+        except Exception as e:
+            job['error'] = e
+            logger.error(f"Erreur IA (arrière-plan): {e}")
+        finally:
+            job['done'] = True
+
+    def poll(self):
+        """
+        Vérifie si la réflexion est terminée
+
+        Returns:
+            tuple: (terminée, action, erreur) ; action et erreur valent None tant
+            que la réflexion n'est pas terminée
+        """
+        job = self._job
+        if job is None or not job['done']:
+            return False, None, None
+        self._job = None
+        return True, job['action'], job['error']
+
+    def cancel(self):
+        """
+        Interrompt la réflexion en cours ; son résultat sera ignoré
+
+        Attend la fin du thread (il s'arrête au prochain nœud) : l'IA est
+        partagée avec le pondering, qui efface stop_event en démarrant et
+        relancerait sinon la recherche annulée en même temps que la sienne
+        """
+        if self._thread is not None:
+            if self._thread.is_alive():
+                self.ai.request_stop()
+                self._thread.join()
+                # Plus personne n'utilise l'IA : elle peut de nouveau réfléchir
+                self.ai.stop_event.clear()
+            self._thread = None
+        self._job = None
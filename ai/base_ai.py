@@ -1,8 +1,12 @@
 """
 Classe de base abstraite pour toutes les IA
+Fournit aussi la génération des actions légales, commune à tous les moteurs
 """
 
 from abc import ABC, abstractmethod
+import threading
+from Entities.rules import SPAWN_COSTS
+from ai.bitboard import Bitboards, cell_index, iter_bits
 
 class BaseAI(ABC):
     """Classe abstraite pour les agents IA"""
@@ -16,6 +20,9 @@ class BaseAI(ABC):
         """
         self.player = player
         self.enemy_player = 3 - player
+        
+        # Demande d'arrêt de la réflexion (annulation depuis un autre thread)
+        self.stop_event = threading.Event()
     
     @abstractmethod
     def choose_action(self, game):
@@ -29,3 +36,120 @@ class BaseAI(ABC):
             dict: Action à effectuer avec format {'type': ..., ...}
         """
         pass
+    
+    def request_stop(self):
+        """
+        Demande à une réflexion en cours de s'arrêter au plus vite
+        
+        Les IA qui cherchent longtemps doivent consulter self.stop_event et
+        retourner leur meilleure action connue dès qu'il est levé.
+        """
+        self.stop_event.set()
+    
+    def shutdown(self):
+        """Libère les ressources de l'IA (processus, threads...)"""
+        pass
+    
+    def generate_actions(self, game, player):
+        """
+        Génère toutes les actions légales pour un joueur
+        
+        Args:
+            game: État du jeu
+            player (int): Joueur dont on génère les actions
+            
+        Returns:
+            list: Liste d'actions possibles
+        """
+        actions = []
+        
+        # Occupation du plateau, construite une seule fois pour toutes les pièces
+        boards = Bitboards(game)
+        
+        # Ressources du joueur
+        steaks = game.player1_steaks if player == 1 else game.player2_steaks
+        
+        # 1. Actions de spawn (seulement si c'est le tour actuel du joueur)
+        if player == game.current_player and not getattr(game, 'spawn_action_done', False):
+            costs = SPAWN_COSTS
+            cooldowns = getattr(game, 'spawn_cooldowns', {}).get(player, {})
+            # Types abordables dont le cooldown est écoulé
+            dino_types = [t for t in (1, 2, 3) if steaks >= costs[t] and cooldowns.get(t, 0) <= 0]
+            
+            if dino_types:
+                for pos in self.calculate_spawn_positions(game, player, boards):
+                    for dino_type in dino_types:
+                        actions.append({
+                            'type': 'spawn',
+                            'x': pos[0],
+                            'y': pos[1],
+                            'dino_type': dino_type
+                        })
+        
+        # 2. Actions avec les dinosaures (seulement ceux qui n'ont pas bougé)
+        for dino in game.dinosaurs:
+            if dino.player == player and not dino.has_moved and dino.immobilized_turns == 0:
+                # Mouvements
+                moves = self.calculate_possible_moves(game, dino, boards)
+                for move_pos in moves:
+                    actions.append({
+                        'type': 'move',
+                        'dinosaur': dino,
+                        'target_x': move_pos[0],
+                        'target_y': move_pos[1]
+                    })
+                
+                # Attaques (toujours prioritaires si disponibles)
+                targets = self.calculate_attack_targets(game, dino, player, boards)
+                for target, target_type in targets:
+                    actions.append({
+                        'type': 'attack',
+                        'attacker': dino,
+                        'target': target,
+                        'target_type': target_type
+                    })
+        
+        # 3. Passer le tour (toujours possible)
+        actions.append({'type': 'pass'})
+        
+        return actions
+    
+    def calculate_spawn_positions(self, game, player, boards=None):
+        """Calcule les positions valides pour spawner (cases libres près de l'œuf)"""
+        boards = boards or Bitboards(game)
+        coords = boards.masks.coords
+        return [coords[cell] for cell in iter_bits(boards.spawn_cells(player))]
+    
+    def calculate_possible_moves(self, game, dinosaur, boards=None):
+        """Calcule les déplacements possibles pour un dinosaure"""
+        boards = boards or Bitboards(game)
+        coords = boards.masks.coords
+        return [coords[cell] for cell in iter_bits(boards.move_cells(dinosaur))]
+    
+    def calculate_attack_targets(self, game, dinosaur, player, boards=None):
+        """Calcule les cibles attaquables (adjacentes, orthogonales uniquement)"""
+        boards = boards or Bitboards(game)
+        masks = boards.masks
+        cell = cell_index(dinosaur.x, dinosaur.y, masks.logic_height)
+        enemy_player = 3 - player
+        
+        # Aucun ennemi adjacent : rien à parcourir
+        enemy_egg_cell = boards.egg_cells.get(enemy_player)
+        enemies = boards.dinos.get(enemy_player, 0)
+        if enemy_egg_cell is not None:
+            enemies |= 1 << enemy_egg_cell
+        if not masks.adjacent[cell] & enemies:
+            return []
+        
+        targets = []
+        for neighbor in masks.neighbors[cell]:
+            if not enemies >> neighbor & 1:
+                continue
+            if neighbor == enemy_egg_cell:
+                targets.append((game.eggs[enemy_player], 'egg'))
+            # Ignorer les dinosaures déjà morts
+            for dino in boards.dino_at.get(neighbor, ()):
+                if dino.player != player and dino.health > 0:
+                    targets.append((dino, 'dinosaur'))
+        
+        return targets
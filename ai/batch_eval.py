@@ -0,0 +1,163 @@
+"""
+Évaluation par lots des états de jeu avec NumPy
+Calcule les termes de evaluate_state() pour N états en une seule passe vectorisée
+
+API autonome : ni SearchAI ni MCTSAI ne l'appellent. Mesuré sur un nœud de
+profondeur 1 (8 enfants, 25 dinosaures), regrouper les feuilles coûte
+~43 µs par feuille contre ~15 µs avec IncrementalEvaluator (dont ~0.9 µs
+de score) : photographier l'état coûte plus que l'évaluer en O(1). Le lot
+sert quand les mêmes états empaquetés sont évalués plusieurs fois (poids,
+corpus de positions).
+"""
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from ai.heuristics import DEFAULT_WEIGHTS, distance_scale
+
+
+def _require_numpy():
+    """Lève une ImportError explicite si NumPy n'est pas installé"""
+    if not NUMPY_AVAILABLE:
+        raise ImportError("L'évaluation par lots nécessite NumPy (pip install numpy), "
+                          "voir requirements.txt")
+
+if NUMPY_AVAILABLE:
+    # Un enregistrement par dinosaure ; 'state' est l'indice de l'état dans le lot
+    DINO_DTYPE = np.dtype([('state', np.int32), ('player', np.int8), ('dino_type', np.int8),
+                           ('x', np.int32), ('y', np.int32), ('health', np.int32)])
+
+    # Un enregistrement par état : œufs (joueurs 1 et 2), ressources, nombre et
+    # vie totale des œufs de spawn, facteur des poids de distance (voir
+    # heuristics.distance_scale)
+    STATE_DTYPE = np.dtype([('egg_x', np.int32, 2), ('egg_y', np.int32, 2),
+                            ('egg_health', np.int32, 2), ('steaks', np.int32, 2),
+                            ('spawn_eggs', np.int32, 2), ('spawn_egg_health', np.int32, 2),
+                            ('distance_scale', np.float64)])
+
+
+class StateBatch:
+    """
+    Lot d'états à évaluer ensemble
+
+    Les états sont ajoutés un par un (add) pendant la recherche, puis
+    convertis en tableaux structurés NumPy (pack) pour evaluate_batch().
+    Seules les valeurs sont copiées : l'état peut être modifié ou annulé
+    juste après add().
+    """
+
+    def __init__(self):
+        self._states = []
+        self._dinos = []
+
+    def __len__(self):
+        return len(self._states)
+
+    def add(self, game_state):
+        """Ajoute une photographie de l'état au lot"""
+        index = len(self._states)
+        eggs = game_state.eggs
+        egg1, egg2 = eggs[1], eggs[2]
+        counts, healths = [0, 0], [0, 0]
+        for spawn_egg in game_state.spawn_eggs:
+            counts[spawn_egg.player - 1] += 1
+            healths[spawn_egg.player - 1] += spawn_egg.health
+        self._states.append(((egg1.x, egg2.x), (egg1.y, egg2.y),
+                             (egg1.health, egg2.health),
+                             (game_state.player1_steaks, game_state.player2_steaks),
+                             tuple(counts), tuple(healths),
+                             distance_scale(game_state)))
+        self._dinos.extend([(index, d.player, d.dino_type, d.x, d.y, d.health)
+                            for d in game_state.dinosaurs])
+
+    def pack(self):
+        """
+        Convertit le lot en tableaux structurés
+
+        Returns:
+            tuple: (états STATE_DTYPE de taille N, dinosaures DINO_DTYPE)
+        """
+        _require_numpy()
+        return (np.array(self._states, dtype=STATE_DTYPE),
+                np.array(self._dinos, dtype=DINO_DTYPE))
+
+    def clear(self):
+        self._states = []
+        self._dinos = []
+
+
+def evaluate_batch(states, dinos, ai_player, weights=None):
+    """
+    Évalue N états en opérations vectorielles, comme evaluate_state()
+
+    Args:
+        states (np.ndarray): Tableau STATE_DTYPE de taille N
+        dinos (np.ndarray): Tableau DINO_DTYPE (tous les dinosaures du lot)
+        ai_player (int): Numéro du joueur IA (1 ou 2)
+        weights (dict): Poids complets (voir resolve_weights), None = DEFAULT_WEIGHTS
+
+    Returns:
+        np.ndarray: Scores (float64) ; identiques à evaluate_state() avec les
+        poids par défaut car tous les termes sont des multiples de 0.5
+    """
+    _require_numpy()
+    w = weights or DEFAULT_WEIGHTS
+    me, enemy = ai_player - 1, 2 - ai_player
+    n = len(states)
+
+    egg_health = states['egg_health']
+    score = ((egg_health[:, me] - egg_health[:, enemy]) * float(w['egg_health'])
+             + (states['steaks'][:, me] - states['steaks'][:, enemy]) * float(w['steaks']))
+
+    # Œufs de spawn : comptés comme des dinosaures à venir, avec la vie de l'œuf
+    spawn_eggs, spawn_egg_health = states['spawn_eggs'], states['spawn_egg_health']
+    score += ((spawn_eggs[:, me] - spawn_eggs[:, enemy]) * float(w['dino'])
+              + (spawn_egg_health[:, me] - spawn_egg_health[:, enemy]) * float(w['dino_health']))
+
+    if len(dinos):
+        index = dinos['state']
+        x, y = dinos['x'], dinos['y']
+        health = dinos['health']
+        mine = dinos['player'] == ai_player
+        theirs = dinos['player'] == 3 - ai_player
+
+        # Distances de chaque dinosaure à l'œuf ennemi et à mon œuf
+        to_enemy_egg = (np.abs(x - states['egg_x'][index, enemy])
+                        + np.abs(y - states['egg_y'][index, enemy]))
+        to_my_egg = (np.abs(x - states['egg_x'][index, me])
+                     + np.abs(y - states['egg_y'][index, me]))
+
+        scale = states['distance_scale'][index]
+        tank_bonus = ((dinos['dino_type'] == 3) & (to_enemy_egg <= 2)) * w['tank_bonus']
+        contribution = (np.where(mine, w['dino'] + health * w['dino_health']
+                                 - to_enemy_egg * (w['attack_distance'] * scale) + tank_bonus, 0)
+                        + np.where(theirs, -w['dino'] - health * w['dino_health']
+                                   + to_my_egg * (w['defense_distance'] * scale), 0))
+        score += np.bincount(index, weights=contribution, minlength=n)
+
+    # Victoire / défaite
+    score = np.where(egg_health[:, me] <= 0, -100000.0, score)
+    score = np.where(egg_health[:, enemy] <= 0, 100000.0, score)
+    return score
+
+
+def evaluate_states(game_states, ai_player, weights=None):
+    """
+    Raccourci : empaquette une liste d'états et les évalue en un appel
+
+    Args:
+        game_states (list): États du jeu (Game ou GameState)
+        ai_player (int): Numéro du joueur IA (1 ou 2)
+        weights (dict): Poids complets, None = DEFAULT_WEIGHTS
+
+    Returns:
+        np.ndarray: Scores des états, dans l'ordre de la liste
+    """
+    batch = StateBatch()
+    for game_state in game_states:
+        batch.add(game_state)
+    return evaluate_batch(*batch.pack(), ai_player, weights)
@@ -0,0 +1,235 @@
+"""
+Banc de mesure des performances de l'IA sur des positions de référence
+Mesure nœuds/s, évaluations, copies d'état et latences de décision (JSON comparable)
+
+Utilisation :
+    python -m ai.benchmark --json avant.json
+    python -m ai.benchmark --baseline avant.json --tolerance 0.10
+    python -m ai.benchmark --positions opening,logs/autosave.snap
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from ai.arena import BOARD_HEIGHT, BOARD_WIDTH, EGG_POSITIONS, create_engine, percentile
+from ai.game_state import DinoState, GameState, SpawnEggState, TrapState
+from Entities.rules import SPAWN_EGG_HEALTH, SPAWN_EGG_TURNS
+from snapshot import Snapshot
+
+# Moteurs mesurés par défaut : profondeur / itérations fixes pour que le
+# travail effectué ne dépende pas de la vitesse de la machine
+DEFAULT_ENGINES = (
+    'search:max_depth=3,time_budget_ms=60000',
+    'mcts:max_iterations=500,time_budget_ms=60000',
+)
+
+# Positions de référence. Dinosaures : (joueur, type, x, y[, vie]) ;
+# pièges : (joueur, x, y) ; œufs de spawn : (joueur, type, x, y, tours écoulés)
+POSITIONS = {
+    'opening': {
+        'current_player': 2, 'turn_number': 1,
+        'steaks': (60, 100), 'egg_health': (100, 100),
+        'dinosaurs': [(1, 1, 3, 2)],
+        'traps': [],
+        'spawn_eggs': [],
+    },
+    'crowded_midgame': {
+        'current_player': 2, 'turn_number': 18,
+        'steaks': (140, 160), 'egg_health': (100, 100),
+        'dinosaurs': [
+            (1, 1, 5, 3), (1, 1, 6, 5, 40), (1, 2, 4, 6), (1, 2, 7, 7), (1, 3, 8, 5, 90),
+            (1, 1, 9, 3), (1, 2, 3, 4), (1, 3, 6, 8),
+            (2, 1, 10, 6), (2, 1, 9, 7, 30), (2, 2, 11, 5), (2, 2, 8, 8), (2, 3, 10, 8),
+            (2, 1, 12, 7), (2, 2, 12, 4, 50), (2, 3, 9, 9),
+        ],
+        'traps': [(1, 5, 7), (2, 11, 8)],
+        'spawn_eggs': [(1, 2, 2, 2, 1), (2, 1, 13, 9, 0)],
+    },
+    'egg_under_siege': {
+        'current_player': 2, 'turn_number': 25,
+        'steaks': (80, 120), 'egg_health': (100, 40),
+        'dinosaurs': [
+            (1, 1, 13, 10), (1, 2, 14, 9), (1, 3, 12, 9, 70), (1, 1, 11, 10),
+            (2, 2, 13, 8), (2, 3, 15, 10), (2, 1, 12, 7, 30),
+        ],
+        'traps': [(2, 12, 10)],
+        'spawn_eggs': [],
+    },
+    'trap_heavy': {
+        'current_player': 2, 'turn_number': 14,
+        'steaks': (60, 90), 'egg_health': (100, 100),
+        'dinosaurs': [
+            (1, 1, 4, 4), (1, 2, 6, 3), (1, 3, 3, 6), (1, 1, 7, 6),
+            (2, 1, 11, 7), (2, 2, 10, 9), (2, 3, 12, 6), (2, 1, 9, 5),
+        ],
+        'traps': [
+            (1, 5, 5), (1, 6, 6), (1, 4, 7), (1, 8, 4), (1, 5, 8), (1, 7, 8),
+            (2, 10, 6), (2, 9, 7), (2, 11, 8), (2, 8, 6), (2, 10, 4), (2, 12, 9),
+        ],
+        'spawn_eggs': [(1, 1, 2, 3, 1)],
+    },
+}
+
+
+def build_position(name):
+    """
+    Construit l'état d'une position de référence
+
+    Args:
+        name (str): Nom d'une position de POSITIONS, ou chemin d'un instantané
+            de partie (snapshot.py)
+
+    Returns:
+        GameState: Nouvel état (sans grille de terrain)
+    """
+    if name not in POSITIONS:
+        return Snapshot.load(name).to_state()
+    spec = POSITIONS[name]
+    state = GameState.new_game(BOARD_WIDTH, BOARD_HEIGHT, [], EGG_POSITIONS)
+    state.current_player = spec['current_player']
+    state.turn_number = spec['turn_number']
+    state.player1_steaks, state.player2_steaks = spec['steaks']
+    state.eggs[1].health, state.eggs[2].health = spec['egg_health']
+    for player, dino_type, x, y, *health in spec['dinosaurs']:
+        dino = DinoState.new(x, y, player, dino_type)
+        if health:
+            dino.health = health[0]
+        state.dinosaurs.append(dino)
+    state.traps = [TrapState(x, y, player) for player, x, y in spec['traps']]
+    state.spawn_eggs = [SpawnEggState(x, y, player, dino_type, SPAWN_EGG_HEALTH[dino_type],
+                                      SPAWN_EGG_HEALTH[dino_type], SPAWN_EGG_TURNS[dino_type],
+                                      elapsed)
+                        for player, dino_type, x, y, elapsed in spec['spawn_eggs']]
+    return state
+
+
+def bench_position(engine_spec, name, repeat, seed=0):
+    """
+    Mesure repeat décisions d'un moteur neuf sur une position
+
+    Returns:
+        dict: Mesures (nœuds/s, évaluations, copies, latences en ms)
+    """
+    position = build_position(name)
+    latencies = []
+    nodes = evaluations = copies = 0
+    depths = []
+    for i in range(repeat):
+        random.seed(seed + i)
+        engine = create_engine(engine_spec, position.current_player)
+        state = position.clone()
+        copies_before = GameState.copies
+        start = time.perf_counter()
+        engine.choose_action(state)
+        latencies.append((time.perf_counter() - start) * 1000.0)
+        copies += GameState.copies - copies_before
+        stats = engine.stats
+        nodes += stats.get('nodes', stats.get('iterations', 0))
+        evaluations += stats.get('evaluations', 0)
+        if 'depth' in stats:
+            depths.append(stats['depth'])
+        engine.shutdown()
+
+    total_s = sum(latencies) / 1000.0
+    result = {
+        'decisions': repeat,
+        'nodes': nodes,
+        'nodes_per_sec': nodes / total_s if total_s > 0 else 0.0,
+        'evaluations': evaluations,
+        'copies': copies,
+        'latency_ms': {f'p{p}': percentile(latencies, p) for p in (50, 95, 99)},
+    }
+    if depths:
+        result['depth'] = min(depths)
+    return result
+
+
+def run_benchmark(engines=DEFAULT_ENGINES, positions=None, repeat=5, seed=0):
+    """
+    Mesure chaque moteur sur chaque position
+
+    Returns:
+        dict: {moteur: {position: mesures}}
+    """
+    positions = positions or list(POSITIONS)
+    return {spec: {name: bench_position(spec, name, repeat, seed) for name in positions}
+            for spec in engines}
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare deux exécutions du banc
+
+    Une régression est un débit (nœuds/s) plus bas, ou une latence p95 plus
+    haute, de plus de tolerance (proportion) par rapport à baseline.
+
+    Returns:
+        list: Messages décrivant les régressions (vide si aucune)
+    """
+    regressions = []
+    for spec, positions in results.items():
+        for name, current in positions.items():
+            previous = baseline.get(spec, {}).get(name)
+            if previous is None:
+                continue
+            if current['nodes_per_sec'] < previous['nodes_per_sec'] * (1 - tolerance):
+                regressions.append(f"{spec} / {name}: {current['nodes_per_sec']:.0f} nœuds/s "
+                                   f"(avant {previous['nodes_per_sec']:.0f})")
+            if current['latency_ms']['p95'] > previous['latency_ms']['p95'] * (1 + tolerance):
+                regressions.append(f"{spec} / {name}: p95 {current['latency_ms']['p95']:.1f} ms "
+                                   f"(avant {previous['latency_ms']['p95']:.1f})")
+    return regressions
+
+
+def format_results(results):
+    """Tableau lisible des mesures"""
+    lines = []
+    for spec, positions in results.items():
+        lines.append(spec)
+        for name, r in positions.items():
+            lat = r['latency_ms']
+            lines.append(f"  {name:<16} {r['nodes_per_sec']:>9.0f} nœuds/s  "
+                         f"{r['evaluations']:>7} éval.  {r['copies']:>5} copies  "
+                         f"p50 {lat['p50']:>7.1f}  p95 {lat['p95']:>7.1f}  p99 {lat['p99']:>7.1f} ms")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc de performances de l'IA")
+    parser.add_argument('--engine', action='append', dest='engines',
+                        help="Moteur à mesurer (répétable), ex. 'search:max_depth=3'")
+    parser.add_argument('--positions', default=','.join(POSITIONS),
+                        help="Positions ou instantanés (.snap), séparés par des virgules")
+    parser.add_argument('--repeat', type=int, default=5, help="Décisions mesurées par position")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help="Écrire les mesures dans ce fichier JSON")
+    parser.add_argument('--baseline', help="Fichier JSON d'une exécution précédente à comparer")
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help="Écart toléré avant de signaler une régression (0.10 = 10 %%)")
+    args = parser.parse_args(argv)
+
+    positions = [p.strip() for p in args.positions.split(',') if p.strip()]
+    results = run_benchmark(args.engines or DEFAULT_ENGINES, positions, args.repeat, args.seed)
+    print(format_results(results))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRégressions :")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print("\nAucune régression")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
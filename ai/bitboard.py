@@ -0,0 +1,239 @@
+"""
+Représentation du plateau en bitboards pour la génération des actions
+Chaque couche (arbres, boue, œufs, dinosaures de chaque joueur, œufs de spawn,
+pièges) est un entier Python dont le bit i correspond à une case du plateau
+"""
+
+import weakref
+
+from Entities.rules import SPAWN_MAX_DISTANCE
+
+
+def cell_index(x, y, logic_height):
+    """
+    Numéro du bit d'une case
+
+    Les cases sont rangées colonne par colonne (x puis y) : parcourir les bits
+    d'un masque dans l'ordre croissant donne les cases dans le même ordre que
+    les doubles boucles « for x ... for y ... » du jeu.
+    """
+    return x * logic_height + y
+
+
+def iter_bits(mask):
+    """Itère sur les numéros des bits à 1 d'un masque, du plus faible au plus fort"""
+    # Le masque est décalé au fur et à mesure : sur un grand plateau, les
+    # opérations suivantes portent sur un entier court au lieu du plateau entier
+    offset = 0
+    while mask:
+        bit = (mask & -mask).bit_length()
+        offset += bit
+        yield offset - 1
+        mask >>= bit
+
+
+class CellMasks(dict):
+    """
+    Masques par case (case -> masque), calculés à la première demande
+
+    Sur un grand plateau (128x128), chaque masque est un entier de plusieurs
+    milliers de bits : tout précalculer coûterait des dizaines de Mo et
+    plusieurs centaines de ms, alors qu'une partie n'utilise que les cases
+    autour des dinosaures et des œufs. Une case déjà calculée se lit au prix
+    d'un accès de dictionnaire.
+    """
+
+    __slots__ = ('compute',)
+
+    def __init__(self, compute):
+        super().__init__()
+        self.compute = compute
+
+    def __missing__(self, cell):
+        mask = self.compute(cell)
+        self[cell] = mask
+        return mask
+
+
+class BoardMasks:
+    """
+    Masques d'une taille de plateau
+
+    diamond(r)[i] : cases à distance de Manhattan 1..r de la case i (portée de
+    déplacement ou zone de spawn) ; adjacent[i] : voisines orthogonales ;
+    neighbors[i] : les mêmes sous forme de liste, dans l'ordre gauche, droite,
+    haut, bas. Les masques ne dépendent que des dimensions et sont partagés par
+    tous les états de même taille (voir for_size()) ; ceux de diamond() et
+    adjacent sont calculés case par case à la demande (voir CellMasks).
+    """
+
+    _cache = {}
+
+    def __init__(self, logic_width, logic_height):
+        self.logic_width = logic_width
+        self.logic_height = logic_height
+        self.size = logic_width * logic_height
+        self.full = (1 << self.size) - 1
+        self.coords = [(i // logic_height, i % logic_height) for i in range(self.size)]
+
+        self.neighbors = []
+        for x, y in self.coords:
+            self.neighbors.append([cell_index(nx, ny, logic_height)
+                                   for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+                                   if 0 <= nx < logic_width and 0 <= ny < logic_height])
+        self.adjacent = CellMasks(self._adjacent_mask)
+        self._diamonds = {}
+
+    @classmethod
+    def for_size(cls, logic_width, logic_height):
+        """Masques partagés pour une taille de plateau"""
+        masks = cls._cache.get((logic_width, logic_height))
+        if masks is None:
+            masks = cls(logic_width, logic_height)
+            cls._cache[(logic_width, logic_height)] = masks
+        return masks
+
+    def _adjacent_mask(self, cell):
+        mask = 0
+        for neighbor in self.neighbors[cell]:
+            mask |= 1 << neighbor
+        return mask
+
+    def diamond(self, reach):
+        """
+        Masques des losanges de rayon reach (case centrale exclue)
+
+        Returns:
+            CellMasks: Un masque par case (vide si reach <= 0)
+        """
+        masks = self._diamonds.get(reach)
+        if masks is None:
+            masks = CellMasks(lambda cell: self._diamond_mask(cell, reach))
+            self._diamonds[reach] = masks
+        return masks
+
+    def _diamond_mask(self, cell, reach):
+        if reach <= 0:
+            return 0
+        height = self.logic_height
+        cx, cy = self.coords[cell]
+        # Une colonne du losange = une suite de bits consécutifs ; le masque
+        # est construit près du bit 0 puis décalé une seule fois (les
+        # opérations sur les grands entiers coûtent leur longueur)
+        first = max(0, cx - reach)
+        mask = 0
+        for x in range(first, min(self.logic_width, cx + reach + 1)):
+            span = reach - abs(x - cx)
+            low = max(0, cy - span)
+            high = min(height, cy + span + 1)
+            mask |= ((1 << (high - low)) - 1) << cell_index(x - first, low, height)
+        mask &= ~(1 << cell_index(cx - first, cy, height))
+        return mask << cell_index(first, 0, height)
+
+
+class Bitboards:
+    """
+    Occupation du plateau d'un état de jeu, construite en un passage sur les entités
+
+    Les couches de terrain (arbres, boue) sont converties une fois par terrain
+    compilé (Entities/terrain.py), qui ne change pas pendant une partie et qui
+    est partagé par tous les clones d'un état.
+    """
+
+    __slots__ = ('masks', 'trees', 'mud', 'eggs', 'egg_cells', 'dinos', 'dino_at',
+                 'spawn_eggs', 'traps')
+
+    # Terrain compilé -> (arbres, boue) en bitboards
+    _terrain = weakref.WeakKeyDictionary()
+
+    def __init__(self, game):
+        """
+        Args:
+            game: État du jeu (GameState ou instance du jeu)
+        """
+        height = game.logic_height
+        self.masks = BoardMasks.for_size(game.logic_width, height)
+        self.trees, self.mud = self._terrain_layers(getattr(game, 'terrain', None), self.masks)
+
+        self.eggs = 0
+        self.egg_cells = {}
+        for player, egg in game.eggs.items():
+            cell = cell_index(egg.x, egg.y, height)
+            self.egg_cells[player] = cell
+            self.eggs |= 1 << cell
+
+        self.dinos = {1: 0, 2: 0}
+        self.dino_at = {}
+        for dino in game.dinosaurs:
+            cell = cell_index(dino.x, dino.y, height)
+            self.dinos[dino.player] = self.dinos.get(dino.player, 0) | (1 << cell)
+            self.dino_at.setdefault(cell, []).append(dino)
+
+        self.spawn_eggs = 0
+        for spawn_egg in game.spawn_eggs:
+            self.spawn_eggs |= 1 << cell_index(spawn_egg.x, spawn_egg.y, height)
+
+        self.traps = 0
+        for trap in game.traps:
+            self.traps |= 1 << cell_index(trap.x, trap.y, height)
+
+    @classmethod
+    def _terrain_layers(cls, terrain, masks):
+        """Masques des arbres et de la boue d'un terrain compilé (mis en cache)"""
+        if terrain is None:
+            return 0, 0
+        layers = cls._terrain.get(terrain)
+        if layers is None:
+            trees = mud = 0
+            width = terrain.logic_width
+            for index in range(width * terrain.logic_height):
+                bit = 1 << cell_index(index % width, index // width, masks.logic_height)
+                if terrain.blocked[index]:
+                    trees |= bit
+                if terrain.mud[index]:
+                    mud |= bit
+            layers = (trees, mud)
+            cls._terrain[terrain] = layers
+        return layers
+
+    @property
+    def all_dinos(self):
+        """Cases occupées par un dinosaure, tous joueurs confondus"""
+        mask = 0
+        for player_mask in self.dinos.values():
+            mask |= player_mask
+        return mask
+
+    @property
+    def blocked(self):
+        """
+        Cases où l'on ne peut pas se déplacer : arbres, œufs, dinosaures et
+        œufs de spawn (Game.can_move_to) ; un piège n'arrête pas un déplacement
+        """
+        return self.trees | self.eggs | self.all_dinos | self.spawn_eggs
+
+    @property
+    def spawn_blocked(self):
+        """Cases où l'on ne peut pas spawner : en plus, les pièges (Game.is_cell_free)"""
+        return self.blocked | self.traps
+
+    def spawn_cells(self, player, reach=SPAWN_MAX_DISTANCE):
+        """Cases libres à distance de Manhattan <= reach de l'œuf du joueur"""
+        egg_cell = self.egg_cells[player]
+        # Le losange exclut la case de l'œuf, qui est occupée de toute façon
+        return self.masks.diamond(reach)[egg_cell] & ~self.spawn_blocked
+
+    def move_cells(self, dino, blocked=None):
+        """
+        Cases atteignables par un dinosaure
+
+        Comme dans le jeu, la portée est divisée par deux dans la boue, sauf
+        pour le type 3.
+        """
+        cell = cell_index(dino.x, dino.y, self.masks.logic_height)
+        reach = dino.movement_range
+        if self.mud >> cell & 1 and dino.dino_type != 3:
+            reach //= 2
+        if blocked is None:
+            blocked = self.blocked
+        return self.masks.diamond(reach)[cell] & ~blocked
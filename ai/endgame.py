@@ -0,0 +1,248 @@
+"""
+Solveur exact de fins de partie
+Cherche une victoire ou une défaite forcée (œuf détruit) quand il reste peu de pièces
+"""
+
+import time
+
+from ai.game_simulator import GameSimulator
+from ai.move_ordering import MoveOrderer
+from ai.zobrist import ZobristHasher, EXACT, LOWER, UPPER
+from logger import get_logger
+
+logger = get_logger("ai")
+
+# Score d'un œuf détruit ; MATE - n = victoire en n tours
+MATE = 1_000_000
+MATE_BOUND = MATE - 10_000
+
+WIN = 'win'
+LOSS = 'loss'
+
+
+class EndgameTimeout(Exception):
+    """Levée quand le budget du solveur est épuisé"""
+    pass
+
+
+class EndgameSolver:
+    """
+    Preuve de victoire / défaite par alpha-beta exhaustif
+
+    Contrairement à SearchAI, toutes les actions légales (y compris passer)
+    sont explorées et aucune évaluation heuristique n'est utilisée : une
+    feuille vaut MATE - tours si un œuf est détruit, 0 sinon (inconnu). Un
+    résultat non nul à la racine est donc prouvé (dans les règles de
+    GameSimulator). La recherche s'approfondit tour par tour jusqu'au budget ;
+    la table de transposition est conservée d'une décision à l'autre, pour
+    que les positions déjà prouvées soient résolues immédiatement.
+    """
+
+    def __init__(self, ai, max_pieces=4, egg_health=60, threat_distance=6, max_plies=16,
+                 tt_limit=1_000_000):
+        """
+        Args:
+            ai (BaseAI): IA qui fournit la génération des actions et stop_event
+            max_pieces (int): Le solveur s'applique s'il reste au plus ce nombre de
+                dinosaures et d'œufs de spawn sur le plateau, dont un à moins de
+                threat_distance (Manhattan) de l'œuf adverse...
+            egg_health (int): ... ou si un œuf a au plus cette santé
+            threat_distance (int): Distance à laquelle un dinosaure menace un œuf
+            max_plies (int): Profondeur maximale (en tours)
+            tt_limit (int): Nombre d'entrées de la table avant de la vider
+        """
+        self.ai = ai
+        self.max_pieces = max_pieces
+        self.egg_health = egg_health
+        self.threat_distance = threat_distance
+        self.max_plies = max_plies
+        self.tt_limit = tt_limit
+
+        self.hasher = ZobristHasher()
+        self.orderer = MoveOrderer()
+        self._tt = {}
+        self._deadline = None
+        self.nodes = 0
+
+    def applies(self, state):
+        """
+        True si une preuve est plausible : un œuf est entamé, ou il reste peu de
+        pièces et l'une d'elles menace un œuf (en ouverture le plateau est
+        presque vide aussi, mais aucune fin de partie n'est à portée)
+        """
+        if min(egg.health for egg in state.eggs.values()) <= self.egg_health:
+            return True
+        if len(state.dinosaurs) + len(state.spawn_eggs) > self.max_pieces:
+            return False
+        for dino in state.dinosaurs:
+            egg = state.eggs[3 - dino.player]
+            if abs(dino.x - egg.x) + abs(dino.y - egg.y) <= self.threat_distance:
+                return True
+        return False
+
+    def solve(self, state, player, budget_ms):
+        """
+        Cherche un résultat prouvé pour player au trait
+
+        Args:
+            state (GameState): Position (modifiée puis restaurée en place)
+            player (int): Joueur au trait
+            budget_ms (float): Temps maximal
+
+        Returns:
+            tuple: (WIN, LOSS ou None, action à jouer ou None, nombre de tours
+            jusqu'à la fin de partie ou None)
+        """
+        self._deadline = time.perf_counter() + budget_ms / 1000.0
+        self.nodes = 0
+        self.orderer.new_search()
+        if len(self._tt) > self.tt_limit:
+            self._tt = {}
+
+        state.current_player = player
+        key = self.hasher.hash_state(state)
+        result = (None, None, None)
+        try:
+            for depth in range(1, self.max_plies + 1):
+                score, signature = self._root(state, key, depth, player)
+                if abs(score) > MATE_BOUND:
+                    plies = MATE - abs(score)
+                    action = (GameSimulator.action_from_signature(state, signature)
+                              if signature is not None else None)
+                    result = (WIN if score > 0 else LOSS, action, plies)
+                    break
+        except EndgameTimeout:
+            pass
+        state.current_player = player
+        return result
+
+    def _root(self, state, key, depth, player):
+        """Une itération à profondeur fixe ; retourne (score, signature du meilleur coup)"""
+        alpha, beta = -MATE, MATE
+        best_score, best_signature = -MATE, None
+        tt_move = self._probe_move(key)
+        actions = self.orderer.order(self.ai.generate_actions(state, player), 0, tt_move)
+        side_swap = self._side_swap(player)
+        for action in actions:
+            signature = GameSimulator.action_signature(action)
+            child_key, undos = self._play(state, key, action, side_swap)
+            try:
+                score = -self._negamax(state, child_key, depth - 1, -beta, -alpha, 3 - player, 1)
+            finally:
+                self._unplay(state, undos)
+            state.current_player = player
+            if score > best_score:
+                best_score, best_signature = score, signature
+            alpha = max(alpha, score)
+        self._store(key, depth, EXACT, best_score, best_signature, 0)
+        return best_score, best_signature
+
+    def _negamax(self, state, key, depth, alpha, beta, player, ply):
+        """
+        Alpha-beta en negamax, score du point de vue de player (au trait)
+
+        Returns:
+            int: MATE - ply (victoire), -(MATE - ply) (défaite) ou 0 (inconnu)
+        """
+        self.nodes += 1
+        if time.perf_counter() >= self._deadline or self.ai.stop_event.is_set():
+            raise EndgameTimeout()
+
+        if state.eggs[player].health <= 0:
+            return -(MATE - ply)
+        if state.eggs[3 - player].health <= 0:
+            return MATE - ply
+        if depth <= 0:
+            return 0
+
+        state.current_player = player
+        entry = self._tt.get(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, flag, score, tt_move = entry
+            score = self._from_tt(score, ply)
+            # Un résultat prouvé reste vrai quelle que soit la profondeur
+            if entry_depth >= depth or abs(score) > MATE_BOUND:
+                if flag == EXACT:
+                    return score
+                if flag == LOWER:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+        # Une victoire plus rapide que MATE - ply - 1 est impossible
+        beta = min(beta, MATE - ply - 1)
+        if alpha >= beta:
+            return alpha
+
+        alpha_orig = alpha
+        best, best_signature = -MATE, None
+        actions = self.orderer.order(self.ai.generate_actions(state, player), ply, tt_move)
+        side_swap = self._side_swap(player)
+        for index, action in enumerate(actions):
+            child_key, undos = self._play(state, key, action, side_swap)
+            try:
+                score = -self._negamax(state, child_key, depth - 1, -beta, -alpha, 3 - player, ply + 1)
+            finally:
+                self._unplay(state, undos)
+            state.current_player = player
+            if score > best:
+                best, best_signature = score, GameSimulator.action_signature(action)
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                self.orderer.record_cutoff(action, ply, depth, index)
+                break
+        else:
+            self.orderer.record_no_cutoff()
+
+        if best <= alpha_orig:
+            flag = UPPER
+        elif best >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self._store(key, depth, flag, best, best_signature, ply)
+        return best
+
+    def _play(self, state, key, action, side_swap):
+        """Joue une action puis la fin de tour ; retourne (clé, annulations)"""
+        undo = GameSimulator.apply_action(state, action)
+        key = self.hasher.update(key, state, undo)
+        turn_undo = GameSimulator.simulate_end_turn(state)
+        key = self.hasher.update(key, state, turn_undo) ^ side_swap
+        return key, (undo, turn_undo)
+
+    @staticmethod
+    def _unplay(state, undos):
+        for undo in reversed(undos):
+            GameSimulator.undo_action(state, undo)
+
+    def _side_swap(self, player):
+        return (self.hasher.key(ZobristHasher.side_feature(player))
+                ^ self.hasher.key(ZobristHasher.side_feature(3 - player)))
+
+    def _probe_move(self, key):
+        entry = self._tt.get(key)
+        return entry[3] if entry is not None else None
+
+    def _store(self, key, depth, flag, score, signature, ply):
+        self._tt[key] = (depth, flag, self._to_tt(score, ply), signature)
+
+    @staticmethod
+    def _to_tt(score, ply):
+        """Les scores de fin de partie sont stockés relativement au nœud"""
+        if score > MATE_BOUND:
+            return score + ply
+        if score < -MATE_BOUND:
+            return score - ply
+        return score
+
+    @staticmethod
+    def _from_tt(score, ply):
+        if score > MATE_BOUND:
+            return score - ply
+        if score < -MATE_BOUND:
+            return score + ply
+        return score
@@ -3,8 +3,9 @@ Simulateur d'état de jeu pour l'IA
 Permet de copier et simuler des actions sans affecter le jeu réel
 """
 
-from Entities.Dinosaur import Dinosaur
-from Entities.Trap import Trap
+from Entities.rules import (SPAWN_COSTS, SPAWN_COOLDOWNS, TRAP_COST, TRAP_DAMAGE,
+                            TRAP_IMMOBILIZED_TURNS, KILL_REWARD, TURN_INCOME)
+from ai.game_state import GameState, DinoState, TrapState, SpawnEggState
 from logger import get_logger
 
 logger = get_logger("ai")
@@ -12,85 +13,127 @@ logger = get_logger("ai")
 class GameSimulator:
     """Permet de copier et simuler des états de jeu"""
     
+    # Durée de tour supposée pour les cooldowns de spawn (comptés en secondes par Game.update)
+    SIMULATED_TURN_SECONDS = 3.0
+    
     @staticmethod
     def copy_game_state(game):
         """
-        Crée une copie profonde de l'état du jeu
+        Crée une copie de l'état du jeu utilisable par la simulation
+        
+        Une instance du jeu est convertie en GameState (sans objets pygame) ;
+        un GameState est simplement cloné en O(n). La grille est partagée par
+        référence car elle ne change pas pendant une partie.
         
         Args:
-            game: Instance du jeu à copier
+            game: Instance du jeu ou GameState à copier
             
         Returns:
-            Game: Copie de l'état du jeu
-        """
-        # Créer une copie superficielle de base
-        sim = type('GameState', (), {})()
-        
-        # Copier les références nécessaires (pas les objets pygame)
-        sim.screen = game.screen
-        sim.logic_width = game.logic_width
-        sim.logic_height = game.logic_height
-        
-        # Copier les structures de données importantes manuellement
-        # Pour éviter les problèmes avec pygame.Surface
-        sim.eggs = {}
-        for player, egg in game.eggs.items():
-            new_egg = type('Egg', (), {})()
-            new_egg.x = egg.x
-            new_egg.y = egg.y
-            new_egg.player = egg.player
-            new_egg.health = egg.health
-            new_egg.max_health = egg.max_health
-            new_egg.take_damage = egg.take_damage
-            sim.eggs[player] = new_egg
-        
-        # Copier les dinosaures
-        sim.dinosaurs = []
-        for dino in game.dinosaurs:
-            new_dino = type('Dinosaur', (), {})()
-            new_dino.x = dino.x
-            new_dino.y = dino.y
-            new_dino.player = dino.player
-            new_dino.dino_type = dino.dino_type
-            new_dino.health = dino.health
-            new_dino.max_health = dino.max_health
-            new_dino.attack_power = dino.attack_power
-            new_dino.movement_range = dino.movement_range
-            new_dino.has_moved = dino.has_moved
-            new_dino.immobilized_turns = dino.immobilized_turns
-            new_dino.take_damage = dino.take_damage
-            sim.dinosaurs.append(new_dino)
-        
-        # Copier les pièges
-        sim.traps = []
-        for trap in game.traps:
-            new_trap = type('Trap', (), {})()
-            new_trap.x = trap.x
-            new_trap.y = trap.y
-            new_trap.player = trap.player
-            sim.traps.append(new_trap)
-        
-        # Copier la grille
-        sim.grid = [row[:] for row in game.grid] if hasattr(game, 'grid') else []
-        
-        # Copier les spawn_eggs
-        sim.spawn_eggs = []
-        for spawn_egg in game.spawn_eggs:
-            new_spawn = type('SpawnEgg', (), {})()
-            new_spawn.x = spawn_egg.x
-            new_spawn.y = spawn_egg.y
-            new_spawn.player = spawn_egg.player
-            new_spawn.dino_type = spawn_egg.dino_type
-            sim.spawn_eggs.append(new_spawn)
-        
-        # Copier les ressources
-        sim.player1_steaks = game.player1_steaks
-        sim.player2_steaks = game.player2_steaks
-        sim.current_player = game.current_player
-        sim.turn_number = game.turn_number
-        
-        return sim
+            GameState: Copie de l'état du jeu
+        """
+        if isinstance(game, GameState):
+            return game.clone()
+        return GameState.from_game(game)
     
+    @staticmethod
+    def action_signature(action):
+        """
+        Retourne une signature hashable d'une action (sans référence aux objets)
+
+        Deux actions identiques générées sur deux copies d'un même état ont la
+        même signature, ce qui permet de les stocker (table de transposition...).
+
+        Args:
+            action (dict): Action au format {'type': ..., ...}
+
+        Returns:
+            tuple: Signature de l'action
+        """
+        action_type = action['type']
+        if action_type == 'spawn':
+            return ('spawn', action['x'], action['y'], action['dino_type'])
+        if action_type == 'move':
+            dino = action['dinosaur']
+            return ('move', dino.x, dino.y, action['target_x'], action['target_y'])
+        if action_type == 'attack':
+            attacker, target = action['attacker'], action['target']
+            return ('attack', attacker.x, attacker.y, target.x, target.y,
+                    action.get('target_type', 'dinosaur'))
+        if action_type == 'trap':
+            return ('trap', action['x'], action['y'])
+        return (action_type,)
+
+    @staticmethod
+    def action_from_signature(game_state, signature):
+        """
+        Reconstruit une action à partir de sa signature sur un état donné
+
+        Inverse de action_signature() : les entités sont recherchées par
+        position dans game_state.
+
+        Args:
+            game_state: État du jeu sur lequel l'action sera appliquée
+            signature (tuple): Signature retournée par action_signature()
+
+        Returns:
+            dict: Action, ou None si les entités concernées n'existent plus
+        """
+        action_type = signature[0]
+        if action_type == 'spawn':
+            return {'type': 'spawn', 'x': signature[1], 'y': signature[2],
+                    'dino_type': signature[3]}
+        if action_type == 'trap':
+            return {'type': 'trap', 'x': signature[1], 'y': signature[2]}
+        if action_type == 'move':
+            dino = GameSimulator._dino_at(game_state, signature[1], signature[2])
+            if dino is None:
+                return None
+            return {'type': 'move', 'dinosaur': dino,
+                    'target_x': signature[3], 'target_y': signature[4]}
+        if action_type == 'attack':
+            attacker = GameSimulator._dino_at(game_state, signature[1], signature[2])
+            target_type = signature[5]
+            if target_type == 'egg':
+                target = None
+                for egg in game_state.eggs.values():
+                    if egg.x == signature[3] and egg.y == signature[4]:
+                        target = egg
+                        break
+            else:
+                target = GameSimulator._dino_at(game_state, signature[3], signature[4])
+            if attacker is None or target is None:
+                return None
+            return {'type': 'attack', 'attacker': attacker, 'target': target,
+                    'target_type': target_type}
+        return {'type': action_type}
+
+    @staticmethod
+    def board_key(game_state):
+        """
+        Clé du plateau : entités, positions et santé
+
+        Ignore les ressources, le joueur au trait, les cooldowns et les drapeaux
+        de tour, ce qui permet de reconnaître une position prévue même si le tour
+        réel a duré plus ou moins longtemps que prévu.
+
+        Returns:
+            tuple: Clé hashable
+        """
+        return (tuple(sorted((d.player, d.dino_type, d.x, d.y, d.health)
+                             for d in game_state.dinosaurs)),
+                tuple(sorted((e.player, e.health) for e in game_state.eggs.values())),
+                tuple(sorted((t.player, t.x, t.y) for t in game_state.traps)),
+                tuple(sorted((e.player, e.dino_type, e.x, e.y, e.health, e.spawn_turns_elapsed)
+                             for e in game_state.spawn_eggs)))
+
+    @staticmethod
+    def _dino_at(game_state, x, y):
+        """Retourne le dinosaure vivant en (x, y), ou None"""
+        for dino in game_state.dinosaurs:
+            if dino.x == x and dino.y == y and dino.health > 0:
+                return dino
+        return None
+
     @staticmethod
     def simulate_action(game_state, action):
         """
@@ -103,44 +146,185 @@ class GameSimulator:
         Returns:
             Game: État du jeu après l'action
         """
+        GameSimulator._dispatch(game_state, action, None)
+        return game_state
+    
+    @staticmethod
+    def apply_action(game_state, action):
+        """
+        Applique une action en place et retourne de quoi l'annuler
+        
+        Permet de parcourir un arbre de recherche avec un seul état mutable :
+        apply_action() en descendant, undo_action() en remontant, sans copie.
+        
+        Args:
+            game_state: État du jeu (modifié en place)
+            action (dict): Action à appliquer
+            
+        Returns:
+            UndoRecord: Enregistrement à passer à undo_action()
+        """
+        undo = UndoRecord(game_state)
+        GameSimulator._dispatch(game_state, action, undo)
+        return undo
+    
+    @staticmethod
+    def simulate_end_turn(game_state, turn_seconds=None):
+        """
+        Termine le tour du joueur courant, comme Game.end_turn() puis Game.update()
+        
+        - +20 steaks pour le joueur qui termine son tour
+        - Un tour d'éclosion de plus pour tous les œufs de spawn ; ceux qui ont
+          atteint le nombre de tours requis éclosent (Game.update les fait éclore
+          dès la fin de l'animation)
+        - has_moved remis à False pour les dinosaures du joueur qui termine
+        - Changement de joueur (turn_number augmente quand le joueur 1 reprend la main)
+        - Immobilisation réduite d'un tour pour les dinosaures du nouveau joueur
+        - Cooldowns de spawn réduits de turn_seconds (ils sont en secondes dans le jeu)
+        
+        Args:
+            game_state: État du jeu (modifié en place)
+            turn_seconds (float): Durée de tour supposée (par défaut SIMULATED_TURN_SECONDS)
+            
+        Returns:
+            UndoRecord: Enregistrement à passer à undo_action()
+        """
+        undo = UndoRecord(game_state)
+        changes = undo.changes
+        player = game_state.current_player
+        new_player = 3 - player
+        
+        # Donner des steaks au joueur
+        if player == 1:
+            game_state.player1_steaks += TURN_INCOME
+        else:
+            game_state.player2_steaks += TURN_INCOME
+        
+        # Mettre à jour les œufs de spawn (tous les joueurs) et noter ceux qui éclosent
+        hatched = []
+        for spawn_egg in game_state.spawn_eggs:
+            if spawn_egg.spawn_turns_elapsed < spawn_egg.spawn_turns_required:
+                changes.append(('spawn_egg', spawn_egg, spawn_egg.spawn_turns_elapsed))
+                spawn_egg.spawn_turns_elapsed += 1
+            if spawn_egg.spawn_turns_elapsed >= spawn_egg.spawn_turns_required:
+                hatched.append(spawn_egg)
+        
+        # Réinitialiser les mouvements du joueur actuel et réduire l'immobilisation
+        # du nouveau joueur (une seule sauvegarde par dinosaure)
+        for dino in game_state.dinosaurs:
+            if dino.player == player:
+                if dino.has_moved:
+                    undo.save_dino(dino)
+                    dino.has_moved = False
+            elif dino.player == new_player and dino.immobilized_turns > 0:
+                undo.save_dino(dino)
+                dino.immobilized_turns -= 1
+        
+        # Changer de joueur
+        game_state.current_player = new_player
+        if new_player == 1:
+            game_state.turn_number += 1
+        game_state.spawn_action_done = False
+        
+        # Éclosion : le dinosaure remplace son œuf
+        for spawn_egg in hatched:
+            index = game_state.spawn_eggs.index(spawn_egg)
+            del game_state.spawn_eggs[index]
+            changes.append(('remove_spawn_egg', index, spawn_egg))
+            new_dino = GameSimulator._new_dino(spawn_egg.x, spawn_egg.y, spawn_egg.player,
+                                               spawn_egg.dino_type)
+            game_state.dinosaurs.append(new_dino)
+            changes.append(('add_dino', new_dino))
+        
+        # Cooldowns (copie à l'écriture : le dictionnaire est partagé entre clones)
+        if turn_seconds is None:
+            turn_seconds = GameSimulator.SIMULATED_TURN_SECONDS
+        cooldowns = game_state.spawn_cooldowns
+        if any(c > 0 for per_player in cooldowns.values() for c in per_player.values()):
+            changes.append(('cooldowns', cooldowns))
+            game_state.spawn_cooldowns = {p: {t: max(0, c - turn_seconds) for t, c in per_player.items()}
+                                          for p, per_player in cooldowns.items()}
+        return undo
+    
+    @staticmethod
+    def undo_action(game_state, undo):
+        """
+        Restaure exactement l'état d'avant apply_action()
+        
+        Les annulations doivent être faites dans l'ordre inverse des applications.
+        
+        Args:
+            game_state: État du jeu modifié par apply_action()
+            undo (UndoRecord): Enregistrement retourné par apply_action()
+        """
+        for change in reversed(undo.changes):
+            kind = change[0]
+            if kind == 'dino':
+                dino = change[1]
+                dino.x, dino.y, dino.health, dino.has_moved, dino.immobilized_turns = change[2]
+            elif kind == 'egg':
+                change[1].health = change[2]
+            elif kind == 'remove_dino':
+                game_state.dinosaurs.insert(change[1], change[2])
+            elif kind == 'remove_trap':
+                game_state.traps.insert(change[1], change[2])
+            elif kind == 'add_dino':
+                game_state.dinosaurs.pop()
+            elif kind == 'add_trap':
+                game_state.traps.pop()
+            elif kind == 'spawn_egg':
+                change[1].spawn_turns_elapsed = change[2]
+            elif kind == 'remove_spawn_egg':
+                game_state.spawn_eggs.insert(change[1], change[2])
+            elif kind == 'add_spawn_egg':
+                game_state.spawn_eggs.pop()
+            elif kind == 'cooldowns':
+                game_state.spawn_cooldowns = change[1]
+        
+        game_state.player1_steaks = undo.player1_steaks
+        game_state.player2_steaks = undo.player2_steaks
+        game_state.current_player = undo.current_player
+        game_state.turn_number = undo.turn_number
+        game_state.spawn_action_done = undo.spawn_action_done
+    
+    @staticmethod
+    def _dispatch(game_state, action, undo):
+        """Applique une action en journalisant les modifications si undo est fourni"""
         action_type = action['type']
         
         try:
             if action_type == 'spawn':
                 # Faire spawn un dinosaure
                 x, y, dino_type = action['x'], action['y'], action['dino_type']
-                GameSimulator._simulate_spawn(game_state, x, y, dino_type)
+                GameSimulator._simulate_spawn(game_state, x, y, dino_type, undo)
             
             elif action_type == 'move':
                 # Déplacer un dinosaure
                 dinosaur = action['dinosaur']
                 target_x, target_y = action['target_x'], action['target_y']
-                GameSimulator._simulate_move(game_state, dinosaur, target_x, target_y)
+                GameSimulator._simulate_move(game_state, dinosaur, target_x, target_y, undo)
             
             elif action_type == 'attack':
                 # Attaquer un ennemi
                 attacker = action['attacker']
                 target = action['target']
                 target_type = action.get('target_type', 'dinosaur')
-                GameSimulator._simulate_attack(game_state, attacker, target, target_type)
+                GameSimulator._simulate_attack(game_state, attacker, target, target_type, undo)
             
             elif action_type == 'trap':
                 # Placer un piège
                 x, y = action['x'], action['y']
-                GameSimulator._simulate_trap(game_state, x, y)
+                GameSimulator._simulate_trap(game_state, x, y, undo)
             
             # 'pass' = ne rien faire, passer son tour
             
         except Exception as e:
             logger.error(f"Erreur simulation IA: {e}")
-        
-        return game_state
     
     @staticmethod
-    def _simulate_spawn(game_state, x, y, dino_type):
-        """Simule le spawn d'un dinosaure"""
-        costs = {1: 40, 2: 80, 3: 100}
-        cost = costs[dino_type]
+    def _simulate_spawn(game_state, x, y, dino_type, undo=None):
+        """Simule le spawn d'un œuf de dinosaure (comme Game.spawn_dinosaur)"""
+        cost = SPAWN_COSTS[dino_type]
         
         # Déduire le coût
         if game_state.current_player == 1:
@@ -148,37 +332,51 @@ class GameSimulator:
         else:
             game_state.player2_steaks -= cost
         
-        # Créer le dinosaure
-        new_dino = Dinosaur(x, y, game_state.current_player, dino_type)
-        new_dino.has_moved = True  # Le dinosaure vient d'être spawné
-        game_state.dinosaurs.append(new_dino)
+        # Créer un œuf de spawn (il éclora après SPAWN_EGG_TURNS fins de tour)
+        spawn_egg = SpawnEggState.new(x, y, game_state.current_player, dino_type)
+        game_state.spawn_eggs.append(spawn_egg)
+        if undo is not None:
+            undo.changes.append(('add_spawn_egg', spawn_egg))
+        game_state.spawn_action_done = True
+        
+        # Démarrer le cooldown du type (comme Game.spawn_dinosaur)
+        cooldowns = game_state.spawn_cooldowns
+        if undo is not None:
+            undo.changes.append(('cooldowns', cooldowns))
+        cooldowns = {p: dict(per_player) for p, per_player in cooldowns.items()}
+        cooldowns.setdefault(game_state.current_player, {})[dino_type] = SPAWN_COOLDOWNS[dino_type]
+        game_state.spawn_cooldowns = cooldowns
     
     @staticmethod
-    def _simulate_move(game_state, dinosaur, target_x, target_y):
+    def _simulate_move(game_state, dinosaur, target_x, target_y, undo=None):
         """Simule le déplacement d'un dinosaure"""
         # Trouver le dinosaure dans la copie
         for dino in game_state.dinosaurs:
             if (dino.x == dinosaur.x and dino.y == dinosaur.y and 
                 dino.player == dinosaur.player and dino.dino_type == dinosaur.dino_type):
+                if undo is not None:
+                    undo.save_dino(dino)
                 dino.x = target_x
                 dino.y = target_y
                 dino.has_moved = True
                 
                 # Vérifier les pièges
-                for trap in game_state.traps:
+                for i, trap in enumerate(game_state.traps):
                     if trap.x == target_x and trap.y == target_y and trap.player != dino.player:
-                        dino.take_damage(50)
-                        dino.immobilized_turns = 2
-                        game_state.traps.remove(trap)
+                        dino.take_damage(TRAP_DAMAGE)
+                        dino.immobilized_turns = TRAP_IMMOBILIZED_TURNS
+                        del game_state.traps[i]
+                        if undo is not None:
+                            undo.changes.append(('remove_trap', i, trap))
                         break
                 
                 # Retirer si mort
                 if dino.health <= 0:
-                    game_state.dinosaurs.remove(dino)
+                    GameSimulator._remove_dino(game_state, dino, undo)
                 break
     
     @staticmethod
-    def _simulate_attack(game_state, attacker, target, target_type):
+    def _simulate_attack(game_state, attacker, target, target_type, undo=None):
         """Simule une attaque"""
         # Trouver l'attaquant dans la copie
         att_copy = None
@@ -194,6 +392,9 @@ class GameSimulator:
         if target_type == 'egg':
             # Attaquer un œuf
             egg = game_state.eggs[target.player]
+            if undo is not None:
+                undo.changes.append(('egg', egg, egg.health))
+                undo.save_dino(att_copy)
             egg.take_damage(att_copy.attack_power)
             att_copy.has_moved = True
         else:
@@ -206,26 +407,69 @@ class GameSimulator:
                     break
             
             if def_copy:
+                if undo is not None:
+                    undo.save_dino(def_copy)
+                    undo.save_dino(att_copy)
                 def_copy.take_damage(att_copy.attack_power)
                 att_copy.has_moved = True
                 
                 # Retirer si mort et donner bonus
                 if def_copy.health <= 0:
-                    game_state.dinosaurs.remove(def_copy)
+                    GameSimulator._remove_dino(game_state, def_copy, undo)
                     if att_copy.player == 1:
-                        game_state.player1_steaks += 20
+                        game_state.player1_steaks += KILL_REWARD
                     else:
-                        game_state.player2_steaks += 20
+                        game_state.player2_steaks += KILL_REWARD
     
     @staticmethod
-    def _simulate_trap(game_state, x, y):
+    def _simulate_trap(game_state, x, y, undo=None):
         """Simule la pose d'un piège"""
-        trap = Trap(x, y, game_state.current_player)
+        trap = TrapState(x, y, game_state.current_player)
         game_state.traps.append(trap)
+        if undo is not None:
+            undo.changes.append(('add_trap', trap))
         
-        # Déduire le coût (si défini)
-        trap_cost = 30
+        # Déduire le coût
         if game_state.current_player == 1:
-            game_state.player1_steaks -= trap_cost
+            game_state.player1_steaks -= TRAP_COST
         else:
-            game_state.player2_steaks -= trap_cost
+            game_state.player2_steaks -= TRAP_COST
+    
+    @staticmethod
+    def _new_dino(x, y, player, dino_type):
+        """Crée un dinosaure simulé neuf (statistiques du type, sans entité pygame)"""
+        return DinoState.new(x, y, player, dino_type)
+    
+    @staticmethod
+    def _remove_dino(game_state, dino, undo=None):
+        """Retire un dinosaure mort de l'état"""
+        index = game_state.dinosaurs.index(dino)
+        del game_state.dinosaurs[index]
+        if undo is not None:
+            undo.changes.append(('remove_dino', index, dino))
+
+
+class UndoRecord:
+    """
+    Journal des modifications faites par GameSimulator.apply_action() ou simulate_end_turn()
+    
+    Les ressources, le joueur courant et le numéro de tour sont sauvegardés en
+    entier ; les entités modifiées, ajoutées ou retirées sont journalisées dans
+    changes, dans l'ordre où les modifications ont été faites.
+    """
+    
+    __slots__ = ('player1_steaks', 'player2_steaks', 'current_player', 'turn_number',
+                 'spawn_action_done', 'changes')
+    
+    def __init__(self, game_state):
+        self.player1_steaks = game_state.player1_steaks
+        self.player2_steaks = game_state.player2_steaks
+        self.current_player = game_state.current_player
+        self.turn_number = game_state.turn_number
+        self.spawn_action_done = game_state.spawn_action_done
+        self.changes = []
+    
+    def save_dino(self, dino):
+        """Sauvegarde les champs modifiables d'un dinosaure avant modification"""
+        self.changes.append(('dino', dino, (dino.x, dino.y, dino.health,
+                                            dino.has_moved, dino.immobilized_turns)))
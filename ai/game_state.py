@@ -0,0 +1,241 @@
+"""
+État de jeu compact pour la simulation de l'IA
+Structures à __slots__ sans pygame, clonables en O(n)
+"""
+
+from Entities.rules import (DINO_STATS, EGG_MAX_HEALTH, SPAWN_EGG_HEALTH, SPAWN_EGG_TURNS,
+                            STARTING_STEAKS)
+
+
+class EggState:
+    """Œuf principal simulé"""
+
+    __slots__ = ('x', 'y', 'player', 'health', 'max_health')
+
+    def __init__(self, x, y, player, health, max_health):
+        self.x = x
+        self.y = y
+        self.player = player
+        self.health = health
+        self.max_health = max_health
+
+    @classmethod
+    def from_entity(cls, egg):
+        """Crée l'œuf simulé à partir d'un œuf du jeu"""
+        return cls(egg.x, egg.y, egg.player, egg.health, egg.max_health)
+
+    def copy(self):
+        return EggState(self.x, self.y, self.player, self.health, self.max_health)
+
+    def take_damage(self, damage):
+        """L'œuf prend des dégâts"""
+        self.health = max(0, self.health - damage)
+
+
+class DinoState:
+    """Dinosaure simulé"""
+
+    __slots__ = ('x', 'y', 'player', 'dino_type', 'health', 'max_health',
+                 'attack_power', 'movement_range', 'has_moved', 'immobilized_turns')
+
+    def __init__(self, x, y, player, dino_type, health, max_health,
+                 attack_power, movement_range, has_moved, immobilized_turns):
+        self.x = x
+        self.y = y
+        self.player = player
+        self.dino_type = dino_type
+        self.health = health
+        self.max_health = max_health
+        self.attack_power = attack_power
+        self.movement_range = movement_range
+        self.has_moved = has_moved
+        self.immobilized_turns = immobilized_turns
+
+    @classmethod
+    def from_entity(cls, dino):
+        """Crée le dinosaure simulé à partir d'un dinosaure du jeu"""
+        return cls(dino.x, dino.y, dino.player, dino.dino_type, dino.health, dino.max_health,
+                   dino.attack_power, dino.movement_range, dino.has_moved, dino.immobilized_turns)
+
+    @classmethod
+    def new(cls, x, y, player, dino_type):
+        """Crée un dinosaure neuf avec les statistiques de son type"""
+        max_health, attack_power, movement_range = DINO_STATS[dino_type]
+        return cls(x, y, player, dino_type, max_health, max_health,
+                   attack_power, movement_range, False, 0)
+
+    def copy(self):
+        return DinoState(self.x, self.y, self.player, self.dino_type, self.health, self.max_health,
+                         self.attack_power, self.movement_range, self.has_moved,
+                         self.immobilized_turns)
+
+    def take_damage(self, damage):
+        """Le dinosaure prend des dégâts"""
+        self.health = max(0, self.health - damage)
+
+
+class TrapState:
+    """Piège simulé"""
+
+    __slots__ = ('x', 'y', 'player')
+
+    def __init__(self, x, y, player):
+        self.x = x
+        self.y = y
+        self.player = player
+
+    @classmethod
+    def from_entity(cls, trap):
+        """Crée le piège simulé à partir d'un piège du jeu"""
+        return cls(trap.x, trap.y, trap.player)
+
+    def copy(self):
+        return TrapState(self.x, self.y, self.player)
+
+
+class SpawnEggState:
+    """Œuf de spawn simulé"""
+
+    __slots__ = ('x', 'y', 'player', 'dino_type', 'health', 'max_health',
+                 'spawn_turns_required', 'spawn_turns_elapsed')
+
+    def __init__(self, x, y, player, dino_type, health, max_health,
+                 spawn_turns_required, spawn_turns_elapsed):
+        self.x = x
+        self.y = y
+        self.player = player
+        self.dino_type = dino_type
+        self.health = health
+        self.max_health = max_health
+        self.spawn_turns_required = spawn_turns_required
+        self.spawn_turns_elapsed = spawn_turns_elapsed
+
+    @classmethod
+    def from_entity(cls, spawn_egg):
+        """Crée l'œuf de spawn simulé à partir d'un œuf de spawn du jeu"""
+        return cls(spawn_egg.x, spawn_egg.y, spawn_egg.player, spawn_egg.dino_type,
+                   spawn_egg.health, spawn_egg.max_health,
+                   spawn_egg.spawn_turns_required, spawn_egg.spawn_turns_elapsed)
+
+    @classmethod
+    def new(cls, x, y, player, dino_type):
+        """Crée un œuf de spawn neuf (comme Game.spawn_dinosaur)"""
+        health = SPAWN_EGG_HEALTH[dino_type]
+        return cls(x, y, player, dino_type, health, health, SPAWN_EGG_TURNS[dino_type], 0)
+
+    def copy(self):
+        return SpawnEggState(self.x, self.y, self.player, self.dino_type, self.health,
+                             self.max_health, self.spawn_turns_required,
+                             self.spawn_turns_elapsed)
+
+    def take_damage(self, damage):
+        """L'œuf de spawn prend des dégâts"""
+        self.health = max(0, self.health - damage)
+
+
+class GameState:
+    """
+    État de jeu simulé, sans objet pygame
+
+    Les données immuables pendant une partie (grille, terrain compilé,
+    dimensions, cooldowns de la position racine) sont partagées par référence
+    entre les clones ;
+    seules les entités et les ressources sont recopiées.
+    """
+
+    __slots__ = ('logic_width', 'logic_height', 'grid', 'terrain', 'spawn_cooldowns',
+                 'eggs', 'dinosaurs', 'traps', 'spawn_eggs',
+                 'player1_steaks', 'player2_steaks', 'current_player', 'turn_number',
+                 'spawn_action_done')
+
+    # Nombre d'états créés (from_game / clone) depuis le lancement, pour les mesures
+    copies = 0
+
+    @classmethod
+    def from_game(cls, game):
+        """
+        Crée un état simulé à partir d'une instance du jeu
+
+        Args:
+            game: Instance du jeu (ou tout objet ayant les mêmes attributs)
+
+        Returns:
+            GameState: Nouvel état
+        """
+        GameState.copies += 1
+        state = cls.__new__(cls)
+        state.logic_width = game.logic_width
+        state.logic_height = game.logic_height
+        state.grid = getattr(game, 'grid', [])
+        state.terrain = getattr(game, 'terrain', None)
+        cooldowns = getattr(game, 'spawn_cooldowns', None)
+        state.spawn_cooldowns = ({p: dict(c) for p, c in cooldowns.items()}
+                                 if cooldowns is not None else {})
+        state.eggs = {p: EggState.from_entity(e) for p, e in game.eggs.items()}
+        state.dinosaurs = [DinoState.from_entity(d) for d in game.dinosaurs]
+        state.traps = [TrapState.from_entity(t) for t in game.traps]
+        state.spawn_eggs = [SpawnEggState.from_entity(s) for s in game.spawn_eggs]
+        state.player1_steaks = game.player1_steaks
+        state.player2_steaks = game.player2_steaks
+        state.current_player = game.current_player
+        state.turn_number = game.turn_number
+        state.spawn_action_done = getattr(game, 'spawn_action_done', False)
+        return state
+
+    @classmethod
+    def new_game(cls, logic_width, logic_height, grid, egg_positions, terrain=None):
+        """
+        Crée l'état de début de partie, sans instance du jeu
+
+        Args:
+            logic_width (int): Largeur du plateau
+            logic_height (int): Hauteur du plateau
+            grid (list): Grille logique de la carte
+            egg_positions (dict): Joueur -> position (x, y) de son œuf
+            terrain (TerrainMap): Terrain compilé (None = ni arbres ni boue)
+
+        Returns:
+            GameState: Nouvel état, joueur 1 au trait
+        """
+        state = cls.__new__(cls)
+        state.logic_width = logic_width
+        state.logic_height = logic_height
+        state.grid = grid
+        state.terrain = terrain
+        state.spawn_cooldowns = {p: {1: 0, 2: 0, 3: 0} for p in egg_positions}
+        state.eggs = {p: EggState(x, y, p, EGG_MAX_HEALTH, EGG_MAX_HEALTH)
+                      for p, (x, y) in egg_positions.items()}
+        state.dinosaurs = []
+        state.traps = []
+        state.spawn_eggs = []
+        state.player1_steaks = STARTING_STEAKS
+        state.player2_steaks = STARTING_STEAKS
+        state.current_player = 1
+        state.turn_number = 1
+        state.spawn_action_done = False
+        return state
+
+    def clone(self):
+        """
+        Copie l'état en O(n) (une allocation par entité, aucune recopie de grille)
+
+        Returns:
+            GameState: Copie indépendante de l'état
+        """
+        GameState.copies += 1
+        state = GameState.__new__(GameState)
+        state.logic_width = self.logic_width
+        state.logic_height = self.logic_height
+        state.grid = self.grid
+        state.terrain = self.terrain
+        state.spawn_cooldowns = self.spawn_cooldowns
+        state.eggs = {p: e.copy() for p, e in self.eggs.items()}
+        state.dinosaurs = [d.copy() for d in self.dinosaurs]
+        state.traps = [t.copy() for t in self.traps]
+        state.spawn_eggs = [s.copy() for s in self.spawn_eggs]
+        state.player1_steaks = self.player1_steaks
+        state.player2_steaks = self.player2_steaks
+        state.current_player = self.current_player
+        state.turn_number = self.turn_number
+        state.spawn_action_done = self.spawn_action_done
+        return state
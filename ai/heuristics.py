@@ -2,17 +2,82 @@
 Fonctions d'évaluation heuristique pour les états de jeu
 """
 
-def evaluate_state(game_state, ai_player):
+import json
+
+# Poids de l'évaluation réglés à la main (voir ai/tuner.py pour les optimiser)
+DEFAULT_WEIGHTS = {
+    'egg_health': 10,        # Par point de vie d'œuf
+    'dino': 50,              # Par dinosaure
+    'dino_health': 2,        # Par point de vie de dinosaure
+    'steaks': 0.5,           # Par steak
+    'attack_distance': 3,    # Pénalité par case entre mes dinosaures et l'œuf ennemi
+    'defense_distance': 2,   # Bonus par case entre les ennemis et mon œuf
+    'tank_bonus': 30,        # Tank à 2 cases ou moins de l'œuf ennemi
+}
+
+# Demi-périmètre du plateau classique (16x12), sur lequel les poids ont été réglés
+REFERENCE_BOARD_SPAN = 28
+
+
+def distance_scale(game_state):
+    """
+    Facteur appliqué aux poids de distance (attack_distance, defense_distance)
+
+    Les distances sont ramenées à l'échelle du plateau 16x12 (facteur 1) : sur
+    un plateau de 128x128, un dinosaure qui vient d'éclore près de son œuf
+    coûterait sinon plus que sa valeur (distance ~250 x 3 contre 50 + 2 x
+    vie) et l'IA cesserait de spawner.
+    """
+    return REFERENCE_BOARD_SPAN / (game_state.logic_width + game_state.logic_height)
+
+
+def resolve_weights(weights=None):
+    """
+    Retourne un jeu de poids complet
+
+    Args:
+        weights: None (poids par défaut), dict (partiel ou complet) ou chemin
+            d'un profil JSON écrit par save_weights()
+
+    Returns:
+        dict: Poids, les clés absentes prenant la valeur par défaut
+    """
+    if weights is None:
+        return DEFAULT_WEIGHTS
+    if isinstance(weights, str):
+        weights = load_weights(weights)
+    unknown = set(weights) - set(DEFAULT_WEIGHTS)
+    if unknown:
+        raise ValueError(f"Poids inconnus: {', '.join(sorted(unknown))}")
+    return {**DEFAULT_WEIGHTS, **weights}
+
+
+def load_weights(path):
+    """Charge un profil de poids (JSON : {"weights": {...}} ou directement {...})"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return resolve_weights(data.get('weights', data))
+
+
+def save_weights(path, weights, **info):
+    """Écrit un profil de poids chargeable par load_weights() (info : métadonnées libres)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'weights': resolve_weights(weights), **info}, f, indent=2)
+
+
+def evaluate_state(game_state, ai_player, weights=None):
     """
     Évalue un état de jeu du point de vue du joueur IA
     
     Args:
         game_state: État du jeu à évaluer
         ai_player (int): Numéro du joueur IA (1 ou 2)
+        weights (dict): Poids complets (voir resolve_weights), None = DEFAULT_WEIGHTS
         
     Returns:
         float: Score de l'état (plus élevé = meilleur pour l'IA)
     """
+    w = weights or DEFAULT_WEIGHTS
     score = 0
     enemy_player = 3 - ai_player
     
@@ -23,42 +88,197 @@ def evaluate_state(game_state, ai_player):
         return -100000  # Défaite !
     
     # 1. Santé des œufs (critère le plus important)
-    score += game_state.eggs[ai_player].health * 10
-    score -= game_state.eggs[enemy_player].health * 10
+    score += game_state.eggs[ai_player].health * w['egg_health']
+    score -= game_state.eggs[enemy_player].health * w['egg_health']
     
     # 2. Nombre et santé des dinosaures
     my_dinos = [d for d in game_state.dinosaurs if d.player == ai_player]
     enemy_dinos = [d for d in game_state.dinosaurs if d.player == enemy_player]
     
-    score += len(my_dinos) * 50
-    score -= len(enemy_dinos) * 50
+    score += len(my_dinos) * w['dino']
+    score -= len(enemy_dinos) * w['dino']
     
-    score += sum(d.health for d in my_dinos) * 2
-    score -= sum(d.health for d in enemy_dinos) * 2
+    score += sum(d.health for d in my_dinos) * w['dino_health']
+    score -= sum(d.health for d in enemy_dinos) * w['dino_health']
+    
+    # Œufs de spawn : comptés comme des dinosaures à venir, avec la vie de l'œuf
+    for spawn_egg in game_state.spawn_eggs:
+        value = w['dino'] + spawn_egg.health * w['dino_health']
+        if spawn_egg.player == ai_player:
+            score += value
+        elif spawn_egg.player == enemy_player:
+            score -= value
     
     # 3. Ressources (steaks) - léger bonus
     my_steaks = game_state.player1_steaks if ai_player == 1 else game_state.player2_steaks
     enemy_steaks = game_state.player1_steaks if enemy_player == 1 else game_state.player2_steaks
-    score += my_steaks * 0.5
-    score -= enemy_steaks * 0.5
+    score += my_steaks * w['steaks']
+    score -= enemy_steaks * w['steaks']
     
     # 4. Proximité à l'œuf ennemi (pression offensive)
+    scale = distance_scale(game_state)
     egg_enemy = game_state.eggs[enemy_player]
     for dino in my_dinos:
         distance = abs(dino.x - egg_enemy.x) + abs(dino.y - egg_enemy.y)
-        score -= distance * 3  # Récompenser proximité
+        score -= distance * (w['attack_distance'] * scale)  # Récompenser proximité
     
     # 5. Protection de mon œuf (distance ennemis → mon œuf)
     egg_my = game_state.eggs[ai_player]
     for dino in enemy_dinos:
         distance = abs(dino.x - egg_my.x) + abs(dino.y - egg_my.y)
-        score += distance * 2  # Pénaliser ennemis proches
+        score += distance * (w['defense_distance'] * scale)  # Pénaliser ennemis proches
     
     # 6. Bonus pour dinosaures de type fort près de l'objectif
     for dino in my_dinos:
         if dino.dino_type == 3:  # Tank
             dist_to_enemy_egg = abs(dino.x - egg_enemy.x) + abs(dino.y - egg_enemy.y)
             if dist_to_enemy_egg <= 2:
-                score += 30  # Bonus pour tank près de l'œuf ennemi
+                score += w['tank_bonus']  # Bonus pour tank près de l'œuf ennemi
     
     return score
+
+
+class IncrementalEvaluator:
+    """
+    Évaluation incrémentale, égale à evaluate_state() (aux arrondis près) mais en O(1)
+
+    Les sommes qui dépendent des dinosaures (nombre, santé, distances aux
+    œufs, tanks proches de l'œuf ennemi) et des œufs de spawn sont tenues à
+    jour à partir des enregistrements d'annulation de
+    GameSimulator.apply_action() ; les œufs et les steaks sont lus
+    directement dans l'état.
+
+    Utilisation dans une recherche make/unmake :
+        undo = GameSimulator.apply_action(state, action)
+        evaluator.push(undo)
+        ... evaluator.score(state) ...
+        evaluator.pop()
+        GameSimulator.undo_action(state, undo)
+    """
+
+    def __init__(self, game_state, ai_player, weights=None):
+        """
+        Args:
+            game_state: État de départ (les positions des œufs et la taille
+                du plateau ne changent pas)
+            ai_player (int): Numéro du joueur IA (1 ou 2)
+            weights (dict): Poids complets (voir resolve_weights), None = DEFAULT_WEIGHTS
+        """
+        w = weights or DEFAULT_WEIGHTS
+        scale = distance_scale(game_state)
+        self._w_egg = w['egg_health']
+        self._w_dino = w['dino']
+        self._w_health = w['dino_health']
+        self._w_steaks = w['steaks']
+        self._w_attack = w['attack_distance'] * scale
+        self._w_defense = w['defense_distance'] * scale
+        self._w_tank = w['tank_bonus']
+        self.ai_player = ai_player
+        self.enemy_player = 3 - ai_player
+        egg_my = game_state.eggs[ai_player]
+        egg_enemy = game_state.eggs[self.enemy_player]
+        self._my_egg_pos = (egg_my.x, egg_my.y)
+        self._enemy_egg_pos = (egg_enemy.x, egg_enemy.y)
+
+        # Partie du score due aux dinosaures, et sauvegardes pour pop()
+        self._dino_score = 0
+        self._stack = []
+        for dino in game_state.dinosaurs:
+            self._dino_score += self._contribution(dino.player, dino.dino_type,
+                                                   dino.x, dino.y, dino.health)
+        for spawn_egg in game_state.spawn_eggs:
+            self._dino_score += self._spawn_egg_contribution(spawn_egg)
+
+    def _contribution(self, player, dino_type, x, y, health):
+        """Part du score apportée par un dinosaure (termes 2, 4, 5 et 6)"""
+        if player == self.ai_player:
+            ex, ey = self._enemy_egg_pos
+            distance = abs(x - ex) + abs(y - ey)
+            value = self._w_dino + health * self._w_health - distance * self._w_attack
+            if dino_type == 3 and distance <= 2:
+                value += self._w_tank
+            return value
+        if player == self.enemy_player:
+            mx, my = self._my_egg_pos
+            return (-self._w_dino - health * self._w_health
+                    + (abs(x - mx) + abs(y - my)) * self._w_defense)
+        return 0
+
+    def _spawn_egg_contribution(self, spawn_egg):
+        """Part du score apportée par un œuf de spawn (terme 2)"""
+        value = self._w_dino + spawn_egg.health * self._w_health
+        if spawn_egg.player == self.ai_player:
+            return value
+        if spawn_egg.player == self.enemy_player:
+            return -value
+        return 0
+
+    def push(self, undo):
+        """
+        Met à jour les sommes après GameSimulator.apply_action()
+
+        Args:
+            undo (UndoRecord): Enregistrement retourné par apply_action()
+        """
+        self._stack.append(self._dino_score)
+        contribution = self._contribution
+        delta = 0
+        for change in undo.changes:
+            kind = change[0]
+            if kind == 'dino':
+                # Retirer l'ancienne version, ajouter la version courante
+                dino = change[1]
+                x, y, health = change[2][0], change[2][1], change[2][2]
+                delta -= contribution(dino.player, dino.dino_type, x, y, health)
+                delta += contribution(dino.player, dino.dino_type, dino.x, dino.y, dino.health)
+            elif kind == 'remove_dino':
+                dino = change[2]
+                delta -= contribution(dino.player, dino.dino_type, dino.x, dino.y, dino.health)
+            elif kind == 'add_dino':
+                dino = change[1]
+                delta += contribution(dino.player, dino.dino_type, dino.x, dino.y, dino.health)
+            elif kind == 'add_spawn_egg':
+                delta += self._spawn_egg_contribution(change[1])
+            elif kind == 'remove_spawn_egg':
+                delta -= self._spawn_egg_contribution(change[2])
+        self._dino_score += delta
+
+    def pop(self):
+        """Restaure les sommes d'avant le dernier push() (avant undo_action())"""
+        self._dino_score = self._stack.pop()
+
+    def score(self, game_state):
+        """
+        Score de l'état courant, égal à evaluate_state(game_state, ai_player)
+        aux arrondis près : l'égalité est exacte tant que tous les termes sont
+        des multiples de 0.5 (poids par défaut sur le plateau 16x12), pas avec
+        des poids réglés ou un autre distance_scale
+
+        Args:
+            game_state: État maintenu à jour par push() / pop()
+
+        Returns:
+            float: Score de l'état (plus élevé = meilleur pour l'IA)
+        """
+        ai_player, enemy_player = self.ai_player, self.enemy_player
+        egg_my_health = game_state.eggs[ai_player].health
+        egg_enemy_health = game_state.eggs[enemy_player].health
+
+        # Vérifier conditions de victoire/défaite
+        if egg_enemy_health <= 0:
+            return 100000
+        if egg_my_health <= 0:
+            return -100000
+
+        if ai_player == 1:
+            my_steaks, enemy_steaks = game_state.player1_steaks, game_state.player2_steaks
+        else:
+            my_steaks, enemy_steaks = game_state.player2_steaks, game_state.player1_steaks
+
+        # Avec les poids par défaut, tous les termes sont des multiples de 0.5 :
+        # l'ordre des additions ne change pas le résultat, identique à celui de
+        # evaluate_state() (avec des poids réglés, égal aux arrondis près)
+        score = egg_my_health * self._w_egg - egg_enemy_health * self._w_egg
+        score += my_steaks * self._w_steaks
+        score -= enemy_steaks * self._w_steaks
+        return score + self._dino_score
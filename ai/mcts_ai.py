@@ -0,0 +1,308 @@
+"""
+IA Monte-Carlo Tree Search (UCT)
+Construit un arbre de recherche par simulations successives, bornées en temps
+ou en nombre d'itérations, et le réutilise d'un tour à l'autre
+"""
+
+from ai.base_ai import BaseAI
+from ai.game_simulator import GameSimulator
+from ai.heuristics import evaluate_state, resolve_weights
+from logger import get_logger
+import math
+import random
+import time
+
+logger = get_logger("ai")
+
+
+class MCTSNode:
+    """
+    Nœud de l'arbre MCTS
+
+    Un nœud ne stocke pas d'état : il est reconstruit en rejouant les
+    signatures d'actions depuis la racine. Les statistiques (value / visits)
+    sont exprimées du point de vue du joueur qui a joué l'action menant au nœud.
+    """
+
+    __slots__ = ('parent', 'signature', 'player', 'children', 'untried', 'visits', 'value')
+
+    def __init__(self, parent, signature, player):
+        self.parent = parent
+        self.signature = signature  # Action menant à ce nœud (None pour la racine)
+        self.player = player        # Joueur qui a joué cette action
+        self.children = []
+        self.untried = None         # Signatures pas encore développées (calculées à la 1re visite)
+        self.visits = 0
+        self.value = 0.0
+
+    def uct_child(self, exploration):
+        """Sélectionne l'enfant qui maximise le critère UCT"""
+        log_visits = math.log(self.visits)
+        best, best_score = None, float('-inf')
+        for child in self.children:
+            score = (child.value / child.visits
+                     + exploration * math.sqrt(log_visits / child.visits))
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+
+class MCTSAI(BaseAI):
+    """IA Monte-Carlo Tree Search avec sélection UCT et playouts légers"""
+
+    def __init__(self, player, verbose=False, time_budget_ms=1000, max_iterations=None,
+                 exploration=1.4, playout_depth=6, playout_policy='heuristic',
+                 eval_scale=400.0, reuse_tree=True, weights=None):
+        """
+        Initialise l'IA MCTS
+
+        Args:
+            player (int): Numéro du joueur (1 ou 2)
+            verbose (bool): Afficher les logs de décision
+            time_budget_ms (int): Budget de temps par décision (en millisecondes)
+            max_iterations (int): Nombre max d'itérations par décision (None = illimité)
+            exploration (float): Constante d'exploration UCT
+            playout_depth (int): Nombre de tours (action + fin de tour) simulés par playout
+            playout_policy (str): 'random' (uniforme) ou 'heuristic' (attaques d'abord)
+            eval_scale (float): Échelle de conversion du score heuristique en probabilité de victoire
+            reuse_tree (bool): Conserver le sous-arbre joué d'un tour à l'autre
+            weights: Poids de l'évaluation (dict ou chemin d'un profil JSON, None = par défaut)
+        """
+        super().__init__(player)
+        self.verbose = verbose
+        self.time_budget_ms = time_budget_ms
+        self.max_iterations = max_iterations
+        self.exploration = exploration
+        self.playout_depth = playout_depth
+        self.playout_policy = playout_policy
+        self.eval_scale = eval_scale
+        self.reuse_tree = reuse_tree
+        self.weights = resolve_weights(weights)
+
+        # Sous-arbre conservé après la dernière décision
+        self._root = None
+        self._root_state = None
+
+        # Statistiques de la dernière décision
+        self.stats = {'iterations': 0, 'rollouts_per_sec': 0.0, 'time_ms': 0.0, 'evaluations': 0,
+                      'root_visits': 0, 'reused_visits': 0, 'best_visits': 0, 'win_rate': 0.0}
+        self._evaluations = 0
+
+    def choose_action(self, game):
+        """
+        Choisit une action par MCTS
+
+        Les itérations (sélection, expansion, playout, rétropropagation) se
+        succèdent jusqu'à épuisement du budget ; l'action retournée est la plus
+        visitée à la racine.
+
+        Args:
+            game: Instance du jeu
+
+        Returns:
+            dict: Action à effectuer
+        """
+        start = time.perf_counter()
+        state = GameSimulator.copy_game_state(game)
+        state.current_player = self.player
+
+        root = self._reuse_root(state) if self.reuse_tree else None
+        if root is None:
+            root = MCTSNode(None, None, self.enemy_player)
+        reused_visits = root.visits
+
+        deadline = start + self.time_budget_ms / 1000.0
+        iterations = 0
+        self._evaluations = 0
+        while not self.stop_event.is_set():
+            if self.max_iterations is not None and iterations >= self.max_iterations:
+                break
+            if time.perf_counter() >= deadline:
+                break
+            self._iterate(root, state)
+            iterations += 1
+            # Une seule action possible : inutile de chercher
+            if root.untried == [] and len(root.children) <= 1:
+                break
+
+        elapsed = time.perf_counter() - start
+        best = max(root.children, key=lambda c: c.visits) if root.children else None
+        action = GameSimulator.action_from_signature(state, best.signature) if best else None
+        if action is not None and action['type'] == 'pass':
+            action = None  # Comme SearchAI : passer revient à terminer le tour
+
+        self.stats = {
+            'iterations': iterations,
+            'rollouts_per_sec': iterations / elapsed if elapsed > 0 else 0.0,
+            'time_ms': elapsed * 1000.0,
+            'evaluations': self._evaluations,
+            'root_visits': root.visits,
+            'reused_visits': reused_visits,
+            'best_visits': best.visits if best else 0,
+            'win_rate': best.value / best.visits if best and best.visits else 0.0
+        }
+
+        # Conserver le sous-arbre de l'action jouée pour le tour suivant
+        if action is not None and self.reuse_tree:
+            # Sur une copie : l'action retournée référence les entités de state
+            next_state = GameSimulator.copy_game_state(state)
+            self._play(next_state, GameSimulator.action_from_signature(next_state, best.signature))
+            best.parent = None
+            self._root, self._root_state = best, next_state
+        else:
+            self._root, self._root_state = None, None
+
+        if self.verbose and action:
+            logger.info(f"IA MCTS joueur {self.player}: {action['type']} "
+                        f"({iterations} simulations, {self.stats['rollouts_per_sec']:.0f}/s, "
+                        f"victoire estimée {self.stats['win_rate']:.2f}, "
+                        f"{self.stats['time_ms']:.0f} ms)")
+        return action
+
+    def _iterate(self, root, state):
+        """Une itération MCTS complète ; state est restauré à la fin"""
+        node = root
+        undos = []
+        try:
+            # 1. Sélection : descendre tant que le nœud est entièrement développé
+            while not self._is_terminal(state):
+                if node.untried is None:
+                    node.untried = self._untried_signatures(state, node)
+                if node.untried or not node.children:
+                    break
+                child = node.uct_child(self.exploration)
+                state.current_player = child.player
+                action = GameSimulator.action_from_signature(state, child.signature)
+                if action is None:
+                    # Action devenue illégale (arbre réutilisé) : l'oublier
+                    node.children.remove(child)
+                    continue
+                undos.extend(self._play(state, action))
+                node = child
+
+            # 2. Expansion : ajouter un enfant non exploré
+            if not self._is_terminal(state) and node.untried:
+                signature = node.untried.pop()
+                mover = 3 - node.player
+                state.current_player = mover
+                action = GameSimulator.action_from_signature(state, signature)
+                if action is not None:
+                    undos.extend(self._play(state, action))
+                    child = MCTSNode(node, signature, mover)
+                    node.children.append(child)
+                    node = child
+
+            # 3. Playout depuis le nouveau nœud
+            reward = self._playout(state, 3 - node.player)
+        finally:
+            for undo in reversed(undos):
+                GameSimulator.undo_action(state, undo)
+
+        # 4. Rétropropagation (récompense du point de vue de chaque joueur)
+        while node is not None:
+            node.visits += 1
+            node.value += reward if node.player == self.player else 1.0 - reward
+            node = node.parent
+
+    def _untried_signatures(self, state, node):
+        """Signatures des actions légales au nœud, hors enfants déjà développés"""
+        mover = 3 - node.player
+        state.current_player = mover
+        actions = self.generate_actions(state, mover)
+        # Ne jamais passer, sauf s'il n'y a rien d'autre à faire
+        if len(actions) > 1:
+            actions = [a for a in actions if a['type'] != 'pass']
+        expanded = {child.signature for child in node.children}
+        signatures = [GameSimulator.action_signature(a) for a in actions]
+        signatures = [s for s in signatures if s not in expanded]
+        random.shuffle(signatures)
+        return signatures
+
+    def _playout(self, state, player):
+        """
+        Simule playout_depth actions puis évalue la position
+
+        Returns:
+            float: Probabilité de victoire estimée pour l'IA (entre 0 et 1)
+        """
+        undos = []
+        try:
+            for _ in range(self.playout_depth):
+                if self._is_terminal(state):
+                    break
+                state.current_player = player
+                action = self._playout_action(self.generate_actions(state, player))
+                undos.extend(self._play(state, action or {'type': 'pass'}))
+                player = 3 - player
+            return self._reward(state)
+        finally:
+            for undo in reversed(undos):
+                GameSimulator.undo_action(state, undo)
+
+    def _playout_action(self, actions):
+        """Choisit l'action d'un playout selon la politique configurée"""
+        actions = [a for a in actions if a['type'] != 'pass']
+        if not actions:
+            return None
+        if self.playout_policy == 'heuristic':
+            # Attaquer l'œuf si possible, sinon attaquer le plus souvent possible
+            attacks = [a for a in actions if a['type'] == 'attack']
+            egg_attacks = [a for a in attacks if a.get('target_type') == 'egg']
+            if egg_attacks:
+                return random.choice(egg_attacks)
+            if attacks and random.random() < 0.8:
+                return random.choice(attacks)
+        return random.choice(actions)
+
+    def _reward(self, state):
+        """Convertit l'évaluation heuristique en probabilité de victoire"""
+        self._evaluations += 1
+        score = evaluate_state(state, self.player, self.weights)
+        if score >= 100000:
+            return 1.0
+        if score <= -100000:
+            return 0.0
+        return 1.0 / (1.0 + math.exp(-score / self.eval_scale))
+
+    @staticmethod
+    def _play(state, action):
+        """Joue une action puis la fin de tour ; retourne les annulations"""
+        return (GameSimulator.apply_action(state, action),
+                GameSimulator.simulate_end_turn(state))
+
+    @staticmethod
+    def _is_terminal(state):
+        return state.eggs[1].health <= 0 or state.eggs[2].health <= 0
+
+    def _reuse_root(self, state):
+        """
+        Retrouve dans l'arbre précédent le nœud correspondant à l'état actuel
+
+        L'adversaire a joué depuis la dernière décision : on cherche, parmi ses
+        réponses développées, celle qui mène au même plateau (positions, santé,
+        pièges). Les ressources et les cooldowns sont ignorés : dans le jeu, les
+        cooldowns s'écoulent en temps réel.
+
+        Returns:
+            MCTSNode: Nouvelle racine, ou None si aucune réponse ne correspond
+        """
+        old_root, old_state = self._root, self._root_state
+        self._root = self._root_state = None
+        if old_root is None:
+            return None
+
+        target = GameSimulator.board_key(state)
+        for child in old_root.children:
+            old_state.current_player = child.player
+            action = GameSimulator.action_from_signature(old_state, child.signature)
+            if action is None:
+                continue
+            undos = self._play(old_state, action)
+            matches = GameSimulator.board_key(old_state) == target
+            for undo in reversed(undos):
+                GameSimulator.undo_action(old_state, undo)
+            if matches:
+                child.parent = None
+                child.untried = None  # Les actions légales ont pu changer
+                return child
+        return None
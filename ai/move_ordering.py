@@ -0,0 +1,123 @@
+"""
+Ordonnancement des coups pour les recherches alpha-beta
+Heuristiques peu coûteuses (captures, coups killer, table d'historique)
+qui remplacent la pré-évaluation de chaque enfant
+"""
+
+from ai.game_simulator import GameSimulator
+
+# Priorités des catégories de coups (les scores d'historique restent en dessous)
+TT_MOVE = 10_000_000
+EGG_ATTACK = 4_000_000
+KILLING_ATTACK = 3_000_000
+ATTACK = 2_000_000
+KILLER = 1_000_000
+
+
+class MoveOrderer:
+    """
+    Trie les actions d'un nœud pour provoquer les coupures alpha-beta au plus tôt
+
+    Ordre : coup de la table de transposition, attaques de l'œuf, attaques
+    qui tuent, autres attaques, coups killer du même niveau, puis les autres
+    coups selon leur score d'historique. Utilisable par toute recherche de
+    ai/ : il suffit d'appeler order() avant d'explorer les enfants, puis
+    record_cutoff() / record_no_cutoff() après.
+    """
+
+    def __init__(self, killers_per_ply=2):
+        """
+        Args:
+            killers_per_ply (int): Nombre de coups killer mémorisés par niveau
+        """
+        self.killers_per_ply = killers_per_ply
+        self.killers = {}   # niveau -> [signatures]
+        self.history = {}   # signature -> score
+
+        # Compteurs pour mesurer la qualité de l'ordonnancement
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.no_cutoffs = 0
+
+    def new_search(self):
+        """Début d'une nouvelle décision : oublie les killers, vieillit l'historique"""
+        self.killers = {}
+        self.history = {sig: score // 2 for sig, score in self.history.items() if score > 1}
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.no_cutoffs = 0
+
+    def score(self, action, signature, ply):
+        """Score d'ordonnancement d'une action (plus élevé = exploré plus tôt)"""
+        if action['type'] == 'attack':
+            if action.get('target_type') == 'egg':
+                return EGG_ATTACK
+            attacker, target = action['attacker'], action['target']
+            # Victime la plus précieuse d'abord
+            if target.health <= attacker.attack_power:
+                return KILLING_ATTACK + target.max_health
+            return ATTACK + attacker.attack_power
+        killers = self.killers.get(ply)
+        if killers and signature in killers:
+            return KILLER - killers.index(signature)
+        return self.history.get(signature, 0)
+
+    def order(self, actions, ply, tt_move=None):
+        """
+        Trie les actions d'un nœud
+
+        Args:
+            actions (list): Actions légales
+            ply (int): Niveau du nœud depuis la racine
+            tt_move (tuple): Signature du meilleur coup mémorisé (ou None)
+
+        Returns:
+            list: Nouvelle liste triée
+        """
+        scored = []
+        for i, action in enumerate(actions):
+            signature = GameSimulator.action_signature(action)
+            if signature == tt_move:
+                score = TT_MOVE
+            else:
+                score = self.score(action, signature, ply)
+            # L'indice garde le tri stable et évite de comparer les dicts
+            scored.append((-score, i, action))
+        scored.sort()
+        return [action for _, _, action in scored]
+
+    def record_cutoff(self, action, ply, depth, move_index):
+        """
+        Enregistre une coupure beta provoquée par action
+
+        Args:
+            action (dict): Coup ayant provoqué la coupure
+            ply (int): Niveau du nœud
+            depth (int): Profondeur restante au nœud
+            move_index (int): Rang du coup dans l'ordre exploré
+        """
+        self.cutoffs += 1
+        if move_index == 0:
+            self.first_move_cutoffs += 1
+        if action['type'] == 'attack':
+            return  # Les attaques sont déjà ordonnées en premier
+
+        signature = GameSimulator.action_signature(action)
+        killers = self.killers.setdefault(ply, [])
+        if signature not in killers:
+            killers.insert(0, signature)
+            del killers[self.killers_per_ply:]
+        self.history[signature] = self.history.get(signature, 0) + depth * depth
+
+    def record_no_cutoff(self):
+        """Enregistre un nœud dont tous les enfants ont été explorés"""
+        self.no_cutoffs += 1
+
+    def cutoff_rate(self):
+        """Proportion des nœuds internes qui ont provoqué une coupure"""
+        nodes = self.cutoffs + self.no_cutoffs
+        return self.cutoffs / nodes if nodes else 0.0
+
+    def first_move_cutoff_rate(self):
+        """Proportion des coupures obtenues dès le premier coup exploré"""
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
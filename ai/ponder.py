@@ -0,0 +1,143 @@
+"""
+Réflexion anticipée de l'IA pendant le tour du joueur humain (pondering)
+Prépare en arrière-plan les réponses aux coups humains les plus probables
+"""
+
+import threading
+from ai.game_simulator import GameSimulator
+from ai.heuristics import evaluate_state
+from logger import get_logger
+
+logger = get_logger("ai")
+
+
+class Ponderer:
+    """
+    Cherche à l'avance la réponse de l'IA aux coups probables de l'adversaire
+
+    Pendant le tour humain, un thread classe les coups de l'adversaire
+    (évaluation à un coup de son point de vue), puis lance choose_action()
+    de l'IA sur la position attendue après chacun d'eux, du plus probable au
+    moins probable. Les réponses sont mises en cache par clé de plateau
+    (GameSimulator.board_key). Au tour de l'IA, lookup() rend la réponse
+    préparée si la position réelle a été prévue et que l'action est toujours
+    légale. Le thread ne travaille que sur un instantané (GameState) et
+    s'arrête dès que stop() est appelé.
+    """
+
+    def __init__(self, ai, max_replies=6, verbose=False):
+        """
+        Args:
+            ai (BaseAI): IA dont on prépare les réponses
+            max_replies (int): Nombre de coups adverses anticipés
+            verbose (bool): Afficher les logs de pondering
+        """
+        self.ai = ai
+        self.max_replies = max_replies
+        self.verbose = verbose
+        self._thread = None
+        self._cache = {}  # clé de plateau -> signature de la réponse
+
+        # Statistiques (cumulées sur la partie)
+        self.prepared = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def active(self):
+        """True si le pondering est en cours"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, snapshot):
+        """
+        Démarre le pondering sur un instantané pris au début du tour adverse
+
+        Args:
+            snapshot (GameState): État figé, l'adversaire de l'IA au trait
+        """
+        self.stop()
+        self._cache = {}
+        self.ai.stop_event.clear()
+        self._thread = threading.Thread(target=self._run, args=(snapshot,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Interrompt le pondering et attend la fin du thread ; le cache est conservé"""
+        if self._thread is not None:
+            if self._thread.is_alive():
+                self.ai.request_stop()
+                self._thread.join()
+                # Plus personne n'utilise l'IA : elle peut de nouveau réfléchir
+                self.ai.stop_event.clear()
+            self._thread = None
+
+    def lookup(self, game_state):
+        """
+        Retourne la réponse préparée pour la position actuelle, si elle existe
+
+        Args:
+            game_state (GameState): Position réelle au début du tour de l'IA
+
+        Returns:
+            dict: Action légale sur game_state, ou None
+        """
+        signature = self._cache.get(GameSimulator.board_key(game_state))
+        action = None
+        if signature is not None:
+            game_state.current_player = self.ai.player
+            legal = {GameSimulator.action_signature(a)
+                     for a in self.ai.generate_actions(game_state, self.ai.player)}
+            if signature in legal:
+                action = GameSimulator.action_from_signature(game_state, signature)
+
+        if action is not None:
+            self.hits += 1
+            if self.verbose:
+                logger.info(f"Pondering: réponse préparée jouée ({action['type']})")
+        else:
+            self.misses += 1
+        return action
+
+    def _run(self, snapshot):
+        try:
+            for reply in self._likely_replies(snapshot):
+                if self.ai.stop_event.is_set():
+                    break
+                state = GameSimulator.copy_game_state(snapshot)
+                state.current_player = self.ai.enemy_player
+                GameSimulator.simulate_action(state, reply)
+                GameSimulator.simulate_end_turn(state)
+                key = GameSimulator.board_key(state)
+                if key in self._cache:
+                    continue
+
+                action = self.ai.choose_action(state)
+                # Une recherche interrompue ne donne pas une réponse fiable
+                if self.ai.stop_event.is_set():
+                    break
+                if action is not None:
+                    self._cache[key] = GameSimulator.action_signature(action)
+                    self.prepared += 1
+        except Exception as e:
+            logger.error(f"Erreur pondering: {e}")
+
+    def _likely_replies(self, snapshot):
+        """Coups adverses classés du plus au moins probable (plus passer son tour)"""
+        opponent = self.ai.enemy_player
+        state = GameSimulator.copy_game_state(snapshot)
+        state.current_player = opponent
+        scored = []
+        for action in self.ai.generate_actions(state, opponent):
+            if self.ai.stop_event.is_set():
+                return []
+            if action['type'] == 'pass':
+                continue
+            undo = GameSimulator.apply_action(state, action)
+            scored.append((evaluate_state(state, opponent, getattr(self.ai, 'weights', None)),
+                           len(scored), action))
+            GameSimulator.undo_action(state, undo)
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        replies = [action for _, _, action in scored[:self.max_replies]]
+        # L'adversaire peut aussi terminer son tour sans agir
+        replies.append({'type': 'pass'})
+        return replies
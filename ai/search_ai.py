@@ -1,32 +1,136 @@
 """
-IA avec recherche à profondeur 2 (Minimax simplifié)
-Anticipe les réponses de l'adversaire pour prendre des décisions robustes
+IA avec recherche alpha-beta à approfondissement itératif
+Anticipe les réponses de l'adversaire aussi loin que le budget de temps le permet
 """
 
 from ai.base_ai import BaseAI
 from ai.game_simulator import GameSimulator
-from ai.heuristics import evaluate_state
+from ai.heuristics import IncrementalEvaluator, resolve_weights
+from ai.zobrist import ZobristHasher, TranspositionTable, EXACT, LOWER, UPPER
+from ai.move_ordering import MoveOrderer
+from ai.endgame import EndgameSolver, WIN
+from logger import get_logger
+from concurrent.futures import ProcessPoolExecutor
+import os
 import random
+import time
+
+logger = get_logger("ai")
+
+
+class SearchTimeout(Exception):
+    """Levée quand le budget de temps de la recherche est épuisé"""
+    pass
+
+
+# IA des processus du pool, conservées d'un tour à l'autre (table de transposition)
+_worker_ais = {}
+
+
+def _search_root_chunk(params, state, root_actions, budget_ms):
+    """
+    Tâche exécutée dans un processus du pool : cherche une part des actions racines
+    
+    Args:
+        params (tuple): (player, max_enemy_responses, max_depth, tt_size_bits, poids triés)
+        state (GameState): État racine (sans pygame)
+        root_actions (list): Actions racines confiées à ce processus
+        budget_ms (float): Temps restant pour la décision
+        
+    Returns:
+        tuple: (historique [(profondeur, score, index dans root_actions)],
+                nœuds, évaluations, succès TT, échecs TT, coupures, nœuds sans coupure)
+    """
+    ai = _worker_ais.get(params)
+    if ai is None:
+        player, max_enemy_responses, max_depth, tt_size_bits, weights = params
+        ai = SearchAI(player, max_enemy_responses=max_enemy_responses,
+                      max_depth=max_depth, tt_size_bits=tt_size_bits, weights=dict(weights))
+        _worker_ais[params] = ai
+    
+    ai._deadline = time.perf_counter() + budget_ms / 1000.0
+    ai._nodes = 0
+    ai._evaluations = 0
+    ai.tt.new_search()
+    ai.orderer.new_search()
+    hits, misses = ai.tt.hits, ai.tt.misses
+    
+    order = list(root_actions)
+    history = ai._iterative_deepening(state, order)
+    history = [(depth, score, root_actions.index(action)) for depth, score, action in history]
+    return (history, ai._nodes, ai._evaluations, ai.tt.hits - hits, ai.tt.misses - misses,
+            ai.orderer.cutoffs, ai.orderer.no_cutoffs)
+
 
 class SearchAI(BaseAI):
-    """IA avec recherche à profondeur 2 (Minimax simplifié)"""
+    """IA alpha-beta à approfondissement itératif (anytime, bornée en temps)"""
     
-    def __init__(self, player, max_enemy_responses=8, verbose=False):
+    def __init__(self, player, max_enemy_responses=8, verbose=False, time_budget_ms=1000, max_depth=6,
+                 tt_size_bits=18, workers=1, weights=None, endgame_pieces=4, endgame_egg_health=60,
+                 endgame_share=0.25):
         """
         Initialise l'IA de recherche
         
         Args:
             player (int): Numéro du joueur (1 ou 2)
-            max_enemy_responses (int): Nombre max de réponses ennemies à évaluer
+            max_enemy_responses (int): Nombre max de réponses évaluées par nœud interne
             verbose (bool): Afficher les logs de décision
+            time_budget_ms (int): Budget de temps par décision (en millisecondes)
+            max_depth (int): Profondeur maximale de l'approfondissement itératif
+            tt_size_bits (int): Taille de la table de transposition (2**tt_size_bits entrées)
+            workers (int): Nombre de processus pour la recherche parallèle à la racine
+                (1 = recherche séquentielle, 0 = un processus par cœur)
+            weights: Poids de l'évaluation (dict ou chemin d'un profil JSON, None = par défaut)
+            endgame_pieces (int): Solveur exact de fin de partie s'il reste au plus ce
+                nombre de dinosaures et d'œufs de spawn, dont un près de l'œuf
+                adverse (None = solveur désactivé)...
+            endgame_egg_health (int): ... ou si un œuf a au plus cette santé
+            endgame_share (float): Part du budget de temps confiée au solveur
         """
         super().__init__(player)
         self.max_enemy_responses = max_enemy_responses
         self.verbose = verbose
+        self.time_budget_ms = time_budget_ms
+        self.max_depth = max_depth
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.weights = resolve_weights(weights)
+        
+        # Pool de processus (recherche parallèle), réutilisé d'un tour à l'autre
+        self._executor = None
+        self._worker_tt_hits = 0
+        self._worker_tt_misses = 0
+        self._worker_cutoffs = 0
+        self._worker_no_cutoffs = 0
+        
+        # Table de transposition conservée d'un tour à l'autre
+        self.hasher = ZobristHasher()
+        self.tt = TranspositionTable(tt_size_bits)
+        
+        # Ordonnancement des coups (killers, historique) conservé d'un tour à l'autre
+        self.orderer = MoveOrderer()
+        
+        # Solveur exact de fin de partie (sa table de preuves est conservée)
+        self.endgame_share = endgame_share
+        self.endgame = (EndgameSolver(self, endgame_pieces, endgame_egg_health)
+                        if endgame_pieces is not None else None)
+        
+        # Statistiques de la dernière décision
+        self.stats = {'nodes': 0, 'depth': 0, 'score': 0, 'time_ms': 0.0, 'nodes_per_sec': 0.0,
+                      'evaluations': 0, 'tt_hits': 0, 'tt_misses': 0, 'cutoff_rate': 0.0,
+                      'proven': None, 'proof_plies': None, 'endgame_nodes': 0}
+        self._deadline = None
+        self._root_depth = 0
+        self._evaluator = None
+        self._nodes = 0
+        self._evaluations = 0
     
     def choose_action(self, game):
         """
-        Choisit la meilleure action en simulant profondeur 2
+        Choisit la meilleure action par alpha-beta à approfondissement itératif
+        
+        La recherche est relancée à profondeur 1, 2, 3... tant que le budget de
+        temps le permet ; l'action retournée est celle de la dernière itération
+        complète.
         
         Args:
             game: Instance du jeu
@@ -34,245 +138,338 @@ class SearchAI(BaseAI):
         Returns:
             dict: Action à effectuer
         """
+        start = time.perf_counter()
+        
+        # Toute la recherche se fait sur une copie sans pygame (sérialisable)
+        state = GameSimulator.copy_game_state(game)
+        state.current_player = self.player
+        
         # Générer toutes les actions possibles
-        possible_actions = self.generate_actions(game, self.player)
+        possible_actions = self.generate_actions(state, self.player)
         
-        if not possible_actions or len(possible_actions) == 0:
+        # Filtrer l'action "pass" - l'IA ne passe jamais son tour
+        root_actions = [a for a in possible_actions if a['type'] != 'pass']
+        if not root_actions:
             return None  # Aucune action possible
         
-        # Filtrer l'action "pass" - l'IA ne passe jamais son tour
-        non_pass_actions = [a for a in possible_actions if a['type'] != 'pass']
-        if non_pass_actions:
-            possible_actions = non_pass_actions
+        # Mélanger une fois pour briser les égalités (remplace le bruit aléatoire)
+        random.shuffle(root_actions)
+        
+        # Fin de partie : une victoire prouvée dispense de la recherche heuristique.
+        # Une défaite prouvée ne la remplace pas : le solveur explore aussi "pass"
+        # et peut le retenir, alors que l'IA ne passe jamais son tour
+        proven = proof_plies = None
+        if self.endgame is not None and self.endgame.applies(state):
+            proven, action, proof_plies = self.endgame.solve(
+                state, self.player, self.time_budget_ms * self.endgame_share)
+            if proven == WIN and action is not None and action['type'] != 'pass':
+                return self._proven_action(start, action, proof_plies)
+        
+        self._deadline = start + self.time_budget_ms / 1000.0
+        self._nodes = 0
+        self._evaluations = 0
+        self.tt.new_search()
+        self.orderer.new_search()
+        tt_hits, tt_misses = self.tt.hits, self.tt.misses
+        
+        if self.workers > 1 and len(root_actions) > 1:
+            best_action, best_score, completed_depth = self._parallel_search(state, root_actions)
         else:
-            # Si seulement l'action pass existe, retourner None
-            return None
+            history = self._iterative_deepening(state, root_actions)
+            if history:
+                completed_depth, best_score, best_action = history[-1]
+            else:
+                completed_depth, best_score, best_action = 0, None, root_actions[0]
+            self._worker_tt_hits = self._worker_tt_misses = 0
+            self._worker_cutoffs = self._worker_no_cutoffs = 0
         
-        best_action = None
-        best_score = float('-inf')
+        cutoffs = self.orderer.cutoffs + self._worker_cutoffs
+        no_cutoffs = self.orderer.no_cutoffs + self._worker_no_cutoffs
+        elapsed = time.perf_counter() - start
+        self.stats = {
+            'nodes': self._nodes,
+            'depth': completed_depth,
+            'score': best_score,
+            'time_ms': elapsed * 1000.0,
+            'nodes_per_sec': self._nodes / elapsed if elapsed > 0 else 0.0,
+            'evaluations': self._evaluations,
+            'tt_hits': self.tt.hits - tt_hits + self._worker_tt_hits,
+            'tt_misses': self.tt.misses - tt_misses + self._worker_tt_misses,
+            'cutoff_rate': cutoffs / (cutoffs + no_cutoffs) if cutoffs + no_cutoffs else 0.0,
+            'proven': proven,
+            'proof_plies': proof_plies,
+            'endgame_nodes': self.endgame.nodes if self.endgame is not None else 0
+        }
+        if self.verbose:
+            logger.info(f"IA joueur {self.player}: {best_action['type']} "
+                        f"(profondeur {completed_depth}, score {best_score}, "
+                        f"{self._nodes} nœuds, {self.stats['time_ms']:.0f} ms)")
         
-        # Évaluer chaque action
-        for action in possible_actions:
-            # Simuler mon action
-            sim_state = GameSimulator.copy_game_state(game)
-            GameSimulator.simulate_action(sim_state, action)
-            
-            # Générer les réponses ennemies possibles
-            enemy_actions = self.generate_actions(sim_state, self.enemy_player)
-            
-            # Limiter le nombre de réponses à évaluer (pour performance)
-            if len(enemy_actions) > self.max_enemy_responses:
-                enemy_actions = self.sample_best_actions(
-                    sim_state, enemy_actions, self.max_enemy_responses
-                )
-            
-            # Évaluer le pire cas (adversaire joue optimal)
-            min_score = float('inf')
+        return best_action
+    
+    def _proven_action(self, start, action, plies):
+        """Termine la décision avec le coup gagnant du solveur de fin de partie"""
+        elapsed = time.perf_counter() - start
+        nodes = self.endgame.nodes
+        self.stats = {
+            'nodes': nodes,
+            'depth': plies,
+            'score': None,
+            'time_ms': elapsed * 1000.0,
+            'nodes_per_sec': nodes / elapsed if elapsed > 0 else 0.0,
+            'evaluations': 0,
+            'tt_hits': 0,
+            'tt_misses': 0,
+            'cutoff_rate': 0.0,
+            'proven': WIN,
+            'proof_plies': plies,
+            'endgame_nodes': nodes
+        }
+        if self.verbose:
+            logger.info(f"IA joueur {self.player}: victoire prouvée en {plies} tours "
+                        f"({nodes} nœuds, {self.stats['time_ms']:.0f} ms)")
+        return action
+    
+    def _iterative_deepening(self, state, root_actions):
+        """
+        Approfondissement itératif sur une liste d'actions racines
+        
+        L'ordre de root_actions est modifié : le meilleur coup d'une itération
+        est exploré en premier à la suivante.
+        
+        Returns:
+            list: (profondeur, score, action) pour chaque itération complète
+        """
+        history = []
+        for depth in range(1, self.max_depth + 1):
+            try:
+                score, action = self._search_root(state, root_actions, depth)
+            except SearchTimeout:
+                break
             
-            if not enemy_actions or len(enemy_actions) == 0:
-                # Si l'ennemi n'a pas d'actions, évaluer l'état directement
-                min_score = evaluate_state(sim_state, self.player)
-            else:
-                for enemy_action in enemy_actions:
-                    sim_state2 = GameSimulator.copy_game_state(sim_state)
-                    GameSimulator.simulate_action(sim_state2, enemy_action)
-                    
-                    score = evaluate_state(sim_state2, self.player)
-                    min_score = min(min_score, score)
+            history.append((depth, score, action))
             
-            # Ajouter un petit bruit aléatoire pour briser les égalités
-            min_score += random.uniform(-0.1, 0.1)
+            # Explorer d'abord le meilleur coup à l'itération suivante
+            root_actions.remove(action)
+            root_actions.insert(0, action)
             
-            # Choisir l'action qui maximise le score minimum (minimax)
-            if min_score > best_score:
-                best_score = min_score
-                best_action = action
-        
-        return best_action  # Retourne None si aucune action valide
+            # Victoire ou défaite forcée : inutile de chercher plus loin
+            if abs(score) >= 100000:
+                break
+        return history
     
-    def generate_actions(self, game, player):
+    def _parallel_search(self, state, root_actions):
         """
-        Génère toutes les actions légales pour un joueur
+        Répartit les actions racines entre les processus du pool
+        
+        Chaque processus mène son propre approfondissement itératif sur sa part
+        des actions. La fusion est déterministe : on compare les scores à la
+        plus grande profondeur atteinte par tous les processus, et les égalités
+        sont départagées par l'ordre des actions racines.
         
-        Args:
-            game: État du jeu
-            player (int): Joueur dont on génère les actions
-            
         Returns:
-            list: Liste d'actions possibles
+            tuple: (meilleure action, meilleur score, profondeur)
         """
-        actions = []
+        executor = self._get_executor()
+        n = min(self.workers, len(root_actions))
+        budget_ms = max(0.0, (self._deadline - time.perf_counter()) * 1000.0)
+        params = (self.player, self.max_enemy_responses, self.max_depth, self.tt.size.bit_length() - 1,
+                  tuple(sorted(self.weights.items())))
         
-        # Ressources du joueur
-        steaks = game.player1_steaks if player == 1 else game.player2_steaks
+        futures = []
+        for w in range(n):
+            indices = list(range(w, len(root_actions), n))
+            chunk = [root_actions[i] for i in indices]
+            futures.append((indices, executor.submit(_search_root_chunk, params, state, chunk, budget_ms)))
         
-        # 1. Actions de spawn (seulement si c'est le tour actuel du joueur)
-        if player == game.current_player and not getattr(game, 'spawn_action_done', False):
-            spawn_positions = self.calculate_spawn_positions(game, player)
-            costs = {1: 40, 2: 80, 3: 100}
-            
-            for pos in spawn_positions:
-                for dino_type in [1, 2, 3]:
-                    if steaks >= costs[dino_type]:
-                        # Vérifier le cooldown du spawn
-                        cooldown_ok = True
-                        if hasattr(game, 'spawn_cooldowns'):
-                            cooldown = game.spawn_cooldowns.get(player, {}).get(dino_type, 0)
-                            if cooldown > 0:
-                                cooldown_ok = False
-                        
-                        if cooldown_ok:
-                            actions.append({
-                                'type': 'spawn',
-                                'x': pos[0],
-                                'y': pos[1],
-                                'dino_type': dino_type
-                            })
-        
-        # 2. Actions avec les dinosaures (seulement ceux qui n'ont pas bougé)
-        for dino in game.dinosaurs:
-            if dino.player == player and not dino.has_moved and dino.immobilized_turns == 0:
-                # Mouvements
-                moves = self.calculate_possible_moves(game, dino)
-                for move_pos in moves:
-                    actions.append({
-                        'type': 'move',
-                        'dinosaur': dino,
-                        'target_x': move_pos[0],
-                        'target_y': move_pos[1]
-                    })
-                
-                # Attaques (toujours prioritaires si disponibles)
-                targets = self.calculate_attack_targets(game, dino, player)
-                for target, target_type in targets:
-                    actions.append({
-                        'type': 'attack',
-                        'attacker': dino,
-                        'target': target,
-                        'target_type': target_type
-                    })
-        
-        # 3. Passer le tour (toujours possible)
-        actions.append({'type': 'pass'})
-        
-        return actions
+        results = []
+        self._worker_tt_hits = self._worker_tt_misses = 0
+        self._worker_cutoffs = self._worker_no_cutoffs = 0
+        for indices, future in futures:
+            history, nodes, evaluations, hits, misses, cutoffs, no_cutoffs = future.result()
+            self._nodes += nodes
+            self._evaluations += evaluations
+            self._worker_tt_hits += hits
+            self._worker_tt_misses += misses
+            self._worker_cutoffs += cutoffs
+            self._worker_no_cutoffs += no_cutoffs
+            results.append((indices, history))
+        
+        # Profondeur commune à tous les processus
+        common_depth = min(len(history) and history[-1][0] for _, history in results)
+        if common_depth == 0:
+            return root_actions[0], None, 0
+        
+        best = None
+        for indices, history in results:
+            for depth, score, chunk_index in history:
+                if depth == common_depth:
+                    candidate = (score, -indices[chunk_index])
+                    if best is None or candidate > best:
+                        best = candidate
+        score, neg_index = best
+        return root_actions[-neg_index], score, common_depth
     
-    def calculate_spawn_positions(self, game, player):
-        """Calcule les positions valides pour spawner"""
-        positions = []
-        egg = game.eggs[player]
-        max_distance = 3
-        
-        for x in range(game.logic_width):
-            for y in range(game.logic_height):
-                # Vérifier la distance à l'œuf
-                distance = abs(x - egg.x) + abs(y - egg.y)
-                if distance <= max_distance:
-                    # Vérifier que la case est libre
-                    is_free = True
-                    
-                    # Vérifier œufs
-                    for e in game.eggs.values():
-                        if e.x == x and e.y == y:
-                            is_free = False
-                            break
-                    
-                    # Vérifier dinosaures
-                    if is_free:
-                        for d in game.dinosaurs:
-                            if d.x == x and d.y == y:
-                                is_free = False
-                                break
-                    
-                    if is_free:
-                        positions.append((x, y))
-        
-        return positions
+    def _get_executor(self):
+        """Retourne le pool de processus, créé au premier appel puis réutilisé"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
     
-    def calculate_possible_moves(self, game, dinosaur):
-        """Calcule les déplacements possibles pour un dinosaure"""
-        moves = []
-        move_range = dinosaur.movement_range
-        
-        for dx in range(-move_range, move_range + 1):
-            for dy in range(-move_range, move_range + 1):
-                # Distance Manhattan
-                if abs(dx) + abs(dy) <= move_range and (dx != 0 or dy != 0):
-                    target_x = dinosaur.x + dx
-                    target_y = dinosaur.y + dy
-                    
-                    # Vérifier que c'est dans les limites
-                    if 0 <= target_x < game.logic_width and 0 <= target_y < game.logic_height:
-                        # Vérifier que la case est libre
-                        is_free = True
-                        
-                        # Vérifier œufs
-                        for egg in game.eggs.values():
-                            if egg.x == target_x and egg.y == target_y:
-                                is_free = False
-                                break
-                        
-                        # Vérifier dinosaures
-                        if is_free:
-                            for d in game.dinosaurs:
-                                if d.x == target_x and d.y == target_y:
-                                    is_free = False
-                                    break
-                        
-                        if is_free:
-                            moves.append((target_x, target_y))
-        
-        return moves
+    def shutdown(self):
+        """Arrête le pool de processus de la recherche parallèle (s'il existe)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
     
-    def calculate_attack_targets(self, game, dinosaur, player):
-        """Calcule les cibles attaquables (adjacentes)"""
-        targets = []
-        
-        # Cases adjacentes (orthogonales uniquement)
-        adjacent_positions = [
-            (dinosaur.x - 1, dinosaur.y),
-            (dinosaur.x + 1, dinosaur.y),
-            (dinosaur.x, dinosaur.y - 1),
-            (dinosaur.x, dinosaur.y + 1)
-        ]
-        
-        for pos_x, pos_y in adjacent_positions:
-            # Vérifier œuf ennemi
-            enemy_player = 3 - player
-            if enemy_player in game.eggs:
-                egg = game.eggs[enemy_player]
-                if egg.x == pos_x and egg.y == pos_y:
-                    targets.append((egg, 'egg'))
+    def _search_root(self, state, root_actions, depth):
+        """
+        Cherche à une profondeur fixe depuis la racine
+        
+        Tout l'arbre est parcouru sur un seul état mutable : chaque action est
+        appliquée en place, suivie de la fin de tour, puis annulée.
+        
+        Returns:
+            tuple: (meilleur score, meilleure action)
+        """
+        alpha = float('-inf')
+        beta = float('inf')
+        best_action = None
+        self._root_depth = depth
+        # Évaluation tenue à jour à chaque apply/undo (score des feuilles en O(1))
+        self._evaluator = IncrementalEvaluator(state, self.player, self.weights)
+        
+        key = self.hasher.hash_state(state)
+        side_swap = (self.hasher.key(ZobristHasher.side_feature(self.player))
+                     ^ self.hasher.key(ZobristHasher.side_feature(self.enemy_player)))
+        
+        for action in root_actions:
+            child_key, undos = self._play(state, key, action, side_swap)
+            try:
+                score = self._alphabeta(state, child_key, depth - 1, alpha, beta, self.enemy_player)
+            finally:
+                self._unplay(state, undos)
             
-            # Vérifier dinosaures ennemis (ignorer les dinosaures déjà morts)
-            for dino in game.dinosaurs:
-                if dino.player != player and dino.x == pos_x and dino.y == pos_y and dino.health > 0:
-                    targets.append((dino, 'dinosaur'))
+            if best_action is None or score > alpha:
+                alpha = score
+                best_action = action
+        
+        return alpha, best_action
+    
+    def _play(self, state, key, action, side_swap):
+        """
+        Joue une action puis la fin de tour (un niveau de l'arbre = un tour)
         
-        return targets
+        La clé de Zobrist et l'évaluation incrémentale sont mises à jour après
+        chaque étape, avant la suivante.
+        
+        Returns:
+            tuple: (clé de l'état obtenu, annulations à passer à _unplay)
+        """
+        undo = GameSimulator.apply_action(state, action)
+        key = self.hasher.update(key, state, undo)
+        self._evaluator.push(undo)
+        turn_undo = GameSimulator.simulate_end_turn(state)
+        key = self.hasher.update(key, state, turn_undo) ^ side_swap
+        self._evaluator.push(turn_undo)
+        return key, (undo, turn_undo)
     
-    def sample_best_actions(self, game_state, actions, n):
+    def _unplay(self, state, undos):
+        """Annule un niveau joué par _play (ordre inverse)"""
+        for undo in reversed(undos):
+            self._evaluator.pop()
+            GameSimulator.undo_action(state, undo)
+    
+    def _alphabeta(self, state, key, depth, alpha, beta, player):
         """
-        Échantillonne les n meilleures actions selon une heuristique greedy
+        Recherche alpha-beta (minimax) du point de vue de l'IA
         
         Args:
-            game_state: État du jeu
-            actions: Liste d'actions à échantillonner
-            n: Nombre d'actions à garder
+            state: État simulé (modifié puis restauré en place)
+            key (int): Clé de Zobrist de l'état avec player au trait
+            depth (int): Profondeur restante
+            alpha (float): Borne inférieure courante
+            beta (float): Borne supérieure courante
+            player (int): Joueur qui doit jouer à ce nœud
             
         Returns:
-            list: Les n meilleures actions
+            float: Score de l'état
         """
-        if len(actions) <= n:
-            return actions
-        
-        scored = []
-        for action in actions:
-            sim = GameSimulator.copy_game_state(game_state)
-            GameSimulator.simulate_action(sim, action)
-            score = evaluate_state(sim, self.enemy_player)
-            scored.append((score, action))
-        
-        # Trier par meilleur score et prendre top-n
-        scored.sort(reverse=True, key=lambda x: x[0])
-        return [a for _, a in scored[:n]]
+        self._nodes += 1
+        if time.perf_counter() >= self._deadline or self.stop_event.is_set():
+            raise SearchTimeout()
+        
+        # C'est au tour de ce joueur dans la simulation
+        state.current_player = player
+        
+        # Consulter la table de transposition
+        tt_move = None
+        entry = self.tt.probe(key)
+        if entry is not None:
+            tt_move = entry.best_move
+            if entry.depth >= depth:
+                if entry.flag == EXACT:
+                    return entry.score
+                if entry.flag == LOWER:
+                    alpha = max(alpha, entry.score)
+                else:
+                    beta = min(beta, entry.score)
+                if alpha >= beta:
+                    return entry.score
+        
+        if (depth <= 0 or state.eggs[1].health <= 0 or state.eggs[2].health <= 0):
+            self._evaluations += 1
+            score = self._evaluator.score(state)
+            self.tt.store(key, depth, EXACT, score)
+            return score
+        
+        # Ordonner sans pré-évaluer : coup mémorisé, attaques, killers, historique
+        ply = self._root_depth - depth
+        actions = self.orderer.order(self.generate_actions(state, player), ply, tt_move)
+        
+        # Limiter le facteur de branchement (pour performance)
+        if len(actions) > self.max_enemy_responses:
+            actions = actions[:self.max_enemy_responses]
+        
+        alpha_orig, beta_orig = alpha, beta
+        maximizing = player == self.player
+        next_player = 3 - player
+        side_swap = (self.hasher.key(ZobristHasher.side_feature(player))
+                     ^ self.hasher.key(ZobristHasher.side_feature(next_player)))
+        best = float('-inf') if maximizing else float('inf')
+        best_action = None
+        
+        for index, action in enumerate(actions):
+            child_key, undos = self._play(state, key, action, side_swap)
+            try:
+                score = self._alphabeta(state, child_key, depth - 1, alpha, beta, next_player)
+            finally:
+                self._unplay(state, undos)
+            
+            if maximizing:
+                if score > best:
+                    best, best_action = score, action
+                alpha = max(alpha, best)
+            else:
+                if score < best:
+                    best, best_action = score, action
+                beta = min(beta, best)
+            
+            # Coupure alpha-beta
+            if alpha >= beta:
+                self.orderer.record_cutoff(action, ply, depth, index)
+                break
+        else:
+            self.orderer.record_no_cutoff()
+        
+        # Mémoriser le résultat avec le type de borne obtenu
+        if best <= alpha_orig:
+            flag = UPPER
+        elif best >= beta_orig:
+            flag = LOWER
+        else:
+            flag = EXACT
+        signature = GameSimulator.action_signature(best_action) if best_action else None
+        self.tt.store(key, depth, flag, best, signature)
+        
+        return best
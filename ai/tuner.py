@@ -0,0 +1,201 @@
+"""
+Réglage des poids de l'évaluation par auto-jeu (SPSA)
+Les parties de chaque itération se jouent en parallèle dans l'arène (ai/arena.py)
+
+Utilisation :
+    python -m ai.tuner --iterations 300 --checkpoint tuning.json --output weights.json
+    python -m ai.tuner --checkpoint tuning.json --output weights.json   # reprise
+
+Le profil exporté se charge avec SearchAI(weights="weights.json") ou
+evaluate_state(state, player, load_weights("weights.json")).
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ai.arena import MAPS, run_tournament
+from ai.heuristics import DEFAULT_WEIGHTS, resolve_weights, save_weights
+
+# Ordre des paramètres optimisés
+PARAMETERS = tuple(DEFAULT_WEIGHTS)
+
+
+class SPSATuner:
+    """
+    Optimisation SPSA (Simultaneous Perturbation Stochastic Approximation)
+
+    À chaque itération, tous les poids sont perturbés en même temps dans une
+    direction aléatoire (+c / -c par poids) ; les deux profils θ+ et θ- se
+    rencontrent sur un lot de parties et le résultat donne une estimation du
+    gradient. Les poids sont optimisés en relatif (1.0 = poids par défaut),
+    pour que les pas aient le même sens quel que soit l'ordre de grandeur.
+
+    Les parties qui atteignent max_turns sont comptées nulles par défaut :
+    les départager avec evaluate_state (adjudicate) reviendrait à les juger
+    avec DEFAULT_WEIGHTS, et donc à tirer le réglage vers les poids par défaut.
+    """
+
+    def __init__(self, engine='search', engine_params=None, games_per_iteration=16,
+                 maps=MAPS, a=0.5, c=0.2, big_a=None, alpha=0.602, gamma=0.101,
+                 max_turns=80, adjudicate=None, opening_plies=4, seed=0):
+        """
+        Args:
+            engine (str): Moteur des parties ('search' ou 'mcts')
+            engine_params (dict): Paramètres du moteur (hors poids)
+            games_per_iteration (int): Parties θ+ contre θ- par itération (paires de couleurs)
+            maps (tuple): Cartes jouées
+            a, c, big_a, alpha, gamma (float): Gains SPSA a_k = a / (k + 1 + A)^alpha,
+                c_k = c / (k + 1)^gamma ; A vaut 10 % des itérations par défaut
+            max_turns (int): Limite de tours d'une partie
+            adjudicate (float): Écart d'évaluation (poids par défaut) qui départage
+                une partie à la limite ; None = partie nulle
+            opening_plies (int): Actions aléatoires d'ouverture
+            seed (int): Graine des perturbations et des ouvertures
+        """
+        self.engine = engine
+        self.engine_params = dict(engine_params or {})
+        self.games_per_iteration = games_per_iteration
+        self.maps = tuple(maps)
+        self.a, self.c, self.big_a = a, c, big_a
+        self.alpha, self.gamma = alpha, gamma
+        self.max_turns = max_turns
+        self.adjudicate = adjudicate
+        self.opening_plies = opening_plies
+        self.seed = seed
+
+        self.theta = {name: 1.0 for name in PARAMETERS}
+        self.iteration = 0
+        self.history = []
+
+    def weights(self, theta=None):
+        """Poids absolus correspondant à un vecteur relatif"""
+        theta = theta or self.theta
+        return {name: DEFAULT_WEIGHTS[name] * theta[name] for name in PARAMETERS}
+
+    def step(self, total_iterations, executor=None):
+        """
+        Joue une itération SPSA et met à jour theta
+
+        Returns:
+            dict: Résumé de l'itération (score de θ+, gains, theta)
+        """
+        k = self.iteration
+        big_a = self.big_a if self.big_a is not None else 0.1 * total_iterations
+        a_k = self.a / (k + 1 + big_a) ** self.alpha
+        c_k = self.c / (k + 1) ** self.gamma
+
+        rng = random.Random(self.seed * 1_000_003 + k)
+        delta = {name: rng.choice((-1.0, 1.0)) for name in PARAMETERS}
+        plus = {name: self.theta[name] + c_k * delta[name] for name in PARAMETERS}
+        minus = {name: self.theta[name] - c_k * delta[name] for name in PARAMETERS}
+
+        engine_plus = (self.engine, {**self.engine_params, 'weights': self.weights(plus)})
+        engine_minus = (self.engine, {**self.engine_params, 'weights': self.weights(minus)})
+        _, summary = run_tournament(engine_plus, engine_minus, self.games_per_iteration,
+                                    self.maps, seed=self.seed * 7919 + k,
+                                    opening_plies=self.opening_plies,
+                                    max_turns=self.max_turns, adjudicate=self.adjudicate,
+                                    executor=executor)
+
+        # Score de θ+ ramené dans [-1, 1] ; le gradient pousse vers le meilleur des deux
+        result = 2.0 * summary['score'] - 1.0
+        for name in PARAMETERS:
+            gradient = result / (2.0 * c_k * delta[name])
+            # Un poids ne change pas de signe : le terme garderait son sens
+            self.theta[name] = max(0.0, self.theta[name] + a_k * gradient)
+
+        self.iteration += 1
+        record = {'iteration': k, 'score_plus': summary['score'], 'a_k': a_k, 'c_k': c_k,
+                  'draws': summary['draws'], 'theta': dict(self.theta)}
+        self.history.append(record)
+        return record
+
+    def to_dict(self):
+        """État complet du réglage (pour les points de reprise)"""
+        return {
+            'config': {
+                'engine': self.engine, 'engine_params': self.engine_params,
+                'games_per_iteration': self.games_per_iteration, 'maps': list(self.maps),
+                'a': self.a, 'c': self.c, 'big_a': self.big_a,
+                'alpha': self.alpha, 'gamma': self.gamma,
+                'max_turns': self.max_turns, 'adjudicate': self.adjudicate,
+                'opening_plies': self.opening_plies, 'seed': self.seed,
+            },
+            'iteration': self.iteration,
+            'theta': self.theta,
+            'history': self.history,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Recrée un réglage depuis to_dict()"""
+        tuner = cls(**data['config'])
+        tuner.iteration = data['iteration']
+        tuner.theta.update(data['theta'])
+        tuner.history = data['history']
+        return tuner
+
+    def save(self, path):
+        """Écrit le point de reprise (remplacement atomique du fichier)"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Réglage SPSA des poids de l'évaluation")
+    parser.add_argument('--iterations', type=int, default=300, help="Nombre total d'itérations")
+    parser.add_argument('--games', type=int, default=16, help="Parties par itération")
+    parser.add_argument('--engine', default='search', choices=('search', 'mcts'))
+    parser.add_argument('--time-budget-ms', type=int, default=50, help="Budget par décision")
+    parser.add_argument('--max-depth', type=int, default=3, help="Profondeur max (search)")
+    parser.add_argument('--max-turns', type=int, default=80)
+    parser.add_argument('--adjudicate', type=float, default=None,
+                        help="À la limite de tours, écart d'évaluation (poids par défaut) "
+                             "donnant la victoire (par défaut : partie nulle)")
+    parser.add_argument('--workers', type=int, default=0, help="Processus (0 = un par cœur)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--checkpoint', default='tuning.json',
+                        help="Point de reprise, relu s'il existe déjà")
+    parser.add_argument('--output', default='weights.json', help="Profil de poids exporté")
+    args = parser.parse_args(argv)
+
+    if os.path.exists(args.checkpoint):
+        tuner = SPSATuner.load(args.checkpoint)
+        print(f"Reprise à l'itération {tuner.iteration} ({args.checkpoint})")
+    else:
+        engine_params = {'time_budget_ms': args.time_budget_ms}
+        if args.engine == 'search':
+            engine_params['max_depth'] = args.max_depth
+        tuner = SPSATuner(args.engine, engine_params, games_per_iteration=args.games,
+                          max_turns=args.max_turns, adjudicate=args.adjudicate, seed=args.seed)
+
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while tuner.iteration < args.iterations:
+            start = time.perf_counter()
+            record = tuner.step(args.iterations, executor)
+            tuner.save(args.checkpoint)
+            save_weights(args.output, tuner.weights(), iteration=tuner.iteration)
+            weights = ", ".join(f"{name}={value:.3g}" for name, value in tuner.weights().items())
+            print(f"Itération {record['iteration'] + 1}/{args.iterations} "
+                  f"(θ+ {record['score_plus']:.2f}, {time.perf_counter() - start:.0f} s): {weights}",
+                  flush=True)
+
+    print(f"Poids exportés dans {args.output}")
+    # Vérifier que le profil se recharge
+    resolve_weights(args.output)
+
+
+if __name__ == '__main__':
+    main()
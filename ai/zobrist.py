@@ -0,0 +1,290 @@
+"""
+Hachage de Zobrist et table de transposition pour les IA de recherche
+Permet de reconnaître un même état atteint par des ordres d'actions différents
+"""
+
+import math
+import random
+
+from ai.game_simulator import GameSimulator
+
+# Types de bornes stockées dans la table de transposition
+EXACT = 0   # Score exact
+LOWER = 1   # Borne inférieure (coupure beta)
+UPPER = 2   # Borne supérieure (aucun coup n'a dépassé alpha)
+
+
+class ZobristHasher:
+    """
+    Calcule des clés de Zobrist 64 bits pour les états de jeu
+
+    Chaque caractéristique (dinosaure, œuf, piège, œuf de spawn, steaks,
+    cooldowns de spawn, spawn du tour, joueur au trait) reçoit une clé aléatoire tirée à la première utilisation.
+    La clé d'un état est le XOR des clés de ses caractéristiques, ce qui permet
+    une mise à jour incrémentale : retirer l'ancienne caractéristique et
+    ajouter la nouvelle revient à deux XOR (voir toggle()).
+    """
+
+    def __init__(self, seed=0x5EED):
+        """
+        Initialise le générateur de clés
+
+        Args:
+            seed (int): Graine du générateur (clés reproductibles)
+        """
+        self._rng = random.Random(seed)
+        self._keys = {}
+
+    def key(self, feature):
+        """Retourne la clé aléatoire associée à une caractéristique (tuple)"""
+        k = self._keys.get(feature)
+        if k is None:
+            k = self._rng.getrandbits(64)
+            self._keys[feature] = k
+        return k
+
+    def toggle(self, h, feature):
+        """Ajoute ou retire (XOR) une caractéristique d'une clé d'état"""
+        return h ^ self.key(feature)
+
+    @staticmethod
+    def dino_feature(dino):
+        """Caractéristique d'un dinosaure"""
+        return ('dino', dino.player, dino.dino_type, dino.x, dino.y,
+                dino.health, dino.has_moved, dino.immobilized_turns)
+
+    @staticmethod
+    def egg_feature(egg):
+        """Caractéristique d'un œuf principal"""
+        return ('egg', egg.player, egg.x, egg.y, egg.health)
+
+    @staticmethod
+    def trap_feature(trap):
+        """Caractéristique d'un piège"""
+        return ('trap', trap.player, trap.x, trap.y)
+
+    @staticmethod
+    def spawn_egg_feature(spawn_egg):
+        """Caractéristique d'un œuf de spawn"""
+        return ('spawn_egg', spawn_egg.player, spawn_egg.dino_type, spawn_egg.x, spawn_egg.y,
+                getattr(spawn_egg, 'health', 0), getattr(spawn_egg, 'spawn_turns_elapsed', 0))
+
+    @staticmethod
+    def steaks_feature(player, steaks):
+        """Caractéristique des ressources d'un joueur"""
+        return ('steaks', player, steaks)
+
+    @staticmethod
+    def cooldown_feature(player, dino_type, cooldown):
+        """
+        Caractéristique d'un type de dinosaure en recharge (cooldown > 0) :
+        nombre de fins de tour simulées avant qu'il soit de nouveau disponible
+        """
+        return ('cooldown', player, dino_type,
+                math.ceil(cooldown / GameSimulator.SIMULATED_TURN_SECONDS))
+
+    @staticmethod
+    def spawn_done_feature():
+        """Caractéristique du spawn déjà fait ce tour (spawn_action_done)"""
+        return ('spawn_done',)
+
+    def cooldowns_key(self, cooldowns):
+        """XOR des caractéristiques des types en recharge ; les types disponibles n'en ont pas"""
+        h = 0
+        for player, per_type in cooldowns.items():
+            for dino_type, cooldown in per_type.items():
+                if cooldown > 0:
+                    h ^= self.key(self.cooldown_feature(player, dino_type, cooldown))
+        return h
+
+    @staticmethod
+    def side_feature(player):
+        """Caractéristique du joueur au trait"""
+        return ('side', player)
+
+    def hash_state(self, state):
+        """
+        Calcule la clé complète d'un état de jeu
+
+        Args:
+            state: État du jeu (Game ou état simulé)
+
+        Returns:
+            int: Clé de Zobrist 64 bits
+        """
+        key = self.key
+        h = key(self.side_feature(state.current_player))
+        h ^= key(self.steaks_feature(1, state.player1_steaks))
+        h ^= key(self.steaks_feature(2, state.player2_steaks))
+        for egg in state.eggs.values():
+            h ^= key(self.egg_feature(egg))
+        for dino in state.dinosaurs:
+            h ^= key(self.dino_feature(dino))
+        for trap in state.traps:
+            h ^= key(self.trap_feature(trap))
+        for spawn_egg in state.spawn_eggs:
+            h ^= key(self.spawn_egg_feature(spawn_egg))
+        h ^= self.cooldowns_key(state.spawn_cooldowns)
+        if state.spawn_action_done:
+            h ^= key(self.spawn_done_feature())
+        return h
+
+    def update(self, h, state, undo):
+        """
+        Met à jour incrémentalement une clé après GameSimulator.apply_action()
+        ou GameSimulator.simulate_end_turn()
+
+        Seules les entités journalisées dans l'enregistrement d'annulation sont
+        re-hachées ; le joueur au trait n'est pas modifié (voir toggle()).
+
+        Args:
+            h (int): Clé de l'état avant l'action
+            state: État après l'action
+            undo (UndoRecord): Enregistrement retourné par apply_action()
+                (à appliquer avant toute autre modification de l'état)
+
+        Returns:
+            int: Clé de l'état après l'action
+        """
+        key = self.key
+        old_cooldowns = None
+        for change in undo.changes:
+            kind = change[0]
+            if kind == 'dino':
+                # Retirer l'ancienne version, ajouter la version courante
+                dino = change[1]
+                x, y, health, has_moved, immobilized = change[2]
+                h ^= key(('dino', dino.player, dino.dino_type, x, y, health, has_moved, immobilized))
+                h ^= key(self.dino_feature(dino))
+            elif kind == 'egg':
+                egg = change[1]
+                h ^= key(('egg', egg.player, egg.x, egg.y, change[2]))
+                h ^= key(self.egg_feature(egg))
+            elif kind == 'remove_dino' or kind == 'add_dino':
+                h ^= key(self.dino_feature(change[-1]))
+            elif kind == 'remove_trap' or kind == 'add_trap':
+                h ^= key(self.trap_feature(change[-1]))
+            elif kind == 'spawn_egg':
+                spawn_egg = change[1]
+                h ^= key(('spawn_egg', spawn_egg.player, spawn_egg.dino_type, spawn_egg.x, spawn_egg.y,
+                          spawn_egg.health, change[2]))
+                h ^= key(self.spawn_egg_feature(spawn_egg))
+            elif kind == 'remove_spawn_egg' or kind == 'add_spawn_egg':
+                h ^= key(self.spawn_egg_feature(change[-1]))
+            elif kind == 'cooldowns' and old_cooldowns is None:
+                old_cooldowns = change[1]  # Cooldowns d'avant l'action
+
+        if old_cooldowns is not None:
+            h ^= self.cooldowns_key(old_cooldowns) ^ self.cooldowns_key(state.spawn_cooldowns)
+        if bool(state.spawn_action_done) != bool(undo.spawn_action_done):
+            h ^= key(self.spawn_done_feature())
+
+        if state.player1_steaks != undo.player1_steaks:
+            h ^= key(self.steaks_feature(1, undo.player1_steaks))
+            h ^= key(self.steaks_feature(1, state.player1_steaks))
+        if state.player2_steaks != undo.player2_steaks:
+            h ^= key(self.steaks_feature(2, undo.player2_steaks))
+            h ^= key(self.steaks_feature(2, state.player2_steaks))
+        return h
+
+
+class TTEntry:
+    """Entrée de la table de transposition"""
+
+    __slots__ = ('key', 'depth', 'flag', 'score', 'best_move', 'generation')
+
+    def __init__(self, key, depth, flag, score, best_move, generation):
+        self.key = key
+        self.depth = depth
+        self.flag = flag
+        self.score = score
+        self.best_move = best_move
+        self.generation = generation
+
+
+class TranspositionTable:
+    """
+    Table de transposition bornée, indexée par clé de Zobrist
+
+    Politique de remplacement : une case est écrasée si elle est vide, si elle
+    contient le même état, si elle date d'une recherche précédente, ou si la
+    nouvelle entrée a été cherchée au moins aussi profondément.
+    Les scores sont stockés du point de vue du joueur qui utilise la table.
+    """
+
+    def __init__(self, size_bits=18):
+        """
+        Initialise la table
+
+        Args:
+            size_bits (int): La table contient 2**size_bits cases
+        """
+        self.size = 1 << size_bits
+        self._mask = self.size - 1
+        self._slots = [None] * self.size
+        self.generation = 0
+
+        # Compteurs pour mesurer l'efficacité de la table
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def new_search(self):
+        """Signale le début d'une nouvelle recherche (vieillit les entrées)"""
+        self.generation += 1
+
+    def probe(self, key):
+        """
+        Cherche un état dans la table
+
+        Args:
+            key (int): Clé de Zobrist de l'état
+
+        Returns:
+            TTEntry: Entrée trouvée, ou None
+        """
+        entry = self._slots[key & self._mask]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, key, depth, flag, score, best_move=None):
+        """
+        Enregistre le résultat de la recherche d'un état
+
+        Args:
+            key (int): Clé de Zobrist de l'état
+            depth (int): Profondeur restante cherchée depuis cet état
+            flag (int): EXACT, LOWER ou UPPER
+            score (float): Score (ou borne) trouvé
+            best_move: Signature du meilleur coup (voir GameSimulator.action_signature)
+        """
+        index = key & self._mask
+        entry = self._slots[index]
+        if entry is not None:
+            if (entry.key != key and entry.generation == self.generation
+                    and entry.depth > depth):
+                return  # Garder l'entrée plus profonde de la recherche courante
+            if entry.key != key:
+                self.overwrites += 1
+            if best_move is None and entry.key == key:
+                best_move = entry.best_move
+        self._slots[index] = TTEntry(key, depth, flag, score, best_move, self.generation)
+        self.stores += 1
+
+    def clear(self):
+        """Vide la table et remet les compteurs à zéro"""
+        self._slots = [None] * self.size
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def hit_rate(self):
+        """Proportion de sondages ayant trouvé l'état"""
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
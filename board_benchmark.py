@@ -0,0 +1,220 @@
+"""
+Banc de mesure selon la taille du plateau
+Pour chaque carte (de 16x12 à 128x128), mesure le temps d'une image (update +
+draw), la génération des actions et la latence de décision de l'IA sur une
+position de milieu de partie
+
+Utilisation :
+    python board_benchmark.py
+    python board_benchmark.py --maps default,huge --frames 300 --json tailles.json
+    python board_benchmark.py --engine search:max_depth=2,time_budget_ms=60000
+
+Sans affichage disponible, le rendu se fait dans une fenêtre factice (pilote
+SDL "dummy") : les blits sont les mêmes, seul l'affichage final manque.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from ai.arena import create_engine, percentile
+from ai.game_simulator import GameSimulator
+from ai.search_ai import SearchAI
+from game import Game
+from headless import RandomPlayer, new_headless_game, play_game
+from map_generator import MAP_SIZES
+
+# Moteurs mesurés par défaut : profondeur fixe, le travail ne dépend pas de la machine
+DEFAULT_ENGINES = (
+    'search:max_depth=2,time_budget_ms=60000',
+    'mcts:max_iterations=200,time_budget_ms=60000',
+)
+
+# Défilement de la caméra pendant la mesure des images (pixels par image)
+PAN_SPEED = 12
+
+# Cartes de la plus petite à la plus grande
+DEFAULT_MAPS = tuple(sorted(MAP_SIZES, key=lambda name: MAP_SIZES[name][0] * MAP_SIZES[name][1]))
+
+
+def build_position(map_name, turns, seed=0):
+    """
+    Position de milieu de partie : turns tours joués par deux RandomPlayer
+
+    Returns:
+        Snapshot: Instantané de la position (voir snapshot.py)
+    """
+    rng = random.Random(seed)
+    game = new_headless_game(map_name, seed=seed)
+    play_game(game, {1: RandomPlayer(1, rng, spawn_rate=0.5), 2: RandomPlayer(2, rng, spawn_rate=0.5)},
+              max_turns=turns)
+    return game.snapshot()
+
+
+def bench_frames(screen, snapshot, frames, pan_speed=PAN_SPEED):
+    """
+    Mesure frames images (update + draw) d'une partie affichée
+
+    La caméra garde son cadrage de départ (tout le plateau, ou le zoom par
+    défaut sur les grandes cartes) et défile de pan_speed pixels par image,
+    en rebondissant sur les bords : les blocs de terrain qui entrent dans la
+    vue sont dessinés pendant la mesure. La première image, qui dessine les
+    blocs visibles, est mesurée à part.
+
+    Returns:
+        dict: Temps en ms (première image, p50 / p95 / moyenne des suivantes)
+    """
+    game = Game(screen, map_name=snapshot.map_name, game_mode="2players", seed=snapshot.seed)
+    game.restore_snapshot(snapshot)
+    game.autosave_replay = False
+    game.autosave_snapshot = False
+
+    start = time.perf_counter()
+    game.update()
+    game.draw()
+    first = (time.perf_counter() - start) * 1000.0
+
+    camera = game.camera
+    direction = 1
+    times = []
+    for _ in range(frames):
+        before = (camera.scroll_x, camera.scroll_y)
+        camera.scroll_by(direction * pan_speed, direction * pan_speed // 2)
+        if (camera.scroll_x, camera.scroll_y) == before:
+            direction = -direction
+        game.apply_camera()
+        start = time.perf_counter()
+        game.update()
+        game.draw()
+        pygame.display.flip()
+        times.append((time.perf_counter() - start) * 1000.0)
+    return {
+        'cell_size': game.cell_size,
+        'first_ms': first,
+        'p50_ms': percentile(times, 50),
+        'p95_ms': percentile(times, 95),
+        'mean_ms': sum(times) / len(times) if times else 0.0,
+    }
+
+
+def bench_actions(state, repeat):
+    """
+    Mesure la génération des actions légales du joueur au trait
+
+    Returns:
+        dict: Nombre d'actions et temps moyen en ms
+    """
+    generator = SearchAI(state.current_player, verbose=False)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        actions = generator.generate_actions(state, state.current_player)
+    elapsed = (time.perf_counter() - start) * 1000.0
+    generator.shutdown()
+    return {'actions': len(actions), 'mean_ms': elapsed / repeat}
+
+
+def bench_engine(engine_spec, state, repeat, seed=0):
+    """
+    Mesure repeat décisions d'un moteur neuf sur la position
+
+    Returns:
+        dict: Latences en ms et débit (nœuds ou itérations par seconde)
+    """
+    latencies = []
+    nodes = 0
+    for i in range(repeat):
+        random.seed(seed + i)
+        engine = create_engine(engine_spec, state.current_player)
+        position = GameSimulator.copy_game_state(state)
+        start = time.perf_counter()
+        engine.choose_action(position)
+        latencies.append((time.perf_counter() - start) * 1000.0)
+        nodes += engine.stats.get('nodes', engine.stats.get('iterations', 0))
+        engine.shutdown()
+    total_s = sum(latencies) / 1000.0
+    return {
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'nodes_per_sec': nodes / total_s if total_s > 0 else 0.0,
+    }
+
+
+def run_benchmark(maps=DEFAULT_MAPS, engines=DEFAULT_ENGINES, frames=120, repeat=3, turns=40,
+                  seed=0):
+    """
+    Mesure chaque carte
+
+    Returns:
+        dict: {carte: mesures}
+    """
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 800))
+    results = {}
+    for map_name in maps:
+        snapshot = build_position(map_name, turns, seed)
+        state = snapshot.to_state()
+        results[map_name] = {
+            'size': [snapshot.logic_width, snapshot.logic_height],
+            'entities': len(state.dinosaurs) + len(state.spawn_eggs) + len(state.traps),
+            'frame': bench_frames(screen, snapshot, frames),
+            'actions': bench_actions(state, max(repeat, 10)),
+            'engines': {spec: bench_engine(spec, state, repeat, seed) for spec in engines},
+        }
+    pygame.quit()
+    return results
+
+
+def format_results(results):
+    """Tableau lisible des mesures"""
+    lines = []
+    for map_name, r in results.items():
+        frame, actions = r['frame'], r['actions']
+        lines.append(f"{map_name} {r['size'][0]}x{r['size'][1]} ({r['entities']} entités, "
+                     f"cases de {frame['cell_size']} px)")
+        lines.append(f"  image          p50 {frame['p50_ms']:>7.2f}  p95 {frame['p95_ms']:>7.2f} ms  "
+                     f"(première image {frame['first_ms']:.1f} ms)")
+        lines.append(f"  actions        {actions['mean_ms']:>11.2f} ms  ({actions['actions']} actions)")
+        for spec, e in r['engines'].items():
+            lines.append(f"  {spec}")
+            lines.append(f"                 p50 {e['p50_ms']:>7.1f}  p95 {e['p95_ms']:>7.1f} ms  "
+                         f"{e['nodes_per_sec']:>7.0f} nœuds/s")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Performances selon la taille du plateau")
+    parser.add_argument('--maps', default=','.join(DEFAULT_MAPS),
+                        help="Cartes, séparées par des virgules (voir map_generator.MAP_SIZES)")
+    parser.add_argument('--engine', action='append', dest='engines',
+                        help="Moteur à mesurer (répétable), ex. 'search:max_depth=3'")
+    parser.add_argument('--frames', type=int, default=120, help="Images mesurées par carte")
+    parser.add_argument('--repeat', type=int, default=3, help="Décisions mesurées par moteur")
+    parser.add_argument('--turns', type=int, default=40, help="Tours joués avant la mesure")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help="Écrire les mesures dans ce fichier JSON")
+    args = parser.parse_args(argv)
+
+    maps = [m.strip() for m in args.maps.split(',') if m.strip()]
+    unknown = [m for m in maps if m not in MAP_SIZES]
+    if unknown:
+        parser.error(f"Cartes inconnues: {', '.join(unknown)}")
+    results = run_benchmark(maps, args.engines or DEFAULT_ENGINES, args.frames, args.repeat,
+                            args.turns, args.seed)
+    print(format_results(results))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Caméra du plateau : zoom (taille des cases) et défilement
+Convertit cases <-> pixels et donne la plage de cases visibles, pour ne
+dessiner que ce qui est à l'écran quelle que soit la taille de la carte
+"""
+
+# Taille des cases (pixels) : zoom maximal, et zoom de départ quand le
+# plateau entier ne tiendrait qu'avec des cases plus petites que MIN_FIT_CELL_SIZE
+MAX_CELL_SIZE = 96
+DEFAULT_CELL_SIZE = 40
+MIN_FIT_CELL_SIZE = 24
+
+# Facteur de zoom par cran de molette
+ZOOM_STEP = 1.25
+
+
+class Camera:
+    """
+    Vue d'un plateau de logic_width x logic_height cases dans une zone de l'écran
+
+    scroll_x / scroll_y : position (pixels du plateau) du coin haut-gauche de
+    la zone d'affichage. Un plateau plus petit que la zone sur un axe y est
+    centré (défilement négatif) ; sinon le défilement est borné pour que le
+    plateau couvre toute la zone.
+    """
+
+    def __init__(self, logic_width, logic_height, viewport):
+        """
+        Args:
+            logic_width, logic_height (int): Taille du plateau en cases
+            viewport (tuple): Zone d'affichage (x, y, largeur, hauteur) en pixels
+        """
+        self.logic_width = logic_width
+        self.logic_height = logic_height
+        self.viewport = viewport
+        _, _, width, height = viewport
+        # Plus petit zoom : tout le plateau à l'écran
+        self.fit_cell_size = max(1, min(width // logic_width, height // logic_height))
+        self.min_cell_size = self.fit_cell_size
+        self.max_cell_size = max(self.fit_cell_size, MAX_CELL_SIZE)
+        self.cell_size = self.fit_cell_size
+        self.scroll_x = 0
+        self.scroll_y = 0
+        if self.fit_cell_size < MIN_FIT_CELL_SIZE:
+            # Plateau trop grand pour être lisible en entier : zoom par défaut
+            self.cell_size = DEFAULT_CELL_SIZE
+        self.clamp()
+
+    @property
+    def offset_x(self):
+        """Position à l'écran (pixels) du bord gauche du plateau"""
+        return self.viewport[0] - self.scroll_x
+
+    @property
+    def offset_y(self):
+        """Position à l'écran (pixels) du bord haut du plateau"""
+        return self.viewport[1] - self.scroll_y
+
+    @property
+    def board_width(self):
+        return self.logic_width * self.cell_size
+
+    @property
+    def board_height(self):
+        return self.logic_height * self.cell_size
+
+    def clamp(self):
+        """Centre le plateau sur les axes où il tient, borne le défilement ailleurs"""
+        _, _, width, height = self.viewport
+        self.scroll_x = self._clamp_axis(self.scroll_x, self.board_width, width)
+        self.scroll_y = self._clamp_axis(self.scroll_y, self.board_height, height)
+
+    @staticmethod
+    def _clamp_axis(scroll, board, view):
+        if board <= view:
+            return -((view - board) // 2)
+        return min(max(scroll, 0), board - view)
+
+    def scroll_by(self, dx, dy):
+        """Fait défiler la vue de (dx, dy) pixels"""
+        self.scroll_x += int(dx)
+        self.scroll_y += int(dy)
+        self.clamp()
+
+    def center_on(self, x, y):
+        """Centre la vue sur une case"""
+        _, _, width, height = self.viewport
+        self.scroll_x = x * self.cell_size + self.cell_size // 2 - width // 2
+        self.scroll_y = y * self.cell_size + self.cell_size // 2 - height // 2
+        self.clamp()
+
+    def set_cell_size(self, cell_size, anchor=None):
+        """
+        Change le zoom en gardant fixe le point du plateau sous anchor
+
+        Args:
+            cell_size (int): Nouvelle taille des cases (bornée à min/max_cell_size)
+            anchor (tuple): Point de l'écran (pixels), par défaut le centre de la vue
+
+        Returns:
+            bool: True si le zoom a changé
+        """
+        cell_size = min(max(int(cell_size), self.min_cell_size), self.max_cell_size)
+        if cell_size == self.cell_size:
+            return False
+        vx, vy, width, height = self.viewport
+        if anchor is None:
+            anchor = (vx + width // 2, vy + height // 2)
+        # Position sous anchor, en cases (fractionnaires)
+        board_x = (anchor[0] - self.offset_x) / self.cell_size
+        board_y = (anchor[1] - self.offset_y) / self.cell_size
+        self.cell_size = cell_size
+        self.scroll_x = round(board_x * cell_size) - (anchor[0] - vx)
+        self.scroll_y = round(board_y * cell_size) - (anchor[1] - vy)
+        self.clamp()
+        return True
+
+    def zoom(self, steps, anchor=None):
+        """Zoome de steps crans de molette (négatif : dézoome)"""
+        size = self.cell_size * ZOOM_STEP ** steps
+        # Au moins un pixel d'écart par cran, même pour de toutes petites cases
+        if steps > 0:
+            size = max(size, self.cell_size + 1)
+        elif steps < 0:
+            size = min(size, self.cell_size - 1)
+        return self.set_cell_size(round(size), anchor)
+
+    def cell_at(self, px, py):
+        """
+        Case sous un point de l'écran
+
+        Returns:
+            tuple: (x, y), ou None hors de la zone d'affichage ou du plateau
+        """
+        vx, vy, width, height = self.viewport
+        if not (vx <= px < vx + width and vy <= py < vy + height):
+            return None
+        x = (px - self.offset_x) // self.cell_size
+        y = (py - self.offset_y) // self.cell_size
+        if 0 <= x < self.logic_width and 0 <= y < self.logic_height:
+            return (x, y)
+        return None
+
+    def visible_cells(self, margin=0):
+        """
+        Plage de cases visibles
+
+        Args:
+            margin (int): Cases ajoutées de chaque côté (dessins qui débordent de leur case)
+
+        Returns:
+            tuple: (x0, y0, x1, y1), cases x0 <= x < x1 et y0 <= y < y1
+        """
+        _, _, width, height = self.viewport
+        size = self.cell_size
+        x0 = max(0, self.scroll_x // size - margin)
+        y0 = max(0, self.scroll_y // size - margin)
+        x1 = min(self.logic_width, -(-(self.scroll_x + width) // size) + margin)
+        y1 = min(self.logic_height, -(-(self.scroll_y + height) // size) + margin)
+        return x0, y0, x1, y1
@@ -1,3 +1,4 @@
+import os
 import pygame
 import random
 import sys
@@ -5,32 +6,73 @@ from Entities.Dinosaur import Dinosaur
 from Entities.Egg import Egg
 from Entities.SpawnEgg import SpawnEgg
 from Entities.Trap import Trap
-from map_generator import MapGenerator
+from Entities.occupancy import OccupancyIndex
+from Entities.terrain import TerrainMap
+from Entities.rules import (SPAWN_COSTS, SPAWN_COOLDOWNS, SPAWN_MAX_DISTANCE, TRAP_COST,
+                            TRAP_DAMAGE, TRAP_IMMOBILIZED_TURNS, TURN_INCOME, KILL_REWARD,
+                            TRAP_KILL_REWARD, SPAWN_EGG_KILL_REWARD, STARTING_STEAKS)
+from map_generator import MapGenerator, egg_positions
+from action_log import ActionLog
+from camera import Camera
+from snapshot import AUTOSAVE_PATH, Snapshot, SnapshotError
 from ui import UI
 from ai.search_ai import SearchAI
+from ai.background import AIWorker
+from ai.ponder import Ponderer
+from ai.game_simulator import GameSimulator
 from logger import get_logger
 
 logger = get_logger("game")
 
+# Taille d'écran supposée sans affichage (calculs de mise en page seulement)
+HEADLESS_SCREEN_SIZE = (1280, 800)
+
+# Taille de case (pixels) en dessous de laquelle les bordures de cases ne sont plus dessinées
+BORDERLESS_CELL_SIZE = 8
+
+# Rendu du terrain par blocs de cases (voir terrain_chunk) : taille visée d'un
+# bloc en pixels, et nombre de blocs gardés en cache
+TERRAIN_CHUNK_PIXELS = 512
+TERRAIN_CHUNK_CACHE = 48
+
+# Débordement maximal (pixels) d'une entité hors de sa case : barres de vie
+# au-dessus des dinosaures, à côté des œufs
+ENTITY_DRAW_MARGIN = 240
+
+# Défilement de la caméra aux flèches (pixels par seconde)
+CAMERA_SCROLL_SPEED = 900
+
 class Game:
-    def __init__(self, screen, map_name="default", game_mode="ai"):
+    def __init__(self, screen, map_name="default", game_mode="ai", seed=None):
+        # Sans écran (screen=None), la partie tourne sans affichage : ni son,
+        # ni police, ni image, ni animation ; les actions sont résolues
+        # immédiatement et l'horloge est virtuelle (voir ticks() et headless.py)
+        self.headless = screen is None
         self.screen = screen
-        self.screen_width = screen.get_width()
-        self.screen_height = screen.get_height()
+        self.screen_width, self.screen_height = screen.get_size() if screen else HEADLESS_SCREEN_SIZE
+        self.clock_ms = 0
         
         # Mode de jeu
         self.game_mode = game_mode  # "ai" ou "2players"
+        self.map_name = map_name
         
-        logger.info(f"Initialisation d'une nouvelle partie - Map: {map_name}, Mode: {game_mode}")
+        # Graine du hasard de la partie (conservée dans le journal des actions) ;
+        # la partie tire dans son propre générateur, jamais dans le module random
+        self.seed = seed if seed is not None else random.randrange(1 << 32)
+        self.rng = random.Random(self.seed)
         
-        # Initialiser le système audio
-        pygame.mixer.init()
+        if not self.headless:
+            logger.info(f"Initialisation d'une nouvelle partie - Map: {map_name}, Mode: {game_mode}")
         
-        # Charger les sons
-        self.sounds = self.load_sounds()
+        # Initialiser le système audio et charger les sons
+        if self.headless:
+            self.sounds = {}
+        else:
+            pygame.mixer.init()
+            self.sounds = self.load_sounds()
         
         # Timer pour le son ambiant aléatoire (entre 5 et 15 secondes pour plus de fréquence)
-        self.ambient_sound_timer = random.uniform(5, 15)
+        self.ambient_sound_timer = self.rng.uniform(5, 15)
         
         # Menu des paramètres en jeu
         self.settings_open = False
@@ -50,50 +92,48 @@ class Game:
         self.return_to_menu = False
         
         # Ressources des joueurs
-        self.player1_steaks = 100
-        self.player2_steaks = 100
+        self.player1_steaks = STARTING_STEAKS
+        self.player2_steaks = STARTING_STEAKS
         
         # Entités du jeu
         self.eggs = {}
         self.dinosaurs = []
         self.traps = []
         self.spawn_eggs = []
-        
-        # Map
-        self.map_generator = MapGenerator(width=16, height=12, visual_width=32, visual_height=24, map_name=map_name)
+        # Index case -> entité, tenu à jour avec les listes (voir init_game)
+        self.occupancy = OccupancyIndex()
+        # Journal des actions pour le rejeu (voir action_log.py)
+        self.action_log = ActionLog(map_name, game_mode, self.seed)
+        self.autosave_replay = not self.headless
+        # Instantané de reprise réécrit à chaque fin de tour (voir snapshot.py)
+        self.autosave_snapshot = not self.headless
+        
+        # Map (la taille du plateau est celle de la carte, voir map_generator.MAP_SIZES)
+        self.map_generator = MapGenerator.for_map(map_name, load_assets=not self.headless)
         self.grid = self.map_generator.generate_map()
         self.visual_base, self.visual_elements = self.map_generator.generate_visual_map()
         
-        self.logic_width = 16
-        self.logic_height = 12
-        
-        # Calculer la taille des cellules pour qu'elles soient carrées
-        available_height = self.screen_height - 120
-        
-        cell_size_by_width = self.screen_width // self.logic_width
-        cell_size_by_height = available_height // self.logic_height
-        
-        self.cell_size = min(cell_size_by_width, cell_size_by_height)
-        
-        self.logic_cell_width = self.cell_size
-        self.logic_cell_height = self.cell_size
-        
-        self.visual_cell_width = self.cell_size
-        self.visual_cell_height = self.cell_size
+        self.logic_width = self.map_generator.width
+        self.logic_height = self.map_generator.height
         
         self.visual_width = self.logic_width
         self.visual_height = self.logic_height
         
-        self.board_width = self.logic_width * self.cell_size
-        self.board_height = self.logic_height * self.cell_size
-        self.board_offset_x = (self.screen_width - self.board_width) // 2
-        self.board_offset_y = (available_height - self.board_height) // 2
+        # Terrain compilé une fois par carte (partagé avec la simulation de l'IA)
+        self.terrain = self.compile_terrain()
+        # Rendu du terrain par blocs, dessinés à la demande (voir terrain_chunk)
+        self.terrain_chunks = {}
         
-        self.cell_width = self.logic_cell_width
-        self.cell_height = self.logic_cell_height
+        # Caméra : tout le plateau s'il tient à l'écran avec des cases
+        # lisibles, sinon zoom par défaut (défilement et zoom, voir camera.py)
+        available_height = self.screen_height - 120
+        self.camera = Camera(self.logic_width, self.logic_height,
+                             (0, 0, self.screen_width, available_height))
+        self.camera_drag = None
+        self.apply_camera()
         
         # UI
-        self.ui = UI(self.screen)
+        self.ui = UI(self.screen) if not self.headless else None
         
         # Sélection
         self.selected_cell = None
@@ -107,10 +147,10 @@ class Game:
         
         # Système de cooldown pour spawner
         self.spawn_cooldowns = {1: {1: 0, 2: 0, 3: 0}, 2: {1: 0, 2: 0, 3: 0}}
-        self.last_time = pygame.time.get_ticks()
+        self.last_time = self.ticks()
         
         self.turn_time_limit = 120
-        self.turn_start_time = pygame.time.get_ticks()
+        self.turn_start_time = self.ticks()
         self.auto_end_turn_time = None
         
         # Animation de déplacement
@@ -159,20 +199,33 @@ class Game:
         
         # IA pour le joueur 2 (rouge) - seulement en mode IA
         self.ai_player = 2 if game_mode == "ai" else None
-        self.ai = SearchAI(player=2, max_enemy_responses=8, verbose=True) if game_mode == "ai" else None
+        self.ai = (SearchAI(player=2, max_enemy_responses=8, verbose=not self.headless)
+                   if game_mode == "ai" else None)
         self.ai_thinking = False
         self.ai_action_delay = 0.5  # Délai avant que l'IA joue (en secondes)
         self.ai_action_timer = 0
+        # La réflexion de l'IA tourne dans un thread pour ne pas figer le rendu
+        # (sans affichage, l'IA joue directement dans update())
+        self.ai_worker = AIWorker(self.ai) if self.ai and not self.headless else None
+        # Pendant le tour humain, l'IA prépare ses réponses aux coups probables
+        self.ponderer = Ponderer(self.ai, verbose=not self.headless) if self.ai and not self.headless else None
+        self.ponder_started = False
         
         self.init_game()
     
     def init_game(self):
         """Initialise le jeu avec les œufs aux positions de base"""
-        egg1_pos = (1,1)
-        egg2_pos = (14,10)
+        positions = egg_positions(self.logic_width, self.logic_height)
+        egg1_pos = positions[1]
+        egg2_pos = positions[2]
         
         self.eggs[1] = Egg(egg1_pos[0], egg1_pos[1], 1)
         self.eggs[2] = Egg(egg2_pos[0], egg2_pos[1], 2)
+        self.camera.center_on(*egg1_pos)
+        self.apply_camera()
+        
+        self.occupancy = OccupancyIndex.from_game(self)
+        self.action_log = ActionLog(self.map_name, self.game_mode, self.seed)
     
     def load_sounds(self):
         """Charge tous les sons du jeu"""
@@ -244,6 +297,7 @@ class Game:
                 
                 if button_rect.collidepoint(mouse_pos):
                     # Signaler qu'on veut retourner au menu
+                    self.cancel_ai_thinking()
                     self.return_to_menu = True
             return
         
@@ -325,6 +379,10 @@ class Game:
                             sound.set_volume(self.sfx_volume)
             return  # Ne pas traiter les autres événements si les paramètres sont ouverts
 
+        # La caméra reste utilisable pendant le tour de l'IA
+        if self.handle_camera_event(event):
+            return
+        
         # Si c'est le tour de l'IA, ignorer les entrées joueur
         if self.current_player == getattr(self, 'ai_player', None):
             return
@@ -351,14 +409,9 @@ class Game:
                 elif mouse_y > self.screen_height - 100:
                     self.handle_ui_click(mouse_x, mouse_y)
                 else:
-                    adjusted_x = mouse_x - self.board_offset_x
-                    adjusted_y = mouse_y - self.board_offset_y
-                    
-                    grid_x = adjusted_x // self.cell_width
-                    grid_y = adjusted_y // self.cell_height
-                    
-                    if 0 <= grid_x < self.logic_width and 0 <= grid_y < self.logic_height:
-                        self.handle_grid_click(grid_x, grid_y)
+                    cell = self.camera.cell_at(mouse_x, mouse_y)
+                    if cell is not None:
+                        self.handle_grid_click(*cell)
         
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE and not self.spawn_action_done:
@@ -378,7 +431,7 @@ class Game:
         button_height = 95
         
         # Coûts des dinosaures
-        costs = {1: 40, 2: 80, 3: 100}
+        costs = SPAWN_COSTS
         current_steaks = self.player1_steaks if self.current_player == 1 else self.player2_steaks
         
         # Bouton Dino 1 (Rapide)
@@ -444,12 +497,12 @@ class Game:
                     self.spawn_action_done = True  # Le tour se termine après un spawn
                     self.clear_selection()
                     # Terminer automatiquement le tour après 1 seconde
-                    self.auto_end_turn_time = pygame.time.get_ticks() + 1000
+                    self.schedule_end_turn(1000)
         elif self.action_mode == 'trap':
             if self.place_trap(grid_x, grid_y):
                 self.spawn_action_done = True  # Le tour se termine après un piège
                 self.clear_selection()
-                self.auto_end_turn_time = pygame.time.get_ticks() + 1000
+                self.schedule_end_turn(1000)
         elif self.action_mode == 'attack_mode':
             target_found = False
             for target_type, tx, ty, target_entity in self.attack_targets:
@@ -493,7 +546,7 @@ class Game:
         if self.action_taken:
             return  # Une seule action par tour
             
-        costs = {1: 40, 2: 80, 3: 100}
+        costs = SPAWN_COSTS
         current_steaks = self.player1_steaks if self.current_player == 1 else self.player2_steaks
         
         if current_steaks >= costs[dino_type]:
@@ -505,7 +558,8 @@ class Game:
         """Spawne un œuf de dinosaure à la position donnée"""
         # Vérifier que la case est libre et proche de l'œuf du joueur
         if self.is_cell_free(x, y) and self.is_near_egg(x, y, self.current_player):
-            costs = {1: 40, 2: 80, 3: 100}
+            self.record_action('spawn', x, y, dino_type)
+            costs = SPAWN_COSTS
             
             if self.current_player == 1:
                 self.player1_steaks -= costs[dino_type]
@@ -515,10 +569,11 @@ class Game:
             # Créer un œuf de spawn au lieu d'un dinosaure directement
             new_spawn_egg = SpawnEgg(x, y, self.current_player, dino_type)
             self.spawn_eggs.append(new_spawn_egg)
+            self.occupancy.place('spawn_eggs', new_spawn_egg)
             
             # Démarrer le cooldown des boutons (plus court que les temps d'éclosion)
-            cooldown_times = {1: 5, 2: 8, 3: 12}  # en secondes - cooldowns des boutons
-            self.spawn_cooldowns[self.current_player][dino_type] = cooldown_times[dino_type]
+            # (en secondes - cooldowns des boutons)
+            self.spawn_cooldowns[self.current_player][dino_type] = SPAWN_COOLDOWNS[dino_type]
             
             # Marquer qu'une action de spawn a été effectuée (utile pour l'IA)
             self.spawn_action_done = True
@@ -530,8 +585,8 @@ class Game:
     def place_trap(self, x, y):
         """Place un piège à la position donnée"""
         if self.is_cell_free(x, y):
-            # Coût du piège (ajustez selon vos besoins)
-            trap_cost = 30
+            # Coût du piège (voir Entities/rules.py)
+            trap_cost = TRAP_COST
             if self.current_player == 1:
                 if self.player1_steaks >= trap_cost:
                     self.player1_steaks -= trap_cost
@@ -543,8 +598,10 @@ class Game:
                 else:
                     return False
             
+            self.record_action('trap', x, y)
             trap = Trap(x, y, self.current_player)
             self.traps.append(trap)
+            self.occupancy.place('traps', trap)
             # Marquer qu'une action de piège a été effectuée
             self.spawn_action_done = True
             self.action_taken = True
@@ -564,14 +621,14 @@ class Game:
             elif target_egg and target_egg.player != dinosaur.player:
                 self.attack_egg(dinosaur, target_egg)
             else:
+                self.record_action('move', dinosaur.x, dinosaur.y, target_x, target_y)
                 # Jouer le son de pas selon le type de dinosaure
                 if dinosaur.dino_type == 3:  # Big dino
                     self.play_sound('big_step')
                 elif dinosaur.dino_type in [1, 2]:  # Little et Mid dino
                     self.play_sound('mid_little_step')
                 
-                dinosaur.x = target_x
-                dinosaur.y = target_y
+                self.occupancy.move('dinosaurs', dinosaur, target_x, target_y)
             
             dinosaur.has_moved = True
             # Marquer qu'une action a été effectuée (utile pour la fin de tour)
@@ -602,11 +659,7 @@ class Game:
     
     def is_on_mud(self, x, y):
         """Vérifie si une position est sur de la boue (dirt)"""
-        # Convertir les coordonnées logiques en coordonnées visuelles
-        # Les coordonnées sont les mêmes puisque la grille est 1:1
-        if 0 <= y < len(self.visual_base) and 0 <= x < len(self.visual_base[0]):
-            return self.visual_base[y][x] == 'dirt'
-        return False
+        return self.terrain.is_mud(x, y)
     
     def calculate_attack_targets(self, dinosaur):
         """Calcule les cibles d'attaque possibles pour un dinosaure"""
@@ -641,9 +694,9 @@ class Game:
                     
                     if 0 <= target_x < self.logic_width and 0 <= target_y < self.logic_height:
                         # Vérifier s'il y a un œuf de spawn ennemi
-                        for spawn_egg in self.spawn_eggs:
-                            if spawn_egg.x == target_x and spawn_egg.y == target_y and spawn_egg.player != dinosaur.player:
-                                attack_targets.append(('spawn_egg', target_x, target_y, spawn_egg))
+                        spawn_egg = self.occupancy.spawn_egg_at(target_x, target_y)
+                        if spawn_egg and spawn_egg.player != dinosaur.player:
+                            attack_targets.append(('spawn_egg', target_x, target_y, spawn_egg))
         
         return attack_targets
     
@@ -652,10 +705,11 @@ class Game:
         spawn_positions = []
         egg = self.eggs[self.current_player]
         
-        for x in range(max(0, egg.x - 3), min(self.logic_width, egg.x + 4)):
-            for y in range(max(0, egg.y - 3), min(self.logic_height, egg.y + 4)):
+        reach = SPAWN_MAX_DISTANCE
+        for x in range(max(0, egg.x - reach), min(self.logic_width, egg.x + reach + 1)):
+            for y in range(max(0, egg.y - reach), min(self.logic_height, egg.y + reach + 1)):
                 distance = abs(egg.x - x) + abs(egg.y - y)
-                if distance <= 3 and self.is_cell_free(x, y):
+                if distance <= reach and self.is_cell_free(x, y):
                     spawn_positions.append((x, y))
         
         return spawn_positions
@@ -738,6 +792,9 @@ class Game:
             'progress': 0.0
         }
         
+        # Sans affichage, le déplacement est immédiat
+        if self.headless:
+            self.finish_move_animation()
         return True
     
     def update_move_animation(self, delta_time):
@@ -783,9 +840,8 @@ class Game:
         target_x, target_y = anim['target_pos']
         
         # Effectuer le vrai déplacement
-        old_x, old_y = dinosaur.x, dinosaur.y
-        dinosaur.x = target_x
-        dinosaur.y = target_y
+        self.record_action('walk', dinosaur.x, dinosaur.y, target_x, target_y)
+        self.occupancy.move('dinosaurs', dinosaur, target_x, target_y)
         dinosaur.has_moved = True
         
         # Vérifier les pièges ennemis
@@ -800,7 +856,9 @@ class Game:
     def start_attack_animation(self, attacker, target):
         """Démarre l'animation d'attaque"""
         import math
-        import random
+        
+        if self.headless:
+            return
         
         self.attack_animation['active'] = True
         self.attack_animation['attacker_pos'] = (attacker.x, attacker.y)
@@ -822,16 +880,16 @@ class Game:
             x = start_x + (end_x - start_x) * t
             y = start_y + (end_y - start_y) * t
             # Ajouter un peu de variation aléatoire
-            x += random.randint(-5, 5)
-            y += random.randint(-5, 5)
+            x += self.rng.randint(-5, 5)
+            y += self.rng.randint(-5, 5)
             # Couleur selon le joueur de l'attaquant
             color = (255, 100, 100) if attacker.player == 2 else (100, 100, 255)
             self.attack_animation['particles'].append({
                 'x': x,
                 'y': y,
-                'size': random.randint(3, 7),
+                'size': self.rng.randint(3, 7),
                 'color': color,
-                'lifetime': 0.3 + random.random() * 0.2
+                'lifetime': 0.3 + self.rng.random() * 0.2
             })
     
     def update_attack_animation(self, delta_time):
@@ -852,35 +910,32 @@ class Game:
     
     def check_traps(self, dinosaur):
         """Vérifie si le dinosaure marche sur un piège ennemi"""
-        for trap in self.traps[:]:
-            # Le dinosaure marche sur un piège de l'adversaire
-            if (trap.x == dinosaur.x and trap.y == dinosaur.y and 
-                trap.player != dinosaur.player and not trap.activated):
-                
-                # Activer le piège
-                trap.activated = True
-                
-                # Infliger des dégâts au dinosaure
-                dinosaur.take_damage(50)
-                
-                # Le dinosaure sera immobilisé pendant 2 tours
-                dinosaur.immobilized_turns = 2
-                
-                # Retirer le piège
-                self.traps.remove(trap)
-                
-                # Si le dinosaure est mort, le retirer
-                if dinosaur.health <= 0:
-                    self.play_sound('death')
-                    if dinosaur in self.dinosaurs:
-                        self.dinosaurs.remove(dinosaur)
-                    # Donner des steaks au joueur qui a posé le piège
-                    if trap.player == 1:
-                        self.player1_steaks += 15
-                    else:
-                        self.player2_steaks += 15
-
-                return
+        trap = self.occupancy.trap_at(dinosaur.x, dinosaur.y)
+        # Le dinosaure marche sur un piège de l'adversaire
+        if trap and trap.player != dinosaur.player and not trap.activated:
+            
+            # Activer le piège
+            trap.activated = True
+            
+            # Infliger des dégâts au dinosaure
+            dinosaur.take_damage(TRAP_DAMAGE)
+            
+            # Le dinosaure sera immobilisé pendant 2 tours
+            dinosaur.immobilized_turns = TRAP_IMMOBILIZED_TURNS
+            
+            # Retirer le piège
+            self.traps.remove(trap)
+            self.occupancy.remove('traps', trap)
+            
+            # Si le dinosaure est mort, le retirer
+            if dinosaur.health <= 0:
+                self.play_sound('death')
+                self.remove_dinosaur(dinosaur)
+                # Donner des steaks au joueur qui a posé le piège
+                if trap.player == 1:
+                    self.player1_steaks += TRAP_KILL_REWARD
+                else:
+                    self.player2_steaks += TRAP_KILL_REWARD
     
     def is_enemy_at(self, x, y, player):
         """Vérifie s'il y a un ennemi à cette position"""
@@ -896,6 +951,136 @@ class Game:
         
         return False
     
+    def hatch_spawn_egg(self, spawn_egg):
+        """Fait éclore un œuf de spawn : le dinosaure prend sa place"""
+        self.record_action('hatch', spawn_egg.x, spawn_egg.y)
+        new_dino = Dinosaur(spawn_egg.x, spawn_egg.y, spawn_egg.player, spawn_egg.dino_type)
+        self.dinosaurs.append(new_dino)
+        self.spawn_eggs.remove(spawn_egg)
+        self.occupancy.remove('spawn_eggs', spawn_egg)
+        self.occupancy.place('dinosaurs', new_dino)
+        return new_dino
+    
+    def ticks(self):
+        """
+        Horloge de la partie en millisecondes
+        
+        pygame.time.get_ticks() avec affichage ; sans affichage, horloge
+        virtuelle qui avance de GameSimulator.SIMULATED_TURN_SECONDS à chaque
+        fin de tour, comme dans la simulation de l'IA
+        """
+        if self.headless:
+            return self.clock_ms
+        return pygame.time.get_ticks()
+    
+    def schedule_end_turn(self, delay_ms):
+        """Termine le tour après delay_ms (le temps de voir l'action), immédiatement sans affichage"""
+        if self.headless:
+            self.end_turn()
+        else:
+            self.auto_end_turn_time = pygame.time.get_ticks() + delay_ms
+    
+    def record_action(self, *action):
+        """Ajoute une action au journal de la partie (voir action_log.py)"""
+        self.action_log.record(action, self.spawn_cooldowns)
+    
+    def save_action_log(self):
+        """Enregistre le journal des actions dans logs/replays/"""
+        if not self.autosave_replay or not self.action_log.entries:
+            return
+        try:
+            path = self.action_log.save()
+            logger.info(f"Journal de la partie enregistré: {path}")
+        except OSError as e:
+            logger.error(f"Impossible d'enregistrer le journal de la partie: {e}")
+    
+    def snapshot(self):
+        """Instantané de l'état de règles de la partie (voir snapshot.py)"""
+        return Snapshot.capture(self)
+    
+    def restore_snapshot(self, snapshot):
+        """
+        Remplace l'état de la partie par celui d'un instantané
+        
+        Args:
+            snapshot (Snapshot): Instantané pris sur la même carte
+        
+        Raises:
+            SnapshotError: Carte ou taille de plateau différente
+        """
+        if (snapshot.map_name, snapshot.logic_width, snapshot.logic_height) != \
+                (self.map_name, self.logic_width, self.logic_height):
+            raise SnapshotError(f"Instantané de la carte {snapshot.map_name!r} "
+                                f"({snapshot.logic_width}x{snapshot.logic_height}), "
+                                f"partie sur {self.map_name!r}")
+        self.cancel_ai_thinking()
+        self.current_player = snapshot.current_player
+        self.turn_number = snapshot.turn_number
+        self.game_over = snapshot.game_over
+        self.winner = snapshot.winner
+        self.player1_steaks = snapshot.player1_steaks
+        self.player2_steaks = snapshot.player2_steaks
+        self.spawn_action_done = snapshot.spawn_action_done
+        self.spawn_cooldowns = {p: dict(c) for p, c in snapshot.spawn_cooldowns.items()}
+        
+        self.eggs = {}
+        for player, x, y, health in snapshot.eggs:
+            egg = Egg(x, y, player)
+            egg.health = health
+            self.eggs[player] = egg
+        self.dinosaurs = []
+        for player, dino_type, x, y, health, has_moved, immobilized_turns in snapshot.dinosaurs:
+            dino = Dinosaur(x, y, player, dino_type)
+            dino.health = health
+            dino.has_moved = bool(has_moved)
+            dino.immobilized_turns = immobilized_turns
+            self.dinosaurs.append(dino)
+        self.traps = [Trap(x, y, player) for player, x, y in snapshot.traps]
+        self.spawn_eggs = []
+        for player, dino_type, x, y, health, elapsed, is_hatching, hatch_time in snapshot.spawn_eggs:
+            spawn_egg = SpawnEgg(x, y, player, dino_type)
+            spawn_egg.health = health
+            spawn_egg.spawn_turns_elapsed = elapsed
+            spawn_egg.spawn_progress = min(1.0, elapsed / spawn_egg.spawn_turns_required)
+            spawn_egg.is_hatching = bool(is_hatching)
+            spawn_egg.hatch_animation_time = hatch_time
+            self.spawn_eggs.append(spawn_egg)
+        self.occupancy = OccupancyIndex.from_game(self)
+        
+        # Le journal repart de cette position, qu'il embarque pour le rejeu
+        self.action_log = ActionLog(self.map_name, self.game_mode, self.seed,
+                                    start=snapshot.to_bytes())
+        self.clear_selection()
+        self.action_taken = False
+        self.auto_end_turn_time = None
+        self.turn_start_time = self.ticks()
+    
+    def autosave(self):
+        """Écrit l'instantané de reprise (AUTOSAVE_PATH) tant que la partie continue"""
+        if not self.autosave_snapshot or self.game_over:
+            return
+        try:
+            self.snapshot().save(AUTOSAVE_PATH)
+        except OSError as e:
+            logger.error(f"Impossible d'enregistrer la sauvegarde automatique: {e}")
+    
+    def clear_autosave(self):
+        """Supprime l'instantané de reprise (partie terminée)"""
+        if not self.autosave_snapshot:
+            return
+        try:
+            os.remove(AUTOSAVE_PATH)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Impossible de supprimer la sauvegarde automatique: {e}")
+    
+    def remove_dinosaur(self, dinosaur):
+        """Retire un dinosaure du plateau (liste et index)"""
+        if dinosaur in self.dinosaurs:
+            self.dinosaurs.remove(dinosaur)
+        self.occupancy.remove('dinosaurs', dinosaur)
+    
     def clear_selection(self):
         """Efface la sélection actuelle"""
         self.action_mode = None
@@ -909,10 +1094,10 @@ class Game:
     
     def attack(self, attacker, defender):
         """Gère le combat entre deux dinosaures - seul le défenseur prend des dégâts"""
+        self.record_action('attack', attacker.x, attacker.y, defender.x, defender.y)
         # Vérifier si le défenseur est déjà mort (bug de nettoyage)
         if defender.health <= 0:
-            if defender in self.dinosaurs:
-                self.dinosaurs.remove(defender)
+            self.remove_dinosaur(defender)
             return
         
         # Démarrer l'animation d'attaque
@@ -929,18 +1114,18 @@ class Game:
             self.play_sound('death')
             
             # Supprimer le dinosaure de la liste
-            if defender in self.dinosaurs:
-                self.dinosaurs.remove(defender)
+            self.remove_dinosaur(defender)
             
             self.show_kill_notification(attacker.player, 'dinosaur')
             if attacker.player == 1:
-                self.player1_steaks += 20
+                self.player1_steaks += KILL_REWARD
             else:
-                self.player2_steaks += 20
+                self.player2_steaks += KILL_REWARD
         
     
     def attack_egg(self, attacker, egg):
         """Attaque un œuf ennemi"""
+        self.record_action('attack_egg', attacker.x, attacker.y, egg.player)
         # Démarrer l'animation d'attaque
         self.start_attack_animation(attacker, egg)
         
@@ -955,6 +1140,7 @@ class Game:
     
     def attack_spawn_egg(self, attacker, spawn_egg):
         """Attaque un œuf de spawn ennemi"""
+        self.record_action('attack_spawn_egg', attacker.x, attacker.y, spawn_egg.x, spawn_egg.y)
         # Démarrer l'animation d'attaque
         self.start_attack_animation(attacker, spawn_egg)
         
@@ -964,23 +1150,26 @@ class Game:
         # Si l'œuf de spawn est détruit, le retirer de la liste
         if spawn_egg.health <= 0:
             self.spawn_eggs.remove(spawn_egg)
+            self.occupancy.remove('spawn_eggs', spawn_egg)
             self.show_kill_notification(attacker.player, 'spawn_egg')
             # Donner des steaks pour avoir détruit un œuf de spawn
             if attacker.player == 1:
-                self.player1_steaks += 15
+                self.player1_steaks += SPAWN_EGG_KILL_REWARD
             else:
-                self.player2_steaks += 15
+                self.player2_steaks += SPAWN_EGG_KILL_REWARD
         
         attacker.has_moved = True
         self.action_taken = True
     
     def end_turn(self):
         """Termine le tour du joueur actuel"""
+        self.record_action('end_turn')
+        
         # Donner des steaks au joueur
         if self.current_player == 1:
-            self.player1_steaks += 20
+            self.player1_steaks += TURN_INCOME
         else:
-            self.player2_steaks += 20
+            self.player2_steaks += TURN_INCOME
 
         # Mettre à jour les œufs de spawn
         for egg in self.spawn_eggs:
@@ -996,7 +1185,8 @@ class Game:
         self.current_player = 2 if self.current_player == 1 else 1
         if self.current_player == 1:
             self.turn_number += 1
-            logger.info(f"Tour {self.turn_number} - Joueur {self.current_player}")
+            if not self.headless:
+                logger.info(f"Tour {self.turn_number} - Joueur {self.current_player}")
         
         # Réduire l'immobilisation des dinosaures du NOUVEAU joueur actuel
         # (ceux qui vont jouer maintenant)
@@ -1024,26 +1214,32 @@ class Game:
         self.auto_end_turn_time = None
         self.clear_selection()
         
-        # Réinitialiser le timer du tour
-        self.turn_start_time = pygame.time.get_ticks()
+        # Réinitialiser le timer du tour (sans affichage, un tour dure le temps
+        # supposé par la simulation de l'IA : cooldowns et éclosions avancent
+        # au prochain update())
+        if self.headless:
+            self.clock_ms += int(GameSimulator.SIMULATED_TURN_SECONDS * 1000)
+        self.turn_start_time = self.ticks()
         
         # Réinitialiser complètement l'état de l'IA
-        self.ai_thinking = False
+        self.cancel_ai_thinking()
         # Réinitialiser aussi le timer IA pour qu'elle ne rejoue pas immédiatement
         if old_player == self.ai_player:
             self.ai_action_timer = 0
         
         # Vérifier les conditions de victoire
         self.check_victory()
+        self.autosave()
     
     def restart_game(self):
         """Redémarre le jeu"""
+        self.cancel_ai_thinking()
         self.current_player = 1
         self.turn_number = 1
         self.game_over = False
         self.winner = None
-        self.player1_steaks = 100
-        self.player2_steaks = 100
+        self.player1_steaks = STARTING_STEAKS
+        self.player2_steaks = STARTING_STEAKS
         self.eggs = {}
         self.dinosaurs = []
         self.traps = []
@@ -1056,7 +1252,7 @@ class Game:
         self.action_taken = False
         self.spawn_action_done = False
         self.spawn_cooldowns = {1: {1: 0, 2: 0, 3: 0}, 2: {1: 0, 2: 0, 3: 0}}
-        self.turn_start_time = pygame.time.get_ticks()
+        self.turn_start_time = self.ticks()
         self.auto_end_turn_time = None
         
         self.move_animation = {
@@ -1069,9 +1265,14 @@ class Game:
             'progress': 0
         }
         
+        self.seed = random.randrange(1 << 32)
+        self.rng = random.Random(self.seed)
+        
         # Générer une nouvelle carte
         self.grid = self.map_generator.generate_map()
         self.visual_base, self.visual_elements = self.map_generator.generate_visual_map()
+        self.terrain = self.compile_terrain()
+        self.terrain_chunks = {}
         self.init_game()
     
     def cancel_action(self):
@@ -1104,30 +1305,22 @@ class Game:
         if quit_button.collidepoint(mouse_pos):
             # Retourner au menu principal
             import main
+            self.cancel_ai_thinking()
+            self.save_action_log()
+            self.autosave()
             pygame.mixer.music.stop()
-            main.main()
+            main.main([])  # Sans les arguments de la ligne de commande (--resume)
             return
     
+    def compile_terrain(self):
+        """Compile les couches visuelles de la carte en tables logiques (arbres, boue)"""
+        return TerrainMap.compile(self.visual_base, self.visual_elements,
+                                  self.logic_width, self.logic_height,
+                                  self.visual_width, self.visual_height)
+    
     def has_tree_at(self, x, y):
         """Vérifie s'il y a un arbre à cette position logique"""
-        # Convertir les coordonnées logiques en coordonnées visuelles
-        # Chaque case logique correspond à visual_width/logic_width cases visuelles
-        visual_per_logic_x = self.visual_width / self.logic_width
-        visual_per_logic_y = self.visual_height / self.logic_height
-        
-        # Vérifier toutes les cases visuelles correspondant à cette case logique
-        visual_x_start = int(x * visual_per_logic_x)
-        visual_x_end = int((x + 1) * visual_per_logic_x)
-        visual_y_start = int(y * visual_per_logic_y)
-        visual_y_end = int((y + 1) * visual_per_logic_y)
-        
-        # S'il y a un arbre dans n'importe quelle case visuelle de cette zone, la case est bloquée
-        for vy in range(visual_y_start, visual_y_end):
-            for vx in range(visual_x_start, visual_x_end):
-                if vy < len(self.visual_elements) and vx < len(self.visual_elements[vy]):
-                    if self.visual_elements[vy][vx] == 'tree':
-                        return True
-        return False
+        return self.terrain.is_blocked(x, y)
     
     def is_cell_free(self, x, y):
         """Vérifie si une case est libre"""
@@ -1135,33 +1328,14 @@ class Game:
         if self.has_tree_at(x, y):
             return False
         
-        # Vérifier les œufs
-        for egg in self.eggs.values():
-            if egg.x == x and egg.y == y:
-                return False
-        
-        # Vérifier les dinosaures
-        for dino in self.dinosaurs:
-            if dino.x == x and dino.y == y:
-                return False
-        
-        # Vérifier les pièges
-        for trap in self.traps:
-            if trap.x == x and trap.y == y:
-                return False
-        
-        # Vérifier les œufs de spawn
-        for spawn_egg in self.spawn_eggs:
-            if spawn_egg.x == x and spawn_egg.y == y:
-                return False
-        
-        return True
+        # Œufs, dinosaures, pièges et œufs de spawn
+        return not self.occupancy.is_occupied(x, y)
     
     def is_near_egg(self, x, y, player):
         """Vérifie si une position est proche de l'œuf du joueur"""
         egg = self.eggs[player]
         distance = abs(egg.x - x) + abs(egg.y - y)
-        return distance <= 3
+        return distance <= SPAWN_MAX_DISTANCE
     
     def can_move_to(self, dinosaur, x, y):
         """Vérifie si un dinosaure peut se déplacer vers une position"""
@@ -1174,34 +1348,32 @@ class Game:
             return False
         
         # Vérifier qu'il n'y a pas d'œuf de spawn
-        for spawn_egg in self.spawn_eggs:
-            if spawn_egg.x == x and spawn_egg.y == y:
-                return False
+        if self.occupancy.spawn_egg_at(x, y):
+            return False
         
         distance = abs(dinosaur.x - x) + abs(dinosaur.y - y)
         return distance <= dinosaur.movement_range
     
     def get_dinosaur_at(self, x, y):
         """Retourne le dinosaure à la position donnée"""
-        for dino in self.dinosaurs:
-            if dino.x == x and dino.y == y:
-                return dino
-        return None
+        return self.occupancy.dinosaur_at(x, y)
     
     def get_egg_at(self, x, y):
         """Retourne l'œuf à la position donnée"""
-        for egg in self.eggs.values():
-            if egg.x == x and egg.y == y:
-                return egg
-        return None
+        return self.occupancy.egg_at(x, y)
     
     def check_victory(self):
         """Vérifie les conditions de victoire"""
+        if self.game_over:
+            return
         for player, egg in self.eggs.items():
             if egg.health <= 0:
                 self.game_over = True
                 self.winner = 2 if player == 1 else 1
-                logger.info(f"Partie terminée - Victoire du Joueur {self.winner} au tour {self.turn_number}")
+                if not self.headless:
+                    logger.info(f"Partie terminée - Victoire du Joueur {self.winner} au tour {self.turn_number}")
+                self.save_action_log()
+                self.clear_autosave()
                 break
     
     def update(self):
@@ -1210,13 +1382,17 @@ class Game:
         dead_dinos = [d for d in self.dinosaurs if d.health <= 0]
         if dead_dinos:
             for d in dead_dinos:
-                self.dinosaurs.remove(d)
+                self.remove_dinosaur(d)
         
         # Gérer les cooldowns et le temps
-        current_time = pygame.time.get_ticks()
+        current_time = self.ticks()
         delta_time = (current_time - self.last_time) / 1000.0  # en secondes
         self.last_time = current_time
         
+        # Défilement de la caméra aux flèches
+        if not self.headless and not (self.paused or self.settings_open):
+            self.scroll_camera(delta_time)
+        
         # Décrémenter les cooldowns
         for player in [1, 2]:
             for dino_type in [1, 2, 3]:
@@ -1229,7 +1405,7 @@ class Game:
         if self.ambient_sound_timer <= 0:
             self.play_sound('ambient')
             # Réinitialiser le timer avec un délai aléatoire entre 5 et 15 secondes
-            self.ambient_sound_timer = random.uniform(5, 15)
+            self.ambient_sound_timer = self.rng.uniform(5, 15)
         
         # Gérer le timer du tour (2 minutes max)
         elapsed_time = (current_time - self.turn_start_time) / 1000.0
@@ -1248,8 +1424,7 @@ class Game:
             self.update_attack_animation(delta_time)
         
         # Mettre à jour les œufs de spawn
-        spawn_eggs_to_remove = []
-        for i, spawn_egg in enumerate(self.spawn_eggs):
+        for spawn_egg in self.spawn_eggs[:]:
             spawn_egg.update_spawn(delta_time)
             if spawn_egg.is_ready_to_hatch():
                 # Jouer le son de crack d'œuf puis le cri du dinosaure
@@ -1258,17 +1433,12 @@ class Game:
                 # Attendre un court instant puis jouer le cri du dino
                 sound_map = {1: 'little_dino', 2: 'mid_dino', 3: 'big_dino'}
                 # Utiliser un timer pour jouer le cri après le crack (on le joue quand même direct pour la simplicité)
-                pygame.time.delay(300)  # 300ms de délai
+                if not self.headless:
+                    pygame.time.delay(300)  # 300ms de délai
                 self.play_sound(sound_map[spawn_egg.dino_type])
                 
                 # Créer le dinosaure et supprimer l'œuf
-                new_dino = Dinosaur(spawn_egg.x, spawn_egg.y, spawn_egg.player, spawn_egg.dino_type)
-                self.dinosaurs.append(new_dino)
-                spawn_eggs_to_remove.append(i)
-        
-        # Supprimer les œufs éclos (en ordre inverse pour éviter les problèmes d'index)
-        for i in reversed(spawn_eggs_to_remove):
-            self.spawn_eggs.pop(i)
+                self.hatch_spawn_egg(spawn_egg)
 
         # Mettre à jour le pop-up de tour
         self.update_turn_popup(delta_time)
@@ -1279,26 +1449,84 @@ class Game:
         # Mettre à jour la notification d'élimination
         self.update_kill_notification(delta_time)
         
+        # Pendant le tour humain, lancer la réflexion anticipée de l'IA (une fois par tour)
+        if (self.game_mode == "ai" and not self.game_over and self.ponderer
+                and self.current_player != self.ai_player and not self.ponder_started):
+            self.ponder_started = True
+            self.ponderer.start(GameSimulator.copy_game_state(self))
+        
         # Gérer l'IA (joueur 2) - seulement en mode IA
         if self.game_mode == "ai" and not self.game_over and self.current_player == self.ai_player:
+            if self.headless:
+                # Sans affichage, rien à ne pas figer : l'IA décide et joue aussitôt
+                self.execute_ai_turn()
+            elif self.ai_thinking:
+                # Récupérer la décision dès qu'elle est prête (sans bloquer la frame)
+                self.poll_ai_turn()
             # L'IA peut jouer si elle n'est pas en train de réfléchir et qu'il n'y a pas d'animation en cours
-            if not self.ai_thinking and not self.move_animation['active'] and not self.attack_animation['active']:
+            elif not self.move_animation['active'] and not self.attack_animation['active']:
                 # Attendre un délai avant que l'IA joue
                 self.ai_action_timer += delta_time
                 if self.ai_action_timer >= self.ai_action_delay:
-                    self.ai_thinking = True
                     self.ai_action_timer = 0
-                    # L'IA choisit et exécute une action
-                    self.execute_ai_turn()
+                    # L'IA commence à réfléchir en arrière-plan
+                    self.start_ai_turn()
         
         # Vérifier les conditions de victoire
         if not self.game_over:
             self.check_victory()
 
-        # (IA gérée par le timer et execute_ai_turn() de façon synchrone)
+    def start_ai_turn(self):
+        """Lance la réflexion de l'IA en arrière-plan sur un instantané de l'état."""
+        if self.current_player != self.ai_player:
+            return
+        
+        if not getattr(self, 'ai', None) or not self.ai_worker:
+            logger.warning("IA non initialisée, fin du tour")
+            self.end_turn()
+            return
+        
+        # L'IA travaille sur une copie figée, jamais sur l'objet Game vivant
+        snapshot = GameSimulator.copy_game_state(self)
+        
+        # Réponse préparée pendant le tour humain : jouer sans réfléchir
+        if self.ponderer:
+            action = self.ponderer.lookup(snapshot)
+            if action:
+                self.execute_ai_action(action)
+                return
+        
+        self.ai_worker.start(snapshot)
+        self.ai_thinking = True
+
+    def poll_ai_turn(self):
+        """Applique la décision de l'IA si la réflexion en arrière-plan est terminée."""
+        done, action, error = self.ai_worker.poll()
+        if not done:
+            return
+        
+        self.ai_thinking = False
+        if self.current_player != self.ai_player or self.game_over:
+            return  # Le tour a changé pendant la réflexion
+        
+        if error is not None:
+            self.end_turn()
+        elif action:
+            self.execute_ai_action(action)
+        else:
+            self.end_turn()
+
+    def cancel_ai_thinking(self):
+        """Annule la réflexion de l'IA en cours (son résultat sera ignoré)."""
+        if getattr(self, 'ponderer', None):
+            self.ponderer.stop()
+        if getattr(self, 'ai_worker', None):
+            self.ai_worker.cancel()
+        self.ai_thinking = False
+        self.ponder_started = False
 
     def execute_ai_turn(self):
-        """Fait jouer l'IA pour son tour (appel synchrone depuis la boucle principale)."""
+        """Fait jouer l'IA pour son tour de façon synchrone (bloque jusqu'à la décision)."""
         try:
             # Vérifier que c'est bien le tour de l'IA
             if self.current_player != self.ai_player:
@@ -1316,6 +1544,7 @@ class Game:
             if self.move_animation['active'] or self.attack_animation['active']:
                 self.ai_thinking = False
                 return
+            self.ai.stop_event.clear()
             action = self.ai.choose_action(self)
             
             if action:
@@ -1343,20 +1572,10 @@ class Game:
             dino_type = action.get('dino_type')
             if x is not None and y is not None and dino_type is not None:
                 # Vérifier que la case est toujours libre
-                is_free = True
-                for egg in self.eggs.values():
-                    if egg.x == x and egg.y == y:
-                        is_free = False
-                        break
-                for dino in self.dinosaurs:
-                    if dino.x == x and dino.y == y:
-                        is_free = False
-                        break
+                is_free = not self.get_egg_at(x, y) and not self.get_dinosaur_at(x, y)
                 
-                if is_free:
-                    self.spawn_dinosaur(x, y, dino_type)
-                    self.spawn_action_done = True
-                    self.auto_end_turn_time = pygame.time.get_ticks() + 1500
+                if is_free and self.spawn_dinosaur(x, y, dino_type):
+                    self.schedule_end_turn(1500)
                 else:
                     self.end_turn()
             else:
@@ -1368,19 +1587,16 @@ class Game:
             target_y = action.get('target_y')
             if dinosaur and target_x is not None and target_y is not None:
                 # Trouver le dinosaure réel correspondant
-                real_dino = None
-                for d in self.dinosaurs:
-                    if (d.x == dinosaur.x and d.y == dinosaur.y and d.player == dinosaur.player and 
-                        d.dino_type == getattr(dinosaur, 'dino_type', d.dino_type) and not d.has_moved and d.health > 0):
-                        real_dino = d
-                        break
+                real_dino = self.get_dinosaur_at(dinosaur.x, dinosaur.y)
+                if not (real_dino and real_dino.player == dinosaur.player and
+                        real_dino.dino_type == getattr(dinosaur, 'dino_type', real_dino.dino_type) and
+                        not real_dino.has_moved and real_dino.health > 0):
+                    real_dino = None
 
-                if real_dino and not real_dino.has_moved and real_dino.immobilized_turns == 0:
-                    self.move_dinosaur(real_dino, target_x, target_y)
-                    # Marquer le dinosaure comme ayant bougé
-                    real_dino.has_moved = True
+                if (real_dino and not real_dino.has_moved and real_dino.immobilized_turns == 0
+                        and self.move_dinosaur(real_dino, target_x, target_y)):
                     # Fin de tour automatique après mouvement
-                    self.auto_end_turn_time = pygame.time.get_ticks() + 800
+                    self.schedule_end_turn(800)
                 else:
                     self.end_turn()
             else:
@@ -1392,12 +1608,11 @@ class Game:
             target_type = action.get('target_type', 'dinosaur')
 
             if attacker:
-                real_attacker = None
-                for d in self.dinosaurs:
-                    if (d.x == attacker.x and d.y == attacker.y and d.player == attacker.player and 
-                        d.dino_type == getattr(attacker, 'dino_type', d.dino_type) and not d.has_moved and d.health > 0):
-                        real_attacker = d
-                        break
+                real_attacker = self.get_dinosaur_at(attacker.x, attacker.y)
+                if not (real_attacker and real_attacker.player == attacker.player and
+                        real_attacker.dino_type == getattr(attacker, 'dino_type', real_attacker.dino_type) and
+                        not real_attacker.has_moved and real_attacker.health > 0):
+                    real_attacker = None
 
                 if real_attacker and not real_attacker.has_moved and real_attacker.immobilized_turns == 0:
                     action_executed = False
@@ -1407,12 +1622,11 @@ class Game:
                             self.attack_egg(real_attacker, egg)
                             action_executed = True
                     elif target:
-                        real_target = None
-                        for d in self.dinosaurs:
-                            if (d.x == target.x and d.y == target.y and d.player == target.player and 
-                                d.dino_type == getattr(target, 'dino_type', d.dino_type) and d.health > 0):
-                                real_target = d
-                                break
+                        real_target = self.get_dinosaur_at(target.x, target.y)
+                        if not (real_target and real_target.player == target.player and
+                                real_target.dino_type == getattr(target, 'dino_type', real_target.dino_type) and
+                                real_target.health > 0):
+                            real_target = None
                         # Vérifier que l'attaquant et la cible ne sont pas du même joueur
                         if real_target and real_target.player != real_attacker.player:
                             self.attack(real_attacker, real_target)
@@ -1424,7 +1638,7 @@ class Game:
                         # Marquer l'attaquant comme ayant agi
                         real_attacker.has_moved = True
                         # Fin de tour automatique après attaque
-                        self.auto_end_turn_time = pygame.time.get_ticks() + 1200
+                        self.schedule_end_turn(1200)
                     else:
                         self.end_turn()
                 else:
@@ -1434,29 +1648,81 @@ class Game:
 
         elif action_type == 'trap':
             x, y = action.get('x'), action.get('y')
-            if x is not None and y is not None:
-                self.place_trap(x, y)
-                self.spawn_action_done = True
-                self.auto_end_turn_time = pygame.time.get_ticks() + 1000
+            if x is not None and y is not None and self.place_trap(x, y):
+                self.schedule_end_turn(1000)
             else:
                 self.end_turn()
         else:
             self.end_turn()
     
+    def apply_camera(self):
+        """Reporte le zoom et le défilement de la caméra sur les dimensions de dessin"""
+        camera = self.camera
+        self.cell_size = camera.cell_size
+        self.logic_cell_width = self.logic_cell_height = self.cell_size
+        self.visual_cell_width = self.visual_cell_height = self.cell_size
+        self.cell_width = self.cell_height = self.cell_size
+        self.board_width = camera.board_width
+        self.board_height = camera.board_height
+        self.board_offset_x = camera.offset_x
+        self.board_offset_y = camera.offset_y
+    
+    def handle_camera_event(self, event):
+        """
+        Zoom à la molette (autour du curseur), défilement en glissant avec le
+        bouton droit ou du milieu
+
+        Returns:
+            bool: True si l'événement a été consommé par la caméra
+        """
+        if event.type == pygame.MOUSEWHEEL:
+            if self.camera.zoom(event.y, pygame.mouse.get_pos()):
+                self.apply_camera()
+            return True
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button in (2, 3):
+            self.camera_drag = event.pos
+            return True
+        if event.type == pygame.MOUSEBUTTONUP and event.button in (2, 3):
+            self.camera_drag = None
+            return True
+        if event.type == pygame.MOUSEMOTION and self.camera_drag is not None:
+            self.camera.scroll_by(self.camera_drag[0] - event.pos[0], self.camera_drag[1] - event.pos[1])
+            self.camera_drag = event.pos
+            self.apply_camera()
+            return True
+        return False
+    
+    def scroll_camera(self, delta_time):
+        """Fait défiler la caméra tant qu'une flèche est enfoncée"""
+        keys = pygame.key.get_pressed()
+        dx = keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]
+        dy = keys[pygame.K_DOWN] - keys[pygame.K_UP]
+        if dx or dy:
+            step = CAMERA_SCROLL_SPEED * min(delta_time, 0.1)
+            self.camera.scroll_by(dx * step, dy * step)
+            self.apply_camera()
+    
     def draw(self):
         """Dessine le jeu"""
+        if self.headless:
+            return
         self.screen.fill((50, 50, 50))
+        # Le plateau défile sous l'UI : ses calques sont limités à la vue de la caméra
+        board_clip = pygame.Rect(self.camera.viewport)
         
         # Dessiner la grille
+        self.screen.set_clip(board_clip)
         self.draw_grid()
         
         # Dessiner les entités
         self.draw_entities()
+        self.screen.set_clip(None)
         
         # Dessiner l'UI
         self.ui.draw(self)
         
         # Dessiner les indications de sélection
+        self.screen.set_clip(board_clip)
         if self.selected_cell:
             self.draw_selection()
         
@@ -1466,11 +1732,6 @@ class Game:
         # Dessiner les cibles d'attaque possibles seulement en mode attaque
         if self.action_mode == 'attack_mode':
             self.draw_attack_targets()
-            self.draw_attack_mode_instruction()
-        
-        # Dessiner le message d'instruction pour les pièges
-        if self.action_mode == 'trap':
-            self.draw_trap_mode_instruction()
         
         # Dessiner les positions de spawn possibles
         self.draw_spawn_positions()
@@ -1478,6 +1739,13 @@ class Game:
         # Dessiner l'animation d'attaque
         if self.attack_animation['active']:
             self.draw_attack_animation()
+        self.screen.set_clip(None)
+        
+        # Dessiner les messages d'instruction des modes attaque et piège
+        if self.action_mode == 'attack_mode':
+            self.draw_attack_mode_instruction()
+        if self.action_mode == 'trap':
+            self.draw_trap_mode_instruction()
         
         # Dessiner le pop-up de changement de tour
         if self.turn_popup['active']:
@@ -1504,62 +1772,121 @@ class Game:
             self.draw_victory_screen()
     
     def draw_grid(self):
-        """Dessine la grille de jeu avec des cases carrées et des textures complètes"""
+        """Dessine la partie visible de la grille, bloc de terrain par bloc de terrain"""
+        size = self.cell_size
+        chunk = self.terrain_chunk_cells()
+        x0, y0, x1, y1 = self.camera.visible_cells()
+        if x0 >= x1 or y0 >= y1:
+            return
+        for chunk_y in range(y0 // chunk, (y1 - 1) // chunk + 1):
+            for chunk_x in range(x0 // chunk, (x1 - 1) // chunk + 1):
+                surface = self.terrain_chunk(chunk_x, chunk_y, chunk)
+                self.screen.blit(surface, (self.board_offset_x + chunk_x * chunk * size,
+                                           self.board_offset_y + chunk_y * chunk * size))
+        
+        # Dessiner les lignes de grille principales pour plus de clarté
+        if size < BORDERLESS_CELL_SIZE:
+            return
+        top = self.board_offset_y + y0 * size
+        bottom = self.board_offset_y + y1 * size
+        left = self.board_offset_x + x0 * size
+        right = self.board_offset_x + x1 * size
+        for x in range(x0, x1 + 1):
+            pygame.draw.line(self.screen, (40, 40, 40), 
+                           (self.board_offset_x + x * size, top), 
+                           (self.board_offset_x + x * size, bottom), 3)
+        
+        for y in range(y0, y1 + 1):
+            pygame.draw.line(self.screen, (40, 40, 40), 
+                           (left, self.board_offset_y + y * size), 
+                           (right, self.board_offset_y + y * size), 3)
+    
+    def terrain_chunk_cells(self):
+        """Côté d'un bloc de terrain, en cases (environ TERRAIN_CHUNK_PIXELS pixels)"""
+        return max(1, TERRAIN_CHUNK_PIXELS // self.cell_size)
+    
+    def terrain_chunk(self, chunk_x, chunk_y, chunk):
+        """
+        Surface d'un bloc de chunk x chunk cases, dessinée à la première demande
+
+        Les blocs sont gardés par taille de case (les plus anciennement
+        utilisés sont oubliés au-delà de TERRAIN_CHUNK_CACHE) : une image ne
+        coûte que quelques blits, quelle que soit la carte, et revenir à un
+        zoom déjà affiché ne redessine rien.
+        """
+        key = (self.cell_size, chunk_x, chunk_y)
+        surface = self.terrain_chunks.pop(key, None)
+        if surface is None:
+            x0, y0 = chunk_x * chunk, chunk_y * chunk
+            surface = self.render_terrain(x0, y0, min(x0 + chunk, self.logic_width),
+                                          min(y0 + chunk, self.logic_height))
+            if len(self.terrain_chunks) >= TERRAIN_CHUNK_CACHE:
+                del self.terrain_chunks[next(iter(self.terrain_chunks))]
+        # Réinsérer en dernier : l'ordre du dictionnaire suit l'utilisation
+        self.terrain_chunks[key] = surface
+        return surface
+    
+    def render_terrain(self, x0, y0, x1, y1):
+        """
+        Dessine les cases x0 <= x < x1, y0 <= y < y1 (textures, damier, bordures)
+
+        Le terrain ne change pas pendant une partie : chaque bloc est dessiné
+        une fois par taille de case puis recopié d'un seul blit. Chaque texture
+        n'est redimensionnée qu'une fois par bloc. Sous BORDERLESS_CELL_SIZE
+        pixels par case, les bordures et les lignes de grille recouvriraient
+        les cases : elles ne sont pas dessinées (les lignes de grille, qui
+        débordent des cases, sont tracées par draw_grid).
+
+        Returns:
+            pygame.Surface: Surface de (x1 - x0) x (y1 - y0) cases
+        """
+        size = self.cell_size
+        surface = pygame.Surface(((x1 - x0) * size, (y1 - y0) * size))
+        scaled = {}
+        
+        def scaled_image(terrain_type):
+            if terrain_type not in scaled:
+                image = self.map_generator.get_terrain_image(terrain_type)
+                scaled[terrain_type] = pygame.transform.scale(image, (size, size)) if image else None
+            return scaled[terrain_type]
+        
+        # Effet damier subtil pour la lisibilité
+        overlay = pygame.Surface((size, size))
+        overlay.set_alpha(15)
+        overlay.fill((255, 255, 255))
+        borders = size >= BORDERLESS_CELL_SIZE
+        
         # Dessiner chaque case avec sa texture
-        for y in range(self.logic_height):
-            for x in range(self.logic_width):
-                # Position de la case (avec offset pour centrer)
-                cell_x = self.board_offset_x + x * self.cell_size
-                cell_y = self.board_offset_y + y * self.cell_size
+        for y in range(y0, y1):
+            base_row = self.visual_base[y] if y < len(self.visual_base) else ()
+            elements_row = self.visual_elements[y] if y < len(self.visual_elements) else ()
+            for x in range(x0, x1):
+                cell_x = (x - x0) * size
+                cell_y = (y - y0) * size
                 
                 # Récupérer le terrain de base
-                if y < len(self.visual_base) and x < len(self.visual_base[y]):
-                    base_terrain = self.visual_base[y][x]
-                    base_image = self.map_generator.get_terrain_image(base_terrain)
-                    
+                if x < len(base_row):
+                    base_terrain = base_row[x]
+                    base_image = scaled_image(base_terrain)
                     if base_image:
-                        # Redimensionner pour remplir toute la case carrée
-                        scaled_image = pygame.transform.scale(base_image, (self.cell_size, self.cell_size))
-                        self.screen.blit(scaled_image, (cell_x, cell_y))
+                        surface.blit(base_image, (cell_x, cell_y))
                     else:
                         # Fallback avec couleur unie
-                        color = self.get_terrain_color(base_terrain)
-                        pygame.draw.rect(self.screen, color, 
-                                       (cell_x, cell_y, self.cell_size, self.cell_size))
+                        surface.fill(self.get_terrain_color(base_terrain), (cell_x, cell_y, size, size))
                 
                 # Dessiner les éléments par-dessus (arbres, fleurs, etc.)
-                if y < len(self.visual_elements) and x < len(self.visual_elements[y]):
-                    element_terrain = self.visual_elements[y][x]
-                    
-                    if element_terrain:
-                        element_image = self.map_generator.get_terrain_image(element_terrain)
-                        
-                        if element_image:
-                            scaled_image = pygame.transform.scale(element_image, 
-                                                                (self.cell_size, self.cell_size))
-                            self.screen.blit(scaled_image, (cell_x, cell_y))
+                if x < len(elements_row) and elements_row[x]:
+                    element_image = scaled_image(elements_row[x])
+                    if element_image:
+                        surface.blit(element_image, (cell_x, cell_y))
                 
-                # Effet damier subtil pour la lisibilité
                 if (x + y) % 2 == 0:
-                    overlay = pygame.Surface((self.cell_size, self.cell_size))
-                    overlay.set_alpha(15)
-                    overlay.fill((255, 255, 255))
-                    self.screen.blit(overlay, (cell_x, cell_y))
+                    surface.blit(overlay, (cell_x, cell_y))
                 
                 # Bordure de case
-                pygame.draw.rect(self.screen, (80, 80, 80), 
-                               (cell_x, cell_y, self.cell_size, self.cell_size), 2)
-        
-        # Dessiner les lignes de grille principales pour plus de clarté
-        for x in range(self.logic_width + 1):
-            pygame.draw.line(self.screen, (40, 40, 40), 
-                           (self.board_offset_x + x * self.cell_size, self.board_offset_y), 
-                           (self.board_offset_x + x * self.cell_size, self.board_offset_y + self.board_height), 3)
-        
-        for y in range(self.logic_height + 1):
-            pygame.draw.line(self.screen, (40, 40, 40), 
-                           (self.board_offset_x, self.board_offset_y + y * self.cell_size), 
-                           (self.board_offset_x + self.board_width, self.board_offset_y + y * self.cell_size), 3)
+                if borders:
+                    pygame.draw.rect(surface, (80, 80, 80), (cell_x, cell_y, size, size), 2)
+        return surface
     
     def get_terrain_color(self, terrain_type):
         """Retourne une couleur de fallback pour chaque type de terrain"""
@@ -1576,31 +1903,36 @@ class Game:
         return terrain_colors.get(terrain_type, (34, 139, 34))  # Défaut : vert herbe
     
     def draw_entities(self):
-        """Dessine toutes les entités du jeu"""
+        """Dessine les entités visibles (recherche dans l'index spatial, voir OccupancyIndex.in_rect)"""
+        margin = -(-ENTITY_DRAW_MARGIN // self.cell_size)
+        x0, y0, x1, y1 = self.camera.visible_cells(margin)
+        visible = self.occupancy.in_rect
+        
         # Dessiner les œufs
-        for egg in self.eggs.values():
+        for egg in visible('eggs', x0, y0, x1, y1):
             egg.draw(self.screen, self.cell_width, self.cell_height, self.board_offset_x, self.board_offset_y)
         
         # Dessiner les pièges (seulement visibles pour le joueur qui les a placés)
-        for trap in self.traps:
+        for trap in visible('traps', x0, y0, x1, y1):
             trap.draw(self.screen, self.cell_width, self.cell_height, self.current_player, self.board_offset_x, self.board_offset_y)
         
         # Dessiner les œufs de spawn
-        for spawn_egg in self.spawn_eggs:
+        for spawn_egg in visible('spawn_eggs', x0, y0, x1, y1):
             spawn_egg.draw(self.screen, self.cell_width, self.cell_height, self.board_offset_x, self.board_offset_y)
         
         # Dessiner les dinosaures
-        for dinosaur in self.dinosaurs:
-            if self.move_animation['active'] and dinosaur == self.move_animation['dinosaur']:
-                # Dessiner le dinosaure à sa position animée
-                anim_x = self.board_offset_x + self.move_animation['current_pos'][0] * self.cell_width
-                anim_y = self.board_offset_y + self.move_animation['current_pos'][1] * self.cell_height
-                if dinosaur.image:
-                    scaled_image = pygame.transform.scale(dinosaur.image, (int(self.cell_width), int(self.cell_height)))
-                    self.screen.blit(scaled_image, (anim_x, anim_y))
-            else:
-                # Dessiner normalement
+        moving = self.move_animation['dinosaur'] if self.move_animation['active'] else None
+        for dinosaur in visible('dinosaurs', x0, y0, x1, y1):
+            if dinosaur is not moving:
                 dinosaur.draw(self.screen, self.cell_width, self.cell_height, self.board_offset_x, self.board_offset_y)
+        
+        if moving is not None:
+            # Dessiner le dinosaure à sa position animée (par-dessus les autres)
+            anim_x = self.board_offset_x + self.move_animation['current_pos'][0] * self.cell_width
+            anim_y = self.board_offset_y + self.move_animation['current_pos'][1] * self.cell_height
+            if moving.image:
+                scaled_image = pygame.transform.scale(moving.image, (int(self.cell_width), int(self.cell_height)))
+                self.screen.blit(scaled_image, (anim_x, anim_y))
     
     def draw_selection(self):
         """Dessine la sélection actuelle"""
@@ -0,0 +1,163 @@
+"""
+Parties sans affichage
+Les vraies règles de Game, sans fenêtre, son, police ni chargement d'images :
+les actions sont résolues immédiatement (tests, simulations, serveur)
+
+Utilisation :
+    python headless.py --games 1000
+    python headless.py --games 200 --map empty --seed 3
+"""
+
+import argparse
+import random
+import time
+
+from ai.base_ai import BaseAI
+from ai.bitboard import Bitboards
+from Entities.rules import SPAWN_COSTS
+from game import Game
+from map_generator import MAP_SIZES
+
+MAPS = ("default", "empty")
+
+
+def new_headless_game(map_name="default", game_mode="2players", seed=None):
+    """
+    Crée une partie sans affichage
+
+    En mode "ai", le joueur 2 (SearchAI) joue directement dans update().
+    """
+    return Game(None, map_name=map_name, game_mode=game_mode, seed=seed)
+
+
+class RandomPlayer(BaseAI):
+    """
+    Joueur aléatoire orienté vers l'attaque, pour faire tourner des parties complètes
+
+    Attaque l'œuf adverse s'il le peut, sinon une autre cible avec la
+    probabilité attack_rate ; sinon spawne (probabilité spawn_rate) ou
+    déplace un dinosaure tiré au hasard, de préférence (advance_rate) vers
+    l'œuf adverse. Seules les options de l'action choisie sont calculées :
+    énumérer toutes les actions légales à chaque tour coûterait plus cher
+    que les règles elles-mêmes.
+    """
+
+    def __init__(self, player, rng=None, attack_rate=0.5, spawn_rate=0.1, advance_rate=0.95):
+        super().__init__(player)
+        self.rng = rng or random.Random()
+        self.attack_rate = attack_rate
+        self.spawn_rate = spawn_rate
+        self.advance_rate = advance_rate
+
+    def choose_action(self, game):
+        player = self.player
+        rng = self.rng
+        boards = Bitboards(game)
+        ready = [d for d in game.dinosaurs
+                 if d.player == player and not d.has_moved and d.immobilized_turns == 0]
+
+        attacks = []
+        for dino in ready:
+            for target, target_type in self.calculate_attack_targets(game, dino, player, boards):
+                if target_type == 'egg':
+                    return self._attack(dino, target, target_type)
+                attacks.append((dino, target, target_type))
+        if attacks and rng.random() < self.attack_rate:
+            return self._attack(*rng.choice(attacks))
+
+        if not ready or rng.random() < self.spawn_rate:
+            action = self._spawn(game, boards) or self._move(game, boards, ready)
+        else:
+            action = self._move(game, boards, ready) or self._spawn(game, boards)
+        return action or {'type': 'pass'}
+
+    @staticmethod
+    def _attack(attacker, target, target_type):
+        return {'type': 'attack', 'attacker': attacker, 'target': target, 'target_type': target_type}
+
+    def _spawn(self, game, boards):
+        """Spawn d'un type abordable sur une case libre au hasard (None si impossible)"""
+        if game.spawn_action_done:
+            return None
+        steaks = game.player1_steaks if self.player == 1 else game.player2_steaks
+        cooldowns = game.spawn_cooldowns[self.player]
+        dino_types = [t for t in (1, 2, 3) if steaks >= SPAWN_COSTS[t] and cooldowns[t] <= 0]
+        if not dino_types:
+            return None
+        positions = self.calculate_spawn_positions(game, self.player, boards)
+        if not positions:
+            return None
+        x, y = self.rng.choice(positions)
+        return {'type': 'spawn', 'x': x, 'y': y, 'dino_type': self.rng.choice(dino_types)}
+
+    def _move(self, game, boards, ready):
+        """Déplacement d'un dinosaure tiré au hasard (None si aucun ne peut bouger)"""
+        rng = self.rng
+        egg = game.eggs[self.enemy_player]
+        rng.shuffle(ready)
+        for dino in ready:
+            moves = self.calculate_possible_moves(game, dino, boards)
+            if not moves:
+                continue
+            if rng.random() < self.advance_rate:
+                distance = abs(dino.x - egg.x) + abs(dino.y - egg.y)
+                advances = [m for m in moves if abs(m[0] - egg.x) + abs(m[1] - egg.y) < distance]
+                moves = advances or moves
+            x, y = rng.choice(moves)
+            return {'type': 'move', 'dinosaur': dino, 'target_x': x, 'target_y': y}
+        return None
+
+
+def play_game(game, players, max_turns=300):
+    """
+    Joue une partie sans affichage jusqu'à la victoire ou max_turns tours
+
+    Une décision = une action puis la fin du tour (Game.execute_ai_action),
+    puis update() fait avancer cooldowns et éclosions d'un tour.
+
+    Args:
+        game (Game): Partie sans affichage
+        players (dict): Joueur -> BaseAI
+        max_turns (int): Tours maximum (partie nulle au-delà)
+
+    Returns:
+        int: Vainqueur (1 ou 2), None si la partie n'est pas terminée
+    """
+    while not game.game_over and game.turn_number <= max_turns:
+        player = game.current_player
+        game.execute_ai_action(players[player].choose_action(game))
+        # Une action refusée ou passée a déjà terminé le tour
+        if game.current_player == player and not game.game_over:
+            game.end_turn()
+        game.update()
+    return game.winner
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parties aléatoires sans affichage (mesure de débit)")
+    parser.add_argument('--games', type=int, default=200)
+    parser.add_argument('--map', choices=list(MAP_SIZES), help="Carte (par défaut, alternance des cartes)")
+    parser.add_argument('--max-turns', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    players = {1: RandomPlayer(1, rng), 2: RandomPlayer(2, rng)}
+    wins = {1: 0, 2: 0, None: 0}
+    turns = actions = 0
+    start = time.perf_counter()
+    for index in range(args.games):
+        map_name = args.map or MAPS[index % len(MAPS)]
+        game = new_headless_game(map_name, seed=args.seed + index)
+        wins[play_game(game, players, args.max_turns)] += 1
+        turns += game.turn_number
+        actions += len(game.action_log)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.games} parties en {elapsed:.2f} s ({args.games / elapsed * 60:.0f} parties/min), "
+          f"{turns / args.games:.0f} tours et {actions / args.games:.0f} actions par partie")
+    print(f"Victoires : joueur 1 {wins[1]}, joueur 2 {wins[2]}, non terminées {wins[None]}")
+
+
+if __name__ == '__main__':
+    main()
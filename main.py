@@ -1,18 +1,33 @@
 #!/usr/bin/env python3
+import argparse
 import sys
 import os
 import pygame
 from game import Game
 from menu import MenuManager
+from snapshot import AUTOSAVE_PATH, Snapshot, SnapshotError
 import traceback
 from logger import get_logger, GameLogger
 
 # Initialiser le logger
 logger = get_logger("main")
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Egg Fortress")
+    parser.add_argument('--resume', nargs='?', const=AUTOSAVE_PATH, metavar='INSTANTANE',
+                        help="Reprendre une partie sauvegardée (défaut: la sauvegarde automatique)")
+    args = parser.parse_args(argv)
+    
     logger.info("Démarrage d'EggFortress")
     
+    # Partie à reprendre au lieu d'afficher le menu
+    resume = None
+    if args.resume:
+        try:
+            resume = Snapshot.load(args.resume)
+        except (OSError, SnapshotError) as e:
+            logger.error(f"Impossible de reprendre la partie {args.resume}: {e}")
+    
     # Nettoyer les anciens logs (>30 jours) - échec silencieux
     try:
         GameLogger().cleanup_old_logs()
@@ -21,11 +36,17 @@ def main():
     
     try: 
         while True:  # Boucle pour permettre de revenir au menu
-            # Créer et lancer le gestionnaire de menu
-            menu_manager = MenuManager()
-            
-            # Lancer le menu
-            result = menu_manager.run()
+            if resume is not None:
+                pygame.init()
+                result = {"action": "start_game", "map": resume.map_name,
+                          "game_mode": resume.game_mode, "snapshot": resume}
+                resume = None
+            else:
+                # Créer et lancer le gestionnaire de menu
+                menu_manager = MenuManager()
+                
+                # Lancer le menu
+                result = menu_manager.run()
             
             if result:
                 # Vérifier si c'est un dictionnaire (avec sélection de map) ou une chaîne
@@ -39,6 +60,9 @@ def main():
                     
                     clock = pygame.time.Clock()
                     game = Game(screen, map_name=selected_map, game_mode=game_mode)
+                    if result.get("snapshot") is not None:
+                        game.restore_snapshot(result["snapshot"])
+                        logger.info(f"Partie reprise au tour {game.turn_number}")
                     
                     # Appliquer les volumes du menu au jeu
                     game.set_volumes(result.get("music_volume", 0.3), result.get("sfx_volume", 1.0))
@@ -49,6 +73,9 @@ def main():
                         for event in pygame.event.get():
                             if event.type == pygame.QUIT:
                                 running = False
+                                game.cancel_ai_thinking()
+                                game.save_action_log()
+                                game.autosave()
                                 pygame.quit()
                                 return  # Quitter complètement
                             else:
@@ -5,9 +5,39 @@ from logger import get_logger
 
 logger = get_logger("map")
 
+# Taille logique (largeur, hauteur) de chaque carte ; les cartes plus grandes
+# que 16x12 sont générées procéduralement (voir MapGenerator.field_map)
+MAP_SIZES = {
+    "default": (16, 12),
+    "empty": (16, 12),
+    "custom": (16, 12),
+    "medium": (32, 24),
+    "large": (64, 48),
+    "huge": (128, 128),
+}
+
+# Rayon dégagé autour des œufs sur les cartes générées (zone de spawn comprise)
+EGG_CLEARING = 4
+
+
+def map_size(map_name):
+    """Taille logique (largeur, hauteur) d'une carte, 16x12 si elle est inconnue"""
+    return MAP_SIZES.get(map_name, MAP_SIZES["default"])
+
+
+def egg_positions(width, height):
+    """Positions des œufs : coins opposés du plateau, à une case des bords"""
+    return {1: (1, 1), 2: (width - 2, height - 2)}
+
+
 class MapGenerator:
-    def __init__(self, width=16, height=12, visual_width=32, visual_height=24, map_name="default"):
-        """Initialise le générateur de map avec des assets terrain - plus de cases plus petites"""
+    def __init__(self, width=16, height=12, visual_width=32, visual_height=24, map_name="default",
+                 load_assets=True):
+        """Initialise le générateur de map avec des assets terrain - plus de cases plus petites
+        
+        load_assets=False ne charge aucune image (génération des grilles seulement,
+        pour les parties sans affichage)
+        """
         self.width = width  # Grille logique avec plus de cases
         self.height = height
         self.visual_width = visual_width  # Grille visuelle avec plus de détails
@@ -15,7 +45,14 @@ class MapGenerator:
         self.map_name = map_name
         
         # Charger les assets de la carte
-        self.terrain_images = self.load_terrain_assets()
+        self.terrain_images = self.load_terrain_assets() if load_assets else {}
+
+    @classmethod
+    def for_map(cls, map_name, load_assets=True):
+        """Générateur à la taille de la carte (une case visuelle par case logique)"""
+        width, height = map_size(map_name)
+        return cls(width=width, height=height, visual_width=width, visual_height=height,
+                   map_name=map_name, load_assets=load_assets)
         
     def load_terrain_assets(self):
         """Charge tous les assets de terrain disponibles"""
@@ -62,6 +99,8 @@ class MapGenerator:
             return self.flat_map()
         elif self.map_name == "custom":
             return self.maze_map()
+        elif self.map_name in MAP_SIZES and self.map_name != "default":
+            return self.field_map()
         else:  # "default"
             return self.default_map()
     
@@ -203,6 +242,48 @@ class MapGenerator:
         
         return grid
     
+    def field_map(self):
+        """
+        Génère une grande carte : bosquets, zones de terre et décorations
+
+        Le tirage dépend seulement du nom de la carte (même carte à chaque
+        partie, pour les journaux et les instantanés). Les abords des œufs
+        restent dégagés ; les bosquets sont petits et clairsemés, ils ne
+        coupent jamais le plateau en deux.
+        """
+        rng = random.Random(self.map_name)
+        width, height = self.visual_width, self.visual_height
+        grid = [['grass'] * width for _ in range(height)]
+        area = width * height
+
+        # Zones de terre (boue) : marches aléatoires
+        for _ in range(area // 120):
+            x, y = rng.randrange(width), rng.randrange(height)
+            for _ in range(rng.randint(6, 20)):
+                grid[y][x] = 'dirt'
+                x = min(width - 1, max(0, x + rng.choice((-1, 0, 1))))
+                y = min(height - 1, max(0, y + rng.choice((-1, 0, 1))))
+
+        # Bosquets de 1 à 4 arbres
+        for _ in range(area // 40):
+            x, y = rng.randrange(width), rng.randrange(height)
+            for _ in range(rng.randint(1, 4)):
+                grid[y][x] = 'tree'
+                x = min(width - 1, max(0, x + rng.choice((-1, 1))))
+
+        # Décorations (sans effet sur les règles)
+        decorations = ('bush', 'flower', 'flower_2', 'flower_3', 'flower_4')
+        for _ in range(area // 30):
+            x, y = rng.randrange(width), rng.randrange(height)
+            if grid[y][x] == 'grass':
+                grid[y][x] = rng.choice(decorations)
+
+        for ex, ey in egg_positions(width, height).values():
+            for y in range(max(0, ey - EGG_CLEARING), min(height, ey + EGG_CLEARING + 1)):
+                for x in range(max(0, ex - EGG_CLEARING), min(width, ex + EGG_CLEARING + 1)):
+                    grid[y][x] = 'grass'
+        return grid
+
     def generate_visual_map(self):
         """Génère une grille visuelle détaillée avec couches séparées"""
         # Créer deux grilles visuelles : base et éléments
@@ -4,10 +4,18 @@ import math
 import random
 import traceback
 from logger import get_logger
+from map_generator import MAP_SIZES
 
 # Logger pour le menu
 logger = get_logger("menu")
 
+# Grandes cartes générées (deuxième rangée de l'écran de sélection) : nom, titre
+LARGE_MAPS = (
+    ("medium", "Vallée"),
+    ("large", "Steppe"),
+    ("huge", "Continent"),
+)
+
 class MenuScreen:
     def __init__(self, screen):
         self.screen = screen
@@ -181,6 +189,13 @@ class MenuScreen:
                     if self.click_sound:
                         self.click_sound.play()
                     self.current_screen = "game_mode"
+                else:
+                    for map_name, button in self.large_map_buttons():
+                        if button.collidepoint(mouse_pos):
+                            if self.click_sound:
+                                self.click_sound.play()
+                            self.selected_map = map_name
+                            return {"action": "start_game", "map": map_name, "game_mode": self.game_mode}
             
             elif self.current_screen in ["settings", "how_to_play"]:
                 if self.buttons["back"].collidepoint(mouse_pos):
@@ -406,9 +421,31 @@ class MenuScreen:
             desc_rect = desc_text.get_rect(center=(empty_map_button.centerx, empty_map_button.y + 100 + i * 28))
             self.screen.blit(desc_text, desc_rect)
         
+        # Grandes cartes (défilement et zoom pendant la partie)
+        titles = dict(LARGE_MAPS)
+        for map_name, button in self.large_map_buttons():
+            hover = button.collidepoint(mouse_pos)
+            pygame.draw.rect(self.screen, (150, 120, 50) if hover else (100, 80, 30), button, border_radius=15)
+            pygame.draw.rect(self.screen, (255, 210, 120), button, 4, border_radius=15)
+            
+            title = map_name_font.render(titles[map_name], True, (255, 255, 255))
+            self.screen.blit(title, title.get_rect(center=(button.centerx, button.y + 30)))
+            width, height = MAP_SIZES[map_name]
+            size_text = desc_font.render(f"{width} x {height} cases", True, (200, 200, 200))
+            self.screen.blit(size_text, size_text.get_rect(center=(button.centerx, button.y + 65)))
+        
         # Bouton retour
         self.draw_button("back", "RETOUR", (100, 100, 100), (150, 150, 150))
     
+    def large_map_buttons(self):
+        """Boutons des grandes cartes, sous les cartes classiques : [(nom, rectangle)]"""
+        map_button_width = 250
+        spacing = 40
+        total_width = map_button_width * 3 + spacing * 2
+        start_x = self.screen_width // 2 - total_width // 2
+        return [(map_name, pygame.Rect(start_x + (map_button_width + spacing) * i, 540, map_button_width, 90))
+                for i, (map_name, _) in enumerate(LARGE_MAPS)]
+    
     def draw_settings(self):
         """Dessine le menu des paramètres"""
         self.draw_background()
@@ -502,6 +539,7 @@ class MenuScreen:
             "• ESPACE: Terminer le tour",
             "• ÉCHAP: Annuler l'action",
             "• R: Redémarrer (fin de partie)",
+            "• Molette / flèches / clic droit glissé: Zoom et défilement",
             "",
             "COMBAT:",
             "• Bouton ATTAQUE: Apparaît près des ennemis",
@@ -0,0 +1,268 @@
+"""
+Instantanés binaires d'une partie
+Format versionné et compact de l'état de règles complet (œufs, dinosaures,
+pièges, œufs de spawn, cooldowns, steaks, tour, joueur au trait, carte), sans
+objet pygame : sauvegarde automatique, positions de test du banc de mesure,
+transmission d'une position à un processus de l'IA
+
+Utilisation :
+    python snapshot.py logs/autosave.snap
+"""
+
+import argparse
+import os
+import struct
+import time
+
+from Entities.rules import DINO_STATS, SPAWN_EGG_HEALTH, SPAWN_EGG_TURNS
+from ai.game_state import DinoState, GameState, SpawnEggState, TrapState
+
+SNAPSHOT_VERSION = 1
+MAGIC = b'EGGF'
+
+# Instantané de reprise, réécrit à chaque fin de tour
+AUTOSAVE_PATH = os.path.join("logs", "autosave.snap")
+
+# Entête : signature, version, longueurs du nom de carte et du mode, taille du
+# plateau, graine (-1 = inconnue), tour, joueur au trait, spawn/piège déjà
+# joué, partie terminée, vainqueur (0 = aucun), steaks des deux joueurs,
+# cooldowns de spawn (joueur 1 types 1..3, joueur 2 types 1..3), nombre
+# d'œufs, de dinosaures, de pièges et d'œufs de spawn
+_HEADER = struct.Struct('<4sBBBHHqHBBBBii6dBHHH')
+# Enregistrements, dans cet ordre après le nom de carte et le mode
+_EGG = struct.Struct('<BHHh')            # joueur, x, y, vie
+_DINO = struct.Struct('<BBHHhBB')        # joueur, type, x, y, vie, a bougé, tours immobilisé
+_TRAP = struct.Struct('<BHH')            # joueur, x, y
+_SPAWN_EGG = struct.Struct('<BBHHhBBd')  # joueur, type, x, y, vie, tours écoulés, éclosion, temps d'animation
+
+_PLAYERS = (1, 2)
+_DINO_TYPES = (1, 2, 3)
+
+
+class SnapshotError(ValueError):
+    """Levée quand un instantané est illisible (signature, version ou taille)"""
+    pass
+
+
+class Snapshot:
+    """
+    État de règles d'une partie, sous forme de tuples
+
+    eggs : (joueur, x, y, vie) ; dinosaurs : (joueur, type, x, y, vie,
+    a bougé, tours immobilisé) ; traps : (joueur, x, y) ;
+    spawn_eggs : (joueur, type, x, y, vie, tours écoulés, éclosion commencée,
+    temps d'animation). Les valeurs dérivées du type (vie maximale, attaque,
+    portée, tours requis) ne sont pas stockées : elles viennent de
+    Entities/rules.py au chargement.
+    """
+
+    __slots__ = ('map_name', 'game_mode', 'seed', 'logic_width', 'logic_height',
+                 'turn_number', 'current_player', 'spawn_action_done', 'game_over', 'winner',
+                 'player1_steaks', 'player2_steaks', 'spawn_cooldowns',
+                 'eggs', 'dinosaurs', 'traps', 'spawn_eggs')
+
+    @classmethod
+    def capture(cls, game):
+        """
+        Instantané d'une partie
+
+        Args:
+            game: Instance du jeu ou GameState (les attributs absents d'un
+                GameState, comme la carte ou game_over, prennent leur valeur
+                par défaut)
+
+        Returns:
+            Snapshot: Copie de l'état, indépendante de game
+        """
+        snapshot = cls.__new__(cls)
+        snapshot.map_name = getattr(game, 'map_name', '')
+        snapshot.game_mode = getattr(game, 'game_mode', '')
+        snapshot.seed = getattr(game, 'seed', None)
+        snapshot.logic_width = game.logic_width
+        snapshot.logic_height = game.logic_height
+        snapshot.turn_number = game.turn_number
+        snapshot.current_player = game.current_player
+        snapshot.spawn_action_done = getattr(game, 'spawn_action_done', False)
+        snapshot.game_over = getattr(game, 'game_over', False)
+        snapshot.winner = getattr(game, 'winner', None)
+        snapshot.player1_steaks = game.player1_steaks
+        snapshot.player2_steaks = game.player2_steaks
+        cooldowns = getattr(game, 'spawn_cooldowns', None) or {}
+        snapshot.spawn_cooldowns = {p: {t: cooldowns.get(p, {}).get(t, 0) for t in _DINO_TYPES}
+                                    for p in _PLAYERS}
+        snapshot.eggs = [(e.player, e.x, e.y, e.health) for e in game.eggs.values()]
+        snapshot.dinosaurs = [(d.player, d.dino_type, d.x, d.y, d.health, d.has_moved,
+                               d.immobilized_turns) for d in game.dinosaurs]
+        # Un piège activé est aussitôt retiré du plateau : seuls les pièges armés restent
+        snapshot.traps = [(t.player, t.x, t.y) for t in game.traps]
+        snapshot.spawn_eggs = [(s.player, s.dino_type, s.x, s.y, s.health, s.spawn_turns_elapsed,
+                                getattr(s, 'is_hatching', False),
+                                getattr(s, 'hatch_animation_time', 0.0))
+                               for s in game.spawn_eggs]
+        return snapshot
+
+    def to_bytes(self):
+        """
+        Sérialise l'instantané (un seul tampon, écrit en un passage)
+
+        Returns:
+            bytes: Instantané binaire
+        """
+        map_name = self.map_name.encode('utf-8')
+        game_mode = self.game_mode.encode('utf-8')
+        sections = ((_EGG, self.eggs), (_DINO, self.dinosaurs), (_TRAP, self.traps),
+                    (_SPAWN_EGG, self.spawn_eggs))
+        size = _HEADER.size + len(map_name) + len(game_mode)
+        for record, entries in sections:
+            size += record.size * len(entries)
+
+        buffer = bytearray(size)
+        cooldowns = self.spawn_cooldowns
+        _HEADER.pack_into(
+            buffer, 0, MAGIC, SNAPSHOT_VERSION, len(map_name), len(game_mode),
+            self.logic_width, self.logic_height, -1 if self.seed is None else self.seed,
+            self.turn_number, self.current_player, self.spawn_action_done, self.game_over,
+            self.winner or 0, self.player1_steaks, self.player2_steaks,
+            *(cooldowns[p][t] for p in _PLAYERS for t in _DINO_TYPES),
+            len(self.eggs), len(self.dinosaurs), len(self.traps), len(self.spawn_eggs))
+        offset = _HEADER.size
+        buffer[offset:offset + len(map_name)] = map_name
+        offset += len(map_name)
+        buffer[offset:offset + len(game_mode)] = game_mode
+        offset += len(game_mode)
+        for record, entries in sections:
+            pack_into = record.pack_into
+            for entry in entries:
+                pack_into(buffer, offset, *entry)
+                offset += record.size
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Désérialise un instantané (un seul passage sur le tampon)
+
+        Raises:
+            SnapshotError: Signature, version ou taille incorrecte
+        """
+        view = memoryview(data)
+        if len(view) < _HEADER.size or bytes(view[:4]) != MAGIC:
+            raise SnapshotError("Ce n'est pas un instantané de partie")
+        (_, version, map_len, mode_len, width, height, seed, turn_number, current_player,
+         spawn_action_done, game_over, winner, steaks1, steaks2,
+         c11, c12, c13, c21, c22, c23,
+         n_eggs, n_dinos, n_traps, n_spawn_eggs) = _HEADER.unpack_from(view)
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f"Version d'instantané non supportée: {version}")
+        expected = (_HEADER.size + map_len + mode_len + n_eggs * _EGG.size + n_dinos * _DINO.size
+                    + n_traps * _TRAP.size + n_spawn_eggs * _SPAWN_EGG.size)
+        if len(view) != expected:
+            raise SnapshotError(f"Taille d'instantané incorrecte: {len(view)} octets "
+                                f"({expected} attendus)")
+
+        snapshot = cls.__new__(cls)
+        offset = _HEADER.size
+        snapshot.map_name = str(view[offset:offset + map_len], 'utf-8')
+        offset += map_len
+        snapshot.game_mode = str(view[offset:offset + mode_len], 'utf-8')
+        offset += mode_len
+        snapshot.seed = None if seed < 0 else seed
+        snapshot.logic_width = width
+        snapshot.logic_height = height
+        snapshot.turn_number = turn_number
+        snapshot.current_player = current_player
+        snapshot.spawn_action_done = bool(spawn_action_done)
+        snapshot.game_over = bool(game_over)
+        snapshot.winner = winner or None
+        snapshot.player1_steaks = steaks1
+        snapshot.player2_steaks = steaks2
+        snapshot.spawn_cooldowns = {1: {1: c11, 2: c12, 3: c13}, 2: {1: c21, 2: c22, 3: c23}}
+
+        sections = []
+        for record, count in ((_EGG, n_eggs), (_DINO, n_dinos), (_TRAP, n_traps),
+                              (_SPAWN_EGG, n_spawn_eggs)):
+            end = offset + record.size * count
+            sections.append(list(record.iter_unpack(view[offset:end])))
+            offset = end
+        snapshot.eggs, snapshot.dinosaurs, snapshot.traps, snapshot.spawn_eggs = sections
+        return snapshot
+
+    def save(self, path=AUTOSAVE_PATH):
+        """
+        Écrit l'instantané dans un fichier (remplacé de façon atomique)
+
+        Returns:
+            str: Chemin du fichier écrit
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(self.to_bytes())
+        os.replace(temporary, path)
+        return path
+
+    @classmethod
+    def load(cls, path=AUTOSAVE_PATH):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    def to_state(self, grid=None, terrain=None):
+        """
+        État simulé de l'IA correspondant à l'instantané
+
+        Args:
+            grid (list): Grille logique de la carte (optionnelle)
+            terrain (TerrainMap): Terrain compilé (None = ni arbres ni boue)
+
+        Returns:
+            GameState: Nouvel état
+        """
+        state = GameState.new_game(self.logic_width, self.logic_height, grid or [],
+                                   {player: (x, y) for player, x, y, _ in self.eggs}, terrain)
+        for player, _, _, health in self.eggs:
+            state.eggs[player].health = health
+        state.spawn_cooldowns = {p: dict(c) for p, c in self.spawn_cooldowns.items()}
+        state.dinosaurs = []
+        for player, dino_type, x, y, health, has_moved, immobilized_turns in self.dinosaurs:
+            max_health, attack_power, movement_range = DINO_STATS[dino_type]
+            state.dinosaurs.append(DinoState(x, y, player, dino_type, health, max_health,
+                                             attack_power, movement_range, bool(has_moved),
+                                             immobilized_turns))
+        state.traps = [TrapState(x, y, player) for player, x, y in self.traps]
+        state.spawn_eggs = [SpawnEggState(x, y, player, dino_type, health,
+                                          SPAWN_EGG_HEALTH[dino_type],
+                                          SPAWN_EGG_TURNS[dino_type], elapsed)
+                            for player, dino_type, x, y, health, elapsed, _, _ in self.spawn_eggs]
+        state.player1_steaks = self.player1_steaks
+        state.player2_steaks = self.player2_steaks
+        state.current_player = self.current_player
+        state.turn_number = self.turn_number
+        state.spawn_action_done = self.spawn_action_done
+        return state
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Affiche le contenu d'un instantané de partie")
+    parser.add_argument('path', nargs='?', default=AUTOSAVE_PATH, help="Instantané (.snap)")
+    args = parser.parse_args(argv)
+
+    with open(args.path, 'rb') as f:
+        data = f.read()
+    start = time.perf_counter()
+    snapshot = Snapshot.from_bytes(data)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"{args.path}: {len(data)} octets, lu en {elapsed_ms:.3f} ms")
+    print(f"Carte {snapshot.map_name!r} ({snapshot.logic_width}x{snapshot.logic_height}), "
+          f"mode {snapshot.game_mode!r}, tour {snapshot.turn_number}, "
+          f"joueur {snapshot.current_player} au trait"
+          + (f", victoire du joueur {snapshot.winner}" if snapshot.game_over else ""))
+    print(f"Steaks {snapshot.player1_steaks} / {snapshot.player2_steaks}, "
+          f"œufs {[(p, health) for p, _, _, health in snapshot.eggs]}")
+    print(f"{len(snapshot.dinosaurs)} dinosaures, {len(snapshot.traps)} pièges, "
+          f"{len(snapshot.spawn_eggs)} œufs de spawn")
+
+
+if __name__ == '__main__':
+    main()
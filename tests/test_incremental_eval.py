@@ -0,0 +1,120 @@
+"""
+Test différentiel de IncrementalEvaluator contre evaluate_state
+Marches aléatoires apply_action / simulate_end_turn / undo_action : à chaque
+pas, le score incrémental doit être exactement celui de l'évaluation complète,
+pour les deux joueurs
+"""
+
+import random
+
+import pytest
+
+from ai.game_simulator import GameSimulator
+from ai.game_state import DinoState
+from ai.heuristics import IncrementalEvaluator, evaluate_state
+from headless import RandomPlayer, new_headless_game, play_game
+
+MAPS = ("default", "empty", "medium")
+
+
+def midgame_state(map_name, seed, turns=12):
+    """Position de milieu de partie (quelques tours de RandomPlayer)"""
+    rng = random.Random(seed)
+    game = new_headless_game(map_name, seed=seed)
+    play_game(game, {1: RandomPlayer(1, rng, spawn_rate=0.5), 2: RandomPlayer(2, rng, spawn_rate=0.5)},
+              max_turns=turns)
+    return GameSimulator.copy_game_state(game)
+
+
+def crowd(state, rng, count=12):
+    """
+    Ajoute count dinosaures blessés au centre du plateau : les parties
+    aléatoires se croisent peu, il faut des attaques et des morts
+    """
+    occupied = {(d.x, d.y) for d in state.dinosaurs}
+    occupied |= {(e.x, e.y) for e in state.eggs.values()}
+    occupied |= {(e.x, e.y) for e in state.spawn_eggs}
+    cx, cy = state.logic_width // 2, state.logic_height // 2
+    for _ in range(count):
+        x, y = cx + rng.randrange(-4, 4), cy + rng.randrange(-3, 3)
+        if (x, y) in occupied or (state.terrain is not None and state.terrain.is_blocked(x, y)):
+            continue
+        occupied.add((x, y))
+        dino = DinoState.new(x, y, rng.randint(1, 2), rng.randint(1, 3))
+        dino.health = rng.randint(1, dino.max_health)
+        state.dinosaurs.append(dino)
+
+
+# Poids réglés (valeurs non multiples de 0.5), comme ceux écrits par ai/tuner.py
+TUNED_WEIGHTS = {
+    'egg_health': 9.37, 'dino': 51.3, 'dino_health': 2.11, 'steaks': 0.47,
+    'attack_distance': 3.29, 'defense_distance': 1.83, 'tank_bonus': 27.6,
+}
+
+
+def assert_scores(state, evaluators, weights=None):
+    for player, evaluator in evaluators.items():
+        expected = evaluate_state(state, player, weights)
+        if weights is None:
+            # Poids par défaut : tous les termes sont des multiples de 0.5, égalité exacte
+            assert evaluator.score(state) == expected
+        else:
+            assert evaluator.score(state) == pytest.approx(expected, rel=1e-9, abs=1e-6)
+
+
+def random_walks(map_name, weights=None, walks=6, steps=40):
+    """
+    Marches apply_action / simulate_end_turn / undo_action depuis des
+    positions de milieu de partie ; vérifie le score à chaque pas
+
+    Returns:
+        int: Nombre de pas vérifiés (hors annulation finale)
+    """
+    rng = random.Random(map_name)
+    generators = {p: RandomPlayer(p) for p in (1, 2)}
+    checked = 0
+    for seed in range(walks):
+        state = midgame_state(map_name, seed)
+        crowd(state, rng)
+        evaluators = {p: IncrementalEvaluator(state, p, weights) for p in (1, 2)}
+        assert_scores(state, evaluators, weights)
+        stack = []
+        for _ in range(steps):
+            if stack and rng.random() < 0.3:
+                for evaluator in evaluators.values():
+                    evaluator.pop()
+                GameSimulator.undo_action(state, stack.pop())
+            elif rng.random() < 0.2:
+                stack.append(GameSimulator.simulate_end_turn(state))
+                for evaluator in evaluators.values():
+                    evaluator.push(stack[-1])
+            else:
+                actions = generators[state.current_player].generate_actions(state, state.current_player)
+                # Les attaques changent le plus de termes : les favoriser
+                attacks = [a for a in actions if a['type'] == 'attack']
+                if attacks and rng.random() < 0.5:
+                    actions = attacks
+                stack.append(GameSimulator.apply_action(state, rng.choice(actions)))
+                for evaluator in evaluators.values():
+                    evaluator.push(stack[-1])
+            assert_scores(state, evaluators, weights)
+            checked += 1
+
+        # Tout annuler ramène au score de départ
+        while stack:
+            for evaluator in evaluators.values():
+                evaluator.pop()
+            GameSimulator.undo_action(state, stack.pop())
+            assert_scores(state, evaluators, weights)
+    return checked
+
+
+@pytest.mark.parametrize("map_name", MAPS)
+def test_incremental_matches_full_evaluation(map_name):
+    assert random_walks(map_name) == 6 * 40
+
+
+@pytest.mark.parametrize("map_name", ("medium", "large"))
+def test_incremental_matches_with_tuned_weights(map_name):
+    """Poids réglés et distance_scale != 1 : égalité aux arrondis près"""
+    assert random_walks(map_name, TUNED_WEIGHTS) == 6 * 40
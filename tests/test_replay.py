@@ -0,0 +1,51 @@
+"""
+Test du rejeu (action_log.py) : une partie sans affichage, enregistrée puis
+rejouée depuis son journal, repasse par les mêmes états (game_fingerprint)
+"""
+
+import random
+
+import pytest
+
+from action_log import ActionLog, Replayer, game_fingerprint, new_replay_game
+from headless import RandomPlayer, new_headless_game
+
+MAPS = ("default", "empty", "medium")
+
+
+def recorded_game(map_name, seed, turns=120):
+    """
+    Joue une partie aléatoire et note (nombre d'actions du journal, empreinte)
+    après chaque action, avant Game.update
+
+    Les cooldowns s'écoulent dans Game.update : le journal ne les restaure
+    qu'au moment de chaque action, les empreintes sont donc prises juste après.
+    """
+    rng = random.Random(seed)
+    game = new_headless_game(map_name, seed=seed)
+    game.autosave_replay = False
+    game.autosave_snapshot = False
+    players = {1: RandomPlayer(1, rng, spawn_rate=0.3), 2: RandomPlayer(2, rng, spawn_rate=0.3)}
+    checkpoints = []
+    for _ in range(turns):
+        if game.game_over:
+            break
+        player = game.current_player
+        game.execute_ai_action(players[player].choose_action(game))
+        if game.current_player == player and not game.game_over:
+            game.end_turn()
+        checkpoints.append((len(game.action_log), game_fingerprint(game)))
+        game.update()
+    return game, checkpoints
+
+
+@pytest.mark.parametrize("map_name", MAPS)
+def test_replay_matches_recorded_game(map_name):
+    for seed in range(3):
+        game, checkpoints = recorded_game(map_name, seed)
+        # Aller-retour JSON, comme un journal enregistré dans logs/replays/
+        log = ActionLog.from_dict(game.action_log.to_dict())
+        replayer = Replayer(log, new_replay_game(log))
+        for position, fingerprint in checkpoints:
+            replayer.run(until=position)
+            assert game_fingerprint(replayer.game) == fingerprint, (seed, position)
@@ -0,0 +1,149 @@
+"""
+Test différentiel de GameSimulator.simulate_end_turn contre les règles de Game
+Sur des parties sans affichage, chaque fin de tour réelle (Game.end_turn puis
+Game.update) est comparée à la simulation de la même position : steaks,
+progression et éclosion des œufs de spawn, has_moved, immobilisation, cooldowns.
+Chaque spawn réel (Game.spawn_dinosaur) est comparé de même à
+GameSimulator.apply_action
+"""
+
+import random
+
+import pytest
+
+from ai.game_simulator import GameSimulator
+from ai.zobrist import ZobristHasher
+from headless import RandomPlayer, new_headless_game
+
+MAPS = ("default", "empty", "medium")
+
+
+def rules_view(state):
+    """Tout ce que la fin de tour modifie, sauf les cooldowns (flottants)"""
+    return (
+        state.player1_steaks, state.player2_steaks, state.current_player, state.turn_number,
+        bool(state.spawn_action_done),
+        sorted((d.x, d.y, d.player, d.dino_type, d.health, d.max_health, d.attack_power,
+                d.movement_range, d.has_moved, d.immobilized_turns) for d in state.dinosaurs),
+        sorted((e.x, e.y, e.player, e.dino_type, e.health, e.spawn_turns_elapsed)
+               for e in state.spawn_eggs),
+    )
+
+
+def cooldowns_view(state):
+    return {(p, t): c for p, per_type in state.spawn_cooldowns.items() for t, c in per_type.items()}
+
+
+def assert_same_rules(state, real):
+    assert rules_view(state) == rules_view(real)
+    simulated, expected = cooldowns_view(state), cooldowns_view(real)
+    assert simulated.keys() == expected.keys()
+    for key, value in expected.items():
+        assert simulated[key] == pytest.approx(value)
+
+
+def end_turns(map_name, seed, turns):
+    """
+    Joue une partie aléatoire et, pour chaque fin de tour, donne
+    (position juste avant Game.end_turn, position après Game.update)
+
+    Avant chaque fin de tour, des dinosaures des deux joueurs sont marqués
+    immobilisés ou déjà joués au hasard (RandomPlayer ne pose pas de pièges).
+    """
+    rng = random.Random(seed)
+    game = new_headless_game(map_name, seed=seed)
+    players = {1: RandomPlayer(1, rng, spawn_rate=0.5), 2: RandomPlayer(2, rng, spawn_rate=0.5)}
+    before = []
+    real_end_turn = game.end_turn
+
+    def end_turn():
+        for dino in game.dinosaurs:
+            if rng.random() < 0.3:
+                dino.immobilized_turns = rng.randint(1, 2)
+            if rng.random() < 0.3:
+                dino.has_moved = True
+        before.append(GameSimulator.copy_game_state(game))
+        real_end_turn()
+
+    game.end_turn = end_turn
+    for _ in range(turns):
+        if game.game_over:
+            break
+        player = game.current_player
+        game.execute_ai_action(players[player].choose_action(game))
+        if game.current_player == player and not game.game_over:
+            game.end_turn()
+        game.update()
+        if not before:
+            break  # Œuf détruit : partie finie sans fin de tour
+        assert len(before) == 1
+        yield before.pop(), GameSimulator.copy_game_state(game)
+
+
+@pytest.mark.parametrize("map_name", MAPS)
+def test_simulated_end_turn_matches_game(map_name):
+    seen = {'hatch': 0, 'egg_progress': 0, 'immobilized': 0, 'has_moved': 0, 'cooldowns': 0,
+            'cooldown_ready': 0}
+    hasher = ZobristHasher()
+    for seed in range(4):
+        for state, real in end_turns(map_name, seed, turns=60):
+            before = rules_view(state)
+            player = state.current_player
+            seen['hatch'] += len(state.spawn_eggs) > len(real.spawn_eggs)
+            seen['egg_progress'] += bool(real.spawn_eggs)
+            seen['immobilized'] += any(d.immobilized_turns and d.player != player for d in state.dinosaurs)
+            seen['has_moved'] += any(d.has_moved and d.player == player for d in state.dinosaurs)
+            seen['cooldowns'] += any(cooldowns_view(state).values())
+            seen['cooldown_ready'] += any(0 < c <= GameSimulator.SIMULATED_TURN_SECONDS
+                                          for c in cooldowns_view(state).values())
+            h = hasher.hash_state(state)
+            side_swap = (hasher.key(ZobristHasher.side_feature(player))
+                         ^ hasher.key(ZobristHasher.side_feature(3 - player)))
+
+            undo = GameSimulator.simulate_end_turn(state)
+            assert_same_rules(state, real)
+            assert hasher.update(h, state, undo) ^ side_swap == hasher.hash_state(state)
+
+            GameSimulator.undo_action(state, undo)
+            assert rules_view(state) == before
+
+    # Chaque règle de fin de tour a bien été exercée
+    assert all(seen.values()), seen
+
+
+@pytest.mark.parametrize("map_name", MAPS)
+def test_simulated_spawn_matches_game(map_name):
+    """Un spawn crée un œuf de spawn, comme dans le jeu, haché et annulable"""
+    hasher = ZobristHasher()
+    spawns = 0
+    for seed in range(4):
+        rng = random.Random(seed)
+        game = new_headless_game(map_name, seed=seed)
+        players = {1: RandomPlayer(1, rng, spawn_rate=0.5), 2: RandomPlayer(2, rng, spawn_rate=0.5)}
+        for _ in range(60):
+            if game.game_over:
+                break
+            player = game.current_player
+            action = players[player].choose_action(game)
+            if action['type'] == 'spawn':
+                state = GameSimulator.copy_game_state(game)
+                before, h = rules_view(state), hasher.hash_state(state)
+                # Game.execute_ai_action enchaîne la fin de tour : spawner directement
+                assert game.spawn_dinosaur(action['x'], action['y'], action['dino_type'])
+                real = GameSimulator.copy_game_state(game)
+
+                undo = GameSimulator.apply_action(state, action)
+                assert len(state.spawn_eggs) == len(real.spawn_eggs)
+                assert not any(d.x == action['x'] and d.y == action['y'] for d in state.dinosaurs)
+                assert_same_rules(state, real)
+                assert hasher.update(h, state, undo) == hasher.hash_state(state)
+
+                GameSimulator.undo_action(state, undo)
+                assert rules_view(state) == before
+                spawns += 1
+            else:
+                game.execute_ai_action(action)
+            if game.current_player == player and not game.game_over:
+                game.end_turn()
+            game.update()
+    assert spawns
@@ -488,6 +488,25 @@ class UI:
             remaining = max(0, (game.auto_end_turn_time - pygame.time.get_ticks()) / 1000.0)
             if remaining > 0:
                 self._draw_auto_end_message(remaining, screen_width)
+        
+        # Indicateur de réflexion de l'IA (calcul en arrière-plan)
+        if getattr(game, 'ai_thinking', False):
+            self._draw_ai_thinking_message(screen_width)
+    
+    def _draw_ai_thinking_message(self, screen_width):
+        """Message affiché pendant que l'IA réfléchit"""
+        dots = "." * (1 + (pygame.time.get_ticks() // 400) % 3)
+        msg_text = self.medium_font.render(f"L'IA réfléchit{dots}", True, (255, 180, 120))
+        # Largeur fixe (3 points) pour que le cadre ne bouge pas avec l'animation
+        full_width, _ = self.medium_font.size("L'IA réfléchit...")
+        msg_rect = msg_text.get_rect(midleft=(screen_width//2 - full_width//2, 40))
+        
+        # Fond avec bordure
+        bg_rect = pygame.Rect(msg_rect.x, msg_rect.y, full_width, msg_rect.height).inflate(30, 15)
+        pygame.draw.rect(self.screen, (40, 40, 50, 220), bg_rect, border_radius=8)
+        pygame.draw.rect(self.screen, (255, 120, 80), bg_rect, 3, border_radius=8)
+        
+        self.screen.blit(msg_text, msg_rect)
     
     def _draw_auto_end_message(self, remaining, screen_width):
         """Message de fin de tour automatique"""